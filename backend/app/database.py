@@ -18,9 +18,27 @@ class DB:
 
 db = DB()
 
+
+# Collection accessors used by the service layer
+def get_customers_collection():
+    return database.customers
+
+def get_projects_collection():
+    return database.projects
+
+def get_conversions_collection():
+    return database.conversions
+
+def get_logs_collection():
+    return database.logs
+
 async def connect_to_mongodb():
     try:
         await client.admin.command('ping')
+        # Backs CustomerService.list_all: active filter + sort by name as an index scan
+        await database.customers.create_index(
+            [("isActive", 1), ("customerName", 1)], name="active_name_idx"
+        )
         print("✅ MongoDB connected")
         return True
     except Exception as e:
@@ -1,12 +1,27 @@
 """Main FastAPI application"""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+from app.database import connect_to_mongodb, disconnect_from_mongodb
+from app.services.boomi_service import aclose as close_boomi_client
+from app.services.customer_service import aclose as close_customer_client
 from app.routers import customers, projects, conversions, integrations, logs, ai, mappings
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup also ensures the indexes the services rely on
+    await connect_to_mongodb()
+    yield
+    # Flush pending activity logs and close the pooled HTTP clients
+    await close_boomi_client()
+    await close_customer_client()
+    await disconnect_from_mongodb()
+
 app = FastAPI(
     title="webMethods to Boomi Migration Accelerator",
     description="Enterprise migration automation platform",
-    version="3.0.0"
+    version="3.0.0",
+    lifespan=lifespan
 )
 
 # CORS
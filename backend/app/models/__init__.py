@@ -8,6 +8,7 @@ from app.models.customer import (
     CustomerListResponse,
     CustomerSettings,
     BoomiSettings,
+    BoomiDeploymentSettings,
     LLMSettings,
     ConnectionTestResult,
 )
@@ -79,6 +80,7 @@ __all__ = [
     "CustomerListResponse",
     "CustomerSettings",
     "BoomiSettings",
+    "BoomiDeploymentSettings",
     "LLMSettings",
     "ConnectionTestResult",
     # Project
@@ -22,11 +22,15 @@ Supports ALL major X12 transaction sets:
 - And more...
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Sequence, Iterable
 from enum import Enum
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 import re
+import time
 
 
 class EDIStandard(Enum):
@@ -47,13 +51,13 @@ class EDIDataType(Enum):
     B = "B"        # Binary
 
 
-@dataclass
+@dataclass(frozen=True)
 class EDICodeList:
     """Qualifier/Code List reference"""
     code_list_id: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class EDIDataFormat:
     """Data format specification"""
     format_type: str  # "character", "date", "number"
@@ -131,6 +135,583 @@ DEFAULT_BRANCH_ID = "QjoyOTQwMQ"
 DEFAULT_BRANCH_NAME = "main"
 
 
+# Data type code -> EDIDataType (avoids building a __members__ proxy per element)
+_EDI_DATA_TYPES: Dict[str, EDIDataType] = dict(EDIDataType.__members__)
+
+# XML boolean literals indexed by a bool
+_BOOL_STR = ('false', 'true')
+
+# Segment position strings '0100', '0200', ... for the common case
+_POSITIONS = tuple(f'{(i + 1) * 100:04d}' for i in range(64))
+
+# Segments that must appear / may appear only once in a transaction set
+MANDATORY_SEGMENTS = frozenset(['ST', 'SE', 'BEG', 'BAK', 'BSN', 'BIG', 'BPR', 'AK1', 'AK9'])
+SINGLE_USE_SEGMENTS = frozenset(['ST', 'SE', 'BEG', 'BAK', 'BSN', 'BIG', 'BPR'])
+
+# Static shell of the profile document. The deployment defaults are baked in
+# at import; only per-profile values are left as {{...}} str.format placeholders.
+_PROFILE_HEAD_TEMPLATE = f'''<?xml version="1.0" encoding="UTF-8"?><bns:Component xmlns:bns="http://api.platform.boomi.com/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" branchId="{DEFAULT_BRANCH_ID}" branchName="{DEFAULT_BRANCH_NAME}" createdBy="{DEFAULT_CREATED_BY}" createdDate="{{now}}" currentVersion="true" deleted="false" folderFullPath="{DEFAULT_FOLDER_FULL_PATH}" folderId="{DEFAULT_FOLDER_ID}" folderName="{DEFAULT_FOLDER_NAME}" modifiedBy="{DEFAULT_MODIFIED_BY}" modifiedDate="{{now}}" name="{{name}}" type="profile.edi" version="1">
+  <bns:encryptedValues/>
+  <bns:description>Converted from webMethods EDI Document Type</bns:description>
+  <bns:object>
+    <EdiProfile strict="{{strict}}">
+      <ProfileProperties>
+        <EdiGeneralInfo conditionalValidationEnabled="{{conditional_validation}}" standard="{{standard}}"/>
+        <EdiFileOptions fileType="{{file_type}}">
+          <EdiDelimitedOptions fileDelimiter="{{file_delimiter}}" segmentchar="{{segment_char}}"/>
+          <EdiDataOptions/>
+        </EdiFileOptions>
+        <EdiOptions>
+          <EdiX12Options isacontrolstandard="{{isa_control_standard}}" isacontrolversion="{{isa_control_version}}" stdversion="{{version}}" tranfuncid="{{transaction_func_id}}" transmission="{{transaction_set}}"/>
+        </EdiOptions>
+      </ProfileProperties>
+      <DataElements>
+'''
+
+_PROFILE_TAIL = '''
+      </DataElements>
+      <tagLists/>
+    </EdiProfile>
+  </bns:object>
+</bns:Component>'''
+
+
+@lru_cache(maxsize=None)
+def _data_format_for(dtype: str, date_format: Optional[str] = None) -> EDIDataFormat:
+    """
+    Shared DataFormat for an element type.
+    
+    DataFormats are never mutated after creation, so every element of the
+    same type/format can reference one instance.
+    """
+    if dtype == 'DT':
+        return EDIDataFormat(format_type='date', date_format=date_format or 'yyyyMMdd')
+    elif dtype == 'TM':
+        return EDIDataFormat(format_type='date', date_format=date_format or 'HHmm')
+    elif dtype in ('R', 'N', 'N0', 'N2'):
+        return EDIDataFormat(
+            format_type='number',
+            number_format='#.#' if dtype == 'R' else '#',
+            signed_field=False
+        )
+    return EDIDataFormat(format_type='character')
+
+
+@lru_cache(maxsize=None)
+def _code_list_for(code_list_id: str) -> EDICodeList:
+    """Shared qualifier/code list reference"""
+    return EDICodeList(code_list_id=code_list_id)
+
+
+# X12 transaction set configurations
+_TRANSACTION_SETS = {
+    # Purchase Order
+    '850': {
+        'name': 'Purchase Order',
+        'func_id': 'PO',
+        'header_segments': ['ST', 'BEG', 'CUR', 'REF', 'PER', 'TAX', 'FOB', 'CTP', 'PAM', 'CSH', 'TC2', 'SAC', 'ITD', 'DIS', 'INC', 'DTM', 'LIN', 'SI', 'PID', 'MEA', 'PWK', 'PKG', 'TD1', 'TD5', 'TD3', 'TD4', 'MAN', 'PCT', 'CTB', 'TXI'],
+        'n1_loop': True,
+        'detail_segments': ['PO1', 'LIN', 'SI', 'CUR', 'CN1', 'PO3', 'CTP', 'PAM', 'MEA', 'PID', 'PWK', 'PO4', 'REF', 'PER', 'SAC', 'IT8', 'CSH', 'ITD', 'DIS', 'INC', 'TAX', 'FOB', 'SDQ', 'IT3', 'DTM', 'TC2', 'TD1', 'TD5', 'TD3', 'TD4', 'PCT', 'MAN', 'MTX', 'SPI', 'TXI', 'CTB'],
+        'summary_segments': ['CTT', 'AMT', 'SE']
+    },
+    # PO Acknowledgment
+    '855': {
+        'name': 'Purchase Order Acknowledgment',
+        'func_id': 'PR',
+        'header_segments': ['ST', 'BAK', 'CUR', 'REF', 'PER', 'TAX', 'FOB', 'CTP', 'PAM', 'CSH', 'SAC', 'ITD', 'DTM', 'PID', 'MEA', 'PWK', 'PKG', 'TD1', 'TD5', 'TD3', 'TD4', 'MAN', 'TXI'],
+        'n1_loop': True,
+        'detail_segments': ['PO1', 'LIN', 'SI', 'CUR', 'PO3', 'CTP', 'PAM', 'MEA', 'PID', 'PWK', 'PO4', 'REF', 'PER', 'SAC', 'ITD', 'TAX', 'FOB', 'SDQ', 'DTM', 'TD1', 'TD5', 'TD3', 'TD4', 'MAN', 'TXI', 'ACK'],
+        'summary_segments': ['CTT', 'SE']
+    },
+    # Ship Notice/Manifest (ASN)
+    '856': {
+        'name': 'Ship Notice/Manifest',
+        'func_id': 'SH',
+        'header_segments': ['ST', 'BSN', 'DTM', 'HL', 'MEA', 'PWK', 'TD1', 'TD5', 'TD3', 'TD4', 'REF', 'PER', 'FOB', 'PID', 'MAN'],
+        'n1_loop': True,
+        'detail_segments': ['HL', 'LIN', 'SN1', 'PO4', 'PID', 'MEA', 'PWK', 'PKG', 'TD1', 'TD5', 'TD3', 'TD4', 'REF', 'PER', 'MAN'],
+        'summary_segments': ['CTT', 'SE']
+    },
+    # Invoice
+    '810': {
+        'name': 'Invoice',
+        'func_id': 'IN',
+        'header_segments': ['ST', 'BIG', 'NTE', 'CUR', 'REF', 'YNQ', 'PER', 'DTM', 'FOB', 'PID', 'MEA', 'PWK', 'ITD', 'DTM', 'TD1', 'TD5', 'TD3', 'TD4'],
+        'n1_loop': True,
+        'detail_segments': ['IT1', 'CRC', 'QTY', 'CUR', 'IT3', 'TXI', 'CTP', 'PAM', 'MEA', 'PID', 'PWK', 'PKG', 'PO4', 'ITD', 'REF', 'YNQ', 'PER', 'SDQ', 'DTM', 'CAD', 'L7', 'SR', 'SAC', 'SL1', 'TC2', 'TXI'],
+        'summary_segments': ['TDS', 'TXI', 'CAD', 'AMT', 'SAC', 'ISS', 'CTT', 'SE']
+    },
+    # Payment Order/Remittance Advice
+    '820': {
+        'name': 'Payment Order/Remittance Advice',
+        'func_id': 'RA',
+        'header_segments': ['ST', 'BPR', 'NTE', 'TRN', 'CUR', 'REF', 'DTM', 'PER'],
+        'n1_loop': True,
+        'detail_segments': ['ENT', 'RMR', 'NTE', 'REF', 'DTM', 'ADX', 'RMT'],
+        'summary_segments': ['SE']
+    },
+    # Functional Acknowledgment
+    '997': {
+        'name': 'Functional Acknowledgment',
+        'func_id': 'FA',
+        'header_segments': ['ST', 'AK1'],
+        'n1_loop': False,
+        'detail_segments': ['AK2', 'AK3', 'AK4', 'AK5'],
+        'summary_segments': ['AK9', 'SE']
+    },
+    # Implementation Acknowledgment
+    '999': {
+        'name': 'Implementation Acknowledgment',
+        'func_id': 'FA',
+        'header_segments': ['ST', 'AK1'],
+        'n1_loop': False,
+        'detail_segments': ['AK2', 'IK3', 'IK4', 'IK5'],
+        'summary_segments': ['AK9', 'SE']
+    },
+    # Motor Carrier Load Tender
+    '204': {
+        'name': 'Motor Carrier Load Tender',
+        'func_id': 'SM',
+        'header_segments': ['ST', 'B2', 'B2A', 'L11', 'G62', 'MS3', 'AT5', 'PLD', 'NTE'],
+        'n1_loop': True,
+        'detail_segments': ['S5', 'L11', 'G62', 'AT8', 'LAD', 'NTE', 'OID', 'L5', 'L0', 'L1', 'L4', 'L7'],
+        'summary_segments': ['L3', 'SE']
+    },
+    # Shipment Status
+    '214': {
+        'name': 'Transportation Carrier Shipment Status',
+        'func_id': 'QM',
+        'header_segments': ['ST', 'B10', 'L11', 'MAN', 'K1'],
+        'n1_loop': True,
+        'detail_segments': ['LX', 'AT7', 'MS1', 'MS2', 'L11', 'MAN', 'Q7', 'AT8', 'AT5', 'PLD', 'NTE'],
+        'summary_segments': ['SE']
+    },
+    # Freight Details and Invoice
+    '210': {
+        'name': 'Motor Carrier Freight Details and Invoice',
+        'func_id': 'IM',
+        'header_segments': ['ST', 'B3', 'B3A', 'C2', 'C3', 'ITD', 'N9', 'G62', 'R3', 'H3', 'K1', 'N1', 'N2', 'N3', 'N4', 'N7'],
+        'n1_loop': True,
+        'detail_segments': ['LX', 'N1', 'N7', 'L5', 'H1', 'H3', 'L0', 'L1', 'L4', 'L7', 'K1', 'L10'],
+        'summary_segments': ['L3', 'SE']
+    },
+}
+
+# X12 segment definitions
+_SEGMENTS = {
+    # Transaction Set Header/Trailer
+    'ST': {
+        'name': 'Transaction Set Header',
+        'elements': [
+            {'id': 'ST01', 'purpose': 'Transaction Set Identifier Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '143'},
+            {'id': 'ST02', 'purpose': 'Transaction Set Control Number', 'type': 'AN', 'min': 4, 'max': 9, 'mand': True},
+            {'id': 'ST03', 'purpose': 'Implementation Convention Reference', 'type': 'AN', 'min': 1, 'max': 35, 'mand': False},
+        ]
+    },
+    'SE': {
+        'name': 'Transaction Set Trailer',
+        'elements': [
+            {'id': 'SE01', 'purpose': 'Number of Included Segments', 'type': 'N0', 'min': 1, 'max': 10, 'mand': True},
+            {'id': 'SE02', 'purpose': 'Transaction Set Control Number', 'type': 'AN', 'min': 4, 'max': 9, 'mand': True},
+        ]
+    },
+    # 850 Purchase Order Segments
+    'BEG': {
+        'name': 'Beginning Segment for Purchase Order',
+        'elements': [
+            {'id': 'BEG01', 'purpose': 'Transaction Set Purpose Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '353'},
+            {'id': 'BEG02', 'purpose': 'Purchase Order Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '92'},
+            {'id': 'BEG03', 'purpose': 'Purchase Order Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': True},
+            {'id': 'BEG04', 'purpose': 'Release Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
+            {'id': 'BEG05', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
+            {'id': 'BEG06', 'purpose': 'Contract Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
+            {'id': 'BEG07', 'purpose': 'Acknowledgment Type', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '587'},
+            {'id': 'BEG08', 'purpose': 'Invoice Type Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': False, 'codeList': '1019'},
+            {'id': 'BEG09', 'purpose': 'Contract Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '1166'},
+            {'id': 'BEG10', 'purpose': 'Purchase Category', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '1232'},
+            {'id': 'BEG11', 'purpose': 'Security Level Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '786'},
+            {'id': 'BEG12', 'purpose': 'Transaction Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '640'},
+        ]
+    },
+    # 855 PO Acknowledgment
+    'BAK': {
+        'name': 'Beginning Segment for Purchase Order Acknowledgment',
+        'elements': [
+            {'id': 'BAK01', 'purpose': 'Transaction Set Purpose Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '353'},
+            {'id': 'BAK02', 'purpose': 'Acknowledgment Type', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '587'},
+            {'id': 'BAK03', 'purpose': 'Purchase Order Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': True},
+            {'id': 'BAK04', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
+            {'id': 'BAK05', 'purpose': 'Release Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
+            {'id': 'BAK06', 'purpose': 'Request Reference Number', 'type': 'AN', 'min': 1, 'max': 45, 'mand': False},
+            {'id': 'BAK07', 'purpose': 'Contract Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
+            {'id': 'BAK08', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
+            {'id': 'BAK09', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+        ]
+    },
+    'ACK': {
+        'name': 'Line Item Acknowledgment',
+        'elements': [
+            {'id': 'ACK01', 'purpose': 'Line Item Status Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '668'},
+            {'id': 'ACK02', 'purpose': 'Quantity', 'type': 'R', 'min': 1, 'max': 15, 'mand': True},
+            {'id': 'ACK03', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
+            {'id': 'ACK04', 'purpose': 'Date/Time Qualifier', 'type': 'ID', 'min': 3, 'max': 3, 'mand': False, 'codeList': '374'},
+            {'id': 'ACK05', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+            {'id': 'ACK06', 'purpose': 'Request Reference Number', 'type': 'AN', 'min': 1, 'max': 45, 'mand': False},
+        ]
+    },
+    # 856 Ship Notice
+    'BSN': {
+        'name': 'Beginning Segment for Ship Notice',
+        'elements': [
+            {'id': 'BSN01', 'purpose': 'Transaction Set Purpose Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '353'},
+            {'id': 'BSN02', 'purpose': 'Shipment Identification', 'type': 'AN', 'min': 2, 'max': 30, 'mand': True},
+            {'id': 'BSN03', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
+            {'id': 'BSN04', 'purpose': 'Time', 'type': 'TM', 'min': 4, 'max': 8, 'mand': True, 'format': 'HHmm'},
+            {'id': 'BSN05', 'purpose': 'Hierarchical Structure Code', 'type': 'ID', 'min': 4, 'max': 4, 'mand': False, 'codeList': '1005'},
+        ]
+    },
+    'HL': {
+        'name': 'Hierarchical Level',
+        'elements': [
+            {'id': 'HL01', 'purpose': 'Hierarchical ID Number', 'type': 'AN', 'min': 1, 'max': 12, 'mand': True},
+            {'id': 'HL02', 'purpose': 'Hierarchical Parent ID Number', 'type': 'AN', 'min': 1, 'max': 12, 'mand': False},
+            {'id': 'HL03', 'purpose': 'Hierarchical Level Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '735'},
+            {'id': 'HL04', 'purpose': 'Hierarchical Child Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': False, 'codeList': '736'},
+        ]
+    },
+    'SN1': {
+        'name': 'Item Detail (Shipment)',
+        'elements': [
+            {'id': 'SN101', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
+            {'id': 'SN102', 'purpose': 'Number of Units Shipped', 'type': 'R', 'min': 1, 'max': 10, 'mand': True},
+            {'id': 'SN103', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
+            {'id': 'SN104', 'purpose': 'Quantity Shipped to Date', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
+            {'id': 'SN105', 'purpose': 'Quantity Ordered', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
+        ]
+    },
+    # 810 Invoice
+    'BIG': {
+        'name': 'Beginning Segment for Invoice',
+        'elements': [
+            {'id': 'BIG01', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
+            {'id': 'BIG02', 'purpose': 'Invoice Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': True},
+            {'id': 'BIG03', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+            {'id': 'BIG04', 'purpose': 'Purchase Order Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': False},
+            {'id': 'BIG05', 'purpose': 'Release Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
+            {'id': 'BIG06', 'purpose': 'Change Order Sequence Number', 'type': 'AN', 'min': 1, 'max': 8, 'mand': False},
+            {'id': 'BIG07', 'purpose': 'Transaction Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '640'},
+        ]
+    },
+    'IT1': {
+        'name': 'Baseline Item Data (Invoice)',
+        'elements': [
+            {'id': 'IT101', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
+            {'id': 'IT102', 'purpose': 'Quantity Invoiced', 'type': 'R', 'min': 1, 'max': 15, 'mand': True},
+            {'id': 'IT103', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
+            {'id': 'IT104', 'purpose': 'Unit Price', 'type': 'R', 'min': 1, 'max': 17, 'mand': True},
+            {'id': 'IT105', 'purpose': 'Basis of Unit Price Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '639'},
+            {'id': 'IT106', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
+            {'id': 'IT107', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
+            {'id': 'IT108', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
+            {'id': 'IT109', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
+            {'id': 'IT110', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
+            {'id': 'IT111', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
+        ]
+    },
+    'TDS': {
+        'name': 'Total Monetary Value Summary',
+        'elements': [
+            {'id': 'TDS01', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': True},
+            {'id': 'TDS02', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
+            {'id': 'TDS03', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
+            {'id': 'TDS04', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
+        ]
+    },
+    # 820 Payment
+    'BPR': {
+        'name': 'Beginning Segment for Payment Order/Remittance Advice',
+        'elements': [
+            {'id': 'BPR01', 'purpose': 'Transaction Handling Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '305'},
+            {'id': 'BPR02', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': True},
+            {'id': 'BPR03', 'purpose': 'Credit/Debit Flag Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '478'},
+            {'id': 'BPR04', 'purpose': 'Payment Method Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '591'},
+            {'id': 'BPR05', 'purpose': 'Payment Format Code', 'type': 'ID', 'min': 1, 'max': 10, 'mand': False, 'codeList': '812'},
+            {'id': 'BPR16', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+        ]
+    },
+    'TRN': {
+        'name': 'Trace',
+        'elements': [
+            {'id': 'TRN01', 'purpose': 'Trace Type Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '481'},
+            {'id': 'TRN02', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': True},
+            {'id': 'TRN03', 'purpose': 'Originating Company Identifier', 'type': 'AN', 'min': 10, 'max': 10, 'mand': False},
+            {'id': 'TRN04', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
+        ]
+    },
+    'RMR': {
+        'name': 'Remittance Advice Accounts Receivable Open Item Reference',
+        'elements': [
+            {'id': 'RMR01', 'purpose': 'Reference Identification Qualifier', 'type': 'ID', 'min': 2, 'max': 3, 'mand': False, 'codeList': '128'},
+            {'id': 'RMR02', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
+            {'id': 'RMR03', 'purpose': 'Payment Action Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '426'},
+            {'id': 'RMR04', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
+            {'id': 'RMR05', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
+            {'id': 'RMR06', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
+        ]
+    },
+    # 997 Functional Ack
+    'AK1': {
+        'name': 'Functional Group Response Header',
+        'elements': [
+            {'id': 'AK101', 'purpose': 'Functional Identifier Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '479'},
+            {'id': 'AK102', 'purpose': 'Group Control Number', 'type': 'N0', 'min': 1, 'max': 9, 'mand': True},
+            {'id': 'AK103', 'purpose': 'Version/Release/Industry Identifier Code', 'type': 'AN', 'min': 1, 'max': 12, 'mand': False},
+        ]
+    },
+    'AK2': {
+        'name': 'Transaction Set Response Header',
+        'elements': [
+            {'id': 'AK201', 'purpose': 'Transaction Set Identifier Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '143'},
+            {'id': 'AK202', 'purpose': 'Transaction Set Control Number', 'type': 'AN', 'min': 4, 'max': 9, 'mand': True},
+            {'id': 'AK203', 'purpose': 'Implementation Convention Reference', 'type': 'AN', 'min': 1, 'max': 35, 'mand': False},
+        ]
+    },
+    'AK5': {
+        'name': 'Transaction Set Response Trailer',
+        'elements': [
+            {'id': 'AK501', 'purpose': 'Transaction Set Acknowledgment Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '717'},
+            {'id': 'AK502', 'purpose': 'Transaction Set Syntax Error Code', 'type': 'ID', 'min': 1, 'max': 3, 'mand': False, 'codeList': '718'},
+        ]
+    },
+    'AK9': {
+        'name': 'Functional Group Response Trailer',
+        'elements': [
+            {'id': 'AK901', 'purpose': 'Functional Group Acknowledge Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '715'},
+            {'id': 'AK902', 'purpose': 'Number of Transaction Sets Included', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
+            {'id': 'AK903', 'purpose': 'Number of Received Transaction Sets', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
+            {'id': 'AK904', 'purpose': 'Number of Accepted Transaction Sets', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
+            {'id': 'AK905', 'purpose': 'Functional Group Syntax Error Code', 'type': 'ID', 'min': 1, 'max': 3, 'mand': False, 'codeList': '716'},
+        ]
+    },
+    # Common Segments
+    'CUR': {
+        'name': 'Currency',
+        'elements': [
+            {'id': 'CUR01', 'purpose': 'Entity Identifier Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': True, 'codeList': '98'},
+            {'id': 'CUR02', 'purpose': 'Currency Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True},
+            {'id': 'CUR03', 'purpose': 'Exchange Rate', 'type': 'R', 'min': 4, 'max': 10, 'mand': False},
+        ]
+    },
+    'REF': {
+        'name': 'Reference Identification',
+        'elements': [
+            {'id': 'REF01', 'purpose': 'Reference Identification Qualifier', 'type': 'ID', 'min': 2, 'max': 3, 'mand': True, 'codeList': '128'},
+            {'id': 'REF02', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
+            {'id': 'REF03', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': False},
+        ]
+    },
+    'DTM': {
+        'name': 'Date/Time Reference',
+        'elements': [
+            {'id': 'DTM01', 'purpose': 'Date/Time Qualifier', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '374'},
+            {'id': 'DTM02', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+            {'id': 'DTM03', 'purpose': 'Time', 'type': 'TM', 'min': 4, 'max': 8, 'mand': False, 'format': 'HHmm'},
+            {'id': 'DTM04', 'purpose': 'Time Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '623'},
+        ]
+    },
+    'N1': {
+        'name': 'Party Identification',
+        'elements': [
+            {'id': 'N101', 'purpose': 'Entity Identifier Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': True, 'codeList': '98'},
+            {'id': 'N102', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': False},
+            {'id': 'N103', 'purpose': 'Identification Code Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '66'},
+            {'id': 'N104', 'purpose': 'Identification Code', 'type': 'AN', 'min': 2, 'max': 80, 'mand': False},
+        ]
+    },
+    'N2': {
+        'name': 'Additional Name Information',
+        'elements': [
+            {'id': 'N201', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': True},
+            {'id': 'N202', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': False},
+        ]
+    },
+    'N3': {
+        'name': 'Party Location',
+        'elements': [
+            {'id': 'N301', 'purpose': 'Address Information', 'type': 'AN', 'min': 1, 'max': 55, 'mand': True},
+            {'id': 'N302', 'purpose': 'Address Information', 'type': 'AN', 'min': 1, 'max': 55, 'mand': False},
+        ]
+    },
+    'N4': {
+        'name': 'Geographic Location',
+        'elements': [
+            {'id': 'N401', 'purpose': 'City Name', 'type': 'AN', 'min': 2, 'max': 30, 'mand': False},
+            {'id': 'N402', 'purpose': 'State or Province Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False},
+            {'id': 'N403', 'purpose': 'Postal Code', 'type': 'ID', 'min': 3, 'max': 15, 'mand': False},
+            {'id': 'N404', 'purpose': 'Country Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': False},
+        ]
+    },
+    'PER': {
+        'name': 'Administrative Communications Contact',
+        'elements': [
+            {'id': 'PER01', 'purpose': 'Contact Function Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '366'},
+            {'id': 'PER02', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': False},
+            {'id': 'PER03', 'purpose': 'Communication Number Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '365'},
+            {'id': 'PER04', 'purpose': 'Communication Number', 'type': 'AN', 'min': 1, 'max': 256, 'mand': False},
+        ]
+    },
+    'PID': {
+        'name': 'Product/Item Description',
+        'elements': [
+            {'id': 'PID01', 'purpose': 'Item Description Type', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '349'},
+            {'id': 'PID02', 'purpose': 'Product/Process Characteristic Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': False, 'codeList': '750'},
+            {'id': 'PID03', 'purpose': 'Agency Qualifier Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '559'},
+            {'id': 'PID04', 'purpose': 'Product Description Code', 'type': 'AN', 'min': 1, 'max': 12, 'mand': False},
+            {'id': 'PID05', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': False},
+        ]
+    },
+    'TD5': {
+        'name': 'Carrier Details (Routing Sequence/Transit Time)',
+        'elements': [
+            {'id': 'TD501', 'purpose': 'Routing Sequence Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '133'},
+            {'id': 'TD502', 'purpose': 'Identification Code Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '66'},
+            {'id': 'TD503', 'purpose': 'Identification Code', 'type': 'AN', 'min': 2, 'max': 80, 'mand': False},
+            {'id': 'TD504', 'purpose': 'Transportation Method/Type Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '91'},
+            {'id': 'TD505', 'purpose': 'Routing', 'type': 'AN', 'min': 1, 'max': 35, 'mand': False},
+        ]
+    },
+    'PO1': {
+        'name': 'Baseline Item Data',
+        'elements': [
+            {'id': 'PO101', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
+            {'id': 'PO102', 'purpose': 'Quantity Ordered', 'type': 'R', 'min': 1, 'max': 15, 'mand': True},
+            {'id': 'PO103', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
+            {'id': 'PO104', 'purpose': 'Unit Price', 'type': 'R', 'min': 1, 'max': 17, 'mand': False},
+            {'id': 'PO105', 'purpose': 'Basis of Unit Price Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '639'},
+            {'id': 'PO106', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
+            {'id': 'PO107', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
+            {'id': 'PO108', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
+            {'id': 'PO109', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
+        ]
+    },
+    'LIN': {
+        'name': 'Item Identification',
+        'elements': [
+            {'id': 'LIN01', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
+            {'id': 'LIN02', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '235'},
+            {'id': 'LIN03', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': True},
+            {'id': 'LIN04', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
+            {'id': 'LIN05', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
+        ]
+    },
+    'CTT': {
+        'name': 'Transaction Totals',
+        'elements': [
+            {'id': 'CTT01', 'purpose': 'Number of Line Items', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
+            {'id': 'CTT02', 'purpose': 'Hash Total', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
+        ]
+    },
+    'AMT': {
+        'name': 'Monetary Amount Information',
+        'elements': [
+            {'id': 'AMT01', 'purpose': 'Amount Qualifier Code', 'type': 'ID', 'min': 1, 'max': 3, 'mand': True, 'codeList': '522'},
+            {'id': 'AMT02', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': True},
+        ]
+    },
+    'ITD': {
+        'name': 'Terms of Sale/Deferred Terms of Sale',
+        'elements': [
+            {'id': 'ITD01', 'purpose': 'Terms Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '336'},
+            {'id': 'ITD02', 'purpose': 'Terms Basis Date Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '333'},
+            {'id': 'ITD03', 'purpose': 'Terms Discount Percent', 'type': 'R', 'min': 1, 'max': 6, 'mand': False},
+            {'id': 'ITD04', 'purpose': 'Terms Discount Due Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+            {'id': 'ITD05', 'purpose': 'Terms Discount Days Due', 'type': 'N0', 'min': 1, 'max': 3, 'mand': False},
+            {'id': 'ITD06', 'purpose': 'Terms Net Due Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
+            {'id': 'ITD07', 'purpose': 'Terms Net Days', 'type': 'N0', 'min': 1, 'max': 3, 'mand': False},
+        ]
+    },
+    'FOB': {
+        'name': 'F.O.B. Related Instructions',
+        'elements': [
+            {'id': 'FOB01', 'purpose': 'Shipment Method of Payment', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '146'},
+            {'id': 'FOB02', 'purpose': 'Location Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '309'},
+            {'id': 'FOB03', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': False},
+        ]
+    },
+    'TD1': {
+        'name': 'Carrier Details (Quantity and Weight)',
+        'elements': [
+            {'id': 'TD101', 'purpose': 'Packaging Code', 'type': 'AN', 'min': 3, 'max': 5, 'mand': False},
+            {'id': 'TD102', 'purpose': 'Lading Quantity', 'type': 'N0', 'min': 1, 'max': 7, 'mand': False},
+            {'id': 'TD106', 'purpose': 'Weight', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
+            {'id': 'TD107', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '355'},
+        ]
+    },
+    'MAN': {
+        'name': 'Marks and Numbers',
+        'elements': [
+            {'id': 'MAN01', 'purpose': 'Marks and Numbers Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '88'},
+            {'id': 'MAN02', 'purpose': 'Marks and Numbers', 'type': 'AN', 'min': 1, 'max': 48, 'mand': True},
+        ]
+    },
+    'NTE': {
+        'name': 'Note/Special Instruction',
+        'elements': [
+            {'id': 'NTE01', 'purpose': 'Note Reference Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': False, 'codeList': '363'},
+            {'id': 'NTE02', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': True},
+        ]
+    },
+    'SAC': {
+        'name': 'Service, Promotion, Allowance, or Charge Information',
+        'elements': [
+            {'id': 'SAC01', 'purpose': 'Allowance or Charge Indicator', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '248'},
+            {'id': 'SAC02', 'purpose': 'Service, Promotion, Allowance, or Charge Code', 'type': 'ID', 'min': 4, 'max': 4, 'mand': False, 'codeList': '1300'},
+            {'id': 'SAC05', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
+        ]
+    },
+    'TXI': {
+        'name': 'Tax Information',
+        'elements': [
+            {'id': 'TXI01', 'purpose': 'Tax Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '963'},
+            {'id': 'TXI02', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
+            {'id': 'TXI03', 'purpose': 'Percent', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
+        ]
+    },
+    'MEA': {
+        'name': 'Measurements',
+        'elements': [
+            {'id': 'MEA01', 'purpose': 'Measurement Reference ID Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '737'},
+            {'id': 'MEA02', 'purpose': 'Measurement Qualifier', 'type': 'ID', 'min': 1, 'max': 3, 'mand': False, 'codeList': '738'},
+            {'id': 'MEA03', 'purpose': 'Measurement Value', 'type': 'R', 'min': 1, 'max': 20, 'mand': False},
+            {'id': 'MEA04', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '355'},
+        ]
+    },
+    'PO4': {
+        'name': 'Item Physical Details',
+        'elements': [
+            {'id': 'PO401', 'purpose': 'Pack', 'type': 'N0', 'min': 1, 'max': 6, 'mand': False},
+            {'id': 'PO402', 'purpose': 'Size', 'type': 'R', 'min': 1, 'max': 8, 'mand': False},
+            {'id': 'PO403', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '355'},
+            {'id': 'PO404', 'purpose': 'Packaging Code', 'type': 'AN', 'min': 3, 'max': 5, 'mand': False},
+        ]
+    },
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Shared, read-only definitions (safe to share across converters and threads)
+TRANSACTION_SETS = _freeze(_TRANSACTION_SETS)
+SEGMENTS = _freeze(_SEGMENTS)
+
+
 class BoomiEDIProfileConverter:
     """
     Comprehensive Boomi EDI Profile Converter
@@ -139,510 +720,25 @@ class BoomiEDIProfileConverter:
     
     def __init__(self):
         self.key_counter = 0
-        self._init_segment_definitions()
-        self._init_transaction_sets()
-    
-    def _init_transaction_sets(self):
-        """Initialize transaction set configurations"""
-        self.transaction_sets = {
-            # Purchase Order
-            '850': {
-                'name': 'Purchase Order',
-                'func_id': 'PO',
-                'header_segments': ['ST', 'BEG', 'CUR', 'REF', 'PER', 'TAX', 'FOB', 'CTP', 'PAM', 'CSH', 'TC2', 'SAC', 'ITD', 'DIS', 'INC', 'DTM', 'LIN', 'SI', 'PID', 'MEA', 'PWK', 'PKG', 'TD1', 'TD5', 'TD3', 'TD4', 'MAN', 'PCT', 'CTB', 'TXI'],
-                'n1_loop': True,
-                'detail_segments': ['PO1', 'LIN', 'SI', 'CUR', 'CN1', 'PO3', 'CTP', 'PAM', 'MEA', 'PID', 'PWK', 'PO4', 'REF', 'PER', 'SAC', 'IT8', 'CSH', 'ITD', 'DIS', 'INC', 'TAX', 'FOB', 'SDQ', 'IT3', 'DTM', 'TC2', 'TD1', 'TD5', 'TD3', 'TD4', 'PCT', 'MAN', 'MTX', 'SPI', 'TXI', 'CTB'],
-                'summary_segments': ['CTT', 'AMT', 'SE']
-            },
-            # PO Acknowledgment
-            '855': {
-                'name': 'Purchase Order Acknowledgment',
-                'func_id': 'PR',
-                'header_segments': ['ST', 'BAK', 'CUR', 'REF', 'PER', 'TAX', 'FOB', 'CTP', 'PAM', 'CSH', 'SAC', 'ITD', 'DTM', 'PID', 'MEA', 'PWK', 'PKG', 'TD1', 'TD5', 'TD3', 'TD4', 'MAN', 'TXI'],
-                'n1_loop': True,
-                'detail_segments': ['PO1', 'LIN', 'SI', 'CUR', 'PO3', 'CTP', 'PAM', 'MEA', 'PID', 'PWK', 'PO4', 'REF', 'PER', 'SAC', 'ITD', 'TAX', 'FOB', 'SDQ', 'DTM', 'TD1', 'TD5', 'TD3', 'TD4', 'MAN', 'TXI', 'ACK'],
-                'summary_segments': ['CTT', 'SE']
-            },
-            # Ship Notice/Manifest (ASN)
-            '856': {
-                'name': 'Ship Notice/Manifest',
-                'func_id': 'SH',
-                'header_segments': ['ST', 'BSN', 'DTM', 'HL', 'MEA', 'PWK', 'TD1', 'TD5', 'TD3', 'TD4', 'REF', 'PER', 'FOB', 'PID', 'MAN'],
-                'n1_loop': True,
-                'detail_segments': ['HL', 'LIN', 'SN1', 'PO4', 'PID', 'MEA', 'PWK', 'PKG', 'TD1', 'TD5', 'TD3', 'TD4', 'REF', 'PER', 'MAN'],
-                'summary_segments': ['CTT', 'SE']
-            },
-            # Invoice
-            '810': {
-                'name': 'Invoice',
-                'func_id': 'IN',
-                'header_segments': ['ST', 'BIG', 'NTE', 'CUR', 'REF', 'YNQ', 'PER', 'DTM', 'FOB', 'PID', 'MEA', 'PWK', 'ITD', 'DTM', 'TD1', 'TD5', 'TD3', 'TD4'],
-                'n1_loop': True,
-                'detail_segments': ['IT1', 'CRC', 'QTY', 'CUR', 'IT3', 'TXI', 'CTP', 'PAM', 'MEA', 'PID', 'PWK', 'PKG', 'PO4', 'ITD', 'REF', 'YNQ', 'PER', 'SDQ', 'DTM', 'CAD', 'L7', 'SR', 'SAC', 'SL1', 'TC2', 'TXI'],
-                'summary_segments': ['TDS', 'TXI', 'CAD', 'AMT', 'SAC', 'ISS', 'CTT', 'SE']
-            },
-            # Payment Order/Remittance Advice
-            '820': {
-                'name': 'Payment Order/Remittance Advice',
-                'func_id': 'RA',
-                'header_segments': ['ST', 'BPR', 'NTE', 'TRN', 'CUR', 'REF', 'DTM', 'PER'],
-                'n1_loop': True,
-                'detail_segments': ['ENT', 'RMR', 'NTE', 'REF', 'DTM', 'ADX', 'RMT'],
-                'summary_segments': ['SE']
-            },
-            # Functional Acknowledgment
-            '997': {
-                'name': 'Functional Acknowledgment',
-                'func_id': 'FA',
-                'header_segments': ['ST', 'AK1'],
-                'n1_loop': False,
-                'detail_segments': ['AK2', 'AK3', 'AK4', 'AK5'],
-                'summary_segments': ['AK9', 'SE']
-            },
-            # Implementation Acknowledgment
-            '999': {
-                'name': 'Implementation Acknowledgment',
-                'func_id': 'FA',
-                'header_segments': ['ST', 'AK1'],
-                'n1_loop': False,
-                'detail_segments': ['AK2', 'IK3', 'IK4', 'IK5'],
-                'summary_segments': ['AK9', 'SE']
-            },
-            # Motor Carrier Load Tender
-            '204': {
-                'name': 'Motor Carrier Load Tender',
-                'func_id': 'SM',
-                'header_segments': ['ST', 'B2', 'B2A', 'L11', 'G62', 'MS3', 'AT5', 'PLD', 'NTE'],
-                'n1_loop': True,
-                'detail_segments': ['S5', 'L11', 'G62', 'AT8', 'LAD', 'NTE', 'OID', 'L5', 'L0', 'L1', 'L4', 'L7'],
-                'summary_segments': ['L3', 'SE']
-            },
-            # Shipment Status
-            '214': {
-                'name': 'Transportation Carrier Shipment Status',
-                'func_id': 'QM',
-                'header_segments': ['ST', 'B10', 'L11', 'MAN', 'K1'],
-                'n1_loop': True,
-                'detail_segments': ['LX', 'AT7', 'MS1', 'MS2', 'L11', 'MAN', 'Q7', 'AT8', 'AT5', 'PLD', 'NTE'],
-                'summary_segments': ['SE']
-            },
-            # Freight Details and Invoice
-            '210': {
-                'name': 'Motor Carrier Freight Details and Invoice',
-                'func_id': 'IM',
-                'header_segments': ['ST', 'B3', 'B3A', 'C2', 'C3', 'ITD', 'N9', 'G62', 'R3', 'H3', 'K1', 'N1', 'N2', 'N3', 'N4', 'N7'],
-                'n1_loop': True,
-                'detail_segments': ['LX', 'N1', 'N7', 'L5', 'H1', 'H3', 'L0', 'L1', 'L4', 'L7', 'K1', 'L10'],
-                'summary_segments': ['L3', 'SE']
-            },
-        }
-    
-    def _init_segment_definitions(self):
-        """Initialize all X12 segment definitions"""
-        self.segments = {
-            # Transaction Set Header/Trailer
-            'ST': {
-                'name': 'Transaction Set Header',
-                'elements': [
-                    {'id': 'ST01', 'purpose': 'Transaction Set Identifier Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '143'},
-                    {'id': 'ST02', 'purpose': 'Transaction Set Control Number', 'type': 'AN', 'min': 4, 'max': 9, 'mand': True},
-                    {'id': 'ST03', 'purpose': 'Implementation Convention Reference', 'type': 'AN', 'min': 1, 'max': 35, 'mand': False},
-                ]
-            },
-            'SE': {
-                'name': 'Transaction Set Trailer',
-                'elements': [
-                    {'id': 'SE01', 'purpose': 'Number of Included Segments', 'type': 'N0', 'min': 1, 'max': 10, 'mand': True},
-                    {'id': 'SE02', 'purpose': 'Transaction Set Control Number', 'type': 'AN', 'min': 4, 'max': 9, 'mand': True},
-                ]
-            },
-            # 850 Purchase Order Segments
-            'BEG': {
-                'name': 'Beginning Segment for Purchase Order',
-                'elements': [
-                    {'id': 'BEG01', 'purpose': 'Transaction Set Purpose Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '353'},
-                    {'id': 'BEG02', 'purpose': 'Purchase Order Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '92'},
-                    {'id': 'BEG03', 'purpose': 'Purchase Order Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': True},
-                    {'id': 'BEG04', 'purpose': 'Release Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
-                    {'id': 'BEG05', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
-                    {'id': 'BEG06', 'purpose': 'Contract Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
-                    {'id': 'BEG07', 'purpose': 'Acknowledgment Type', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '587'},
-                    {'id': 'BEG08', 'purpose': 'Invoice Type Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': False, 'codeList': '1019'},
-                    {'id': 'BEG09', 'purpose': 'Contract Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '1166'},
-                    {'id': 'BEG10', 'purpose': 'Purchase Category', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '1232'},
-                    {'id': 'BEG11', 'purpose': 'Security Level Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '786'},
-                    {'id': 'BEG12', 'purpose': 'Transaction Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '640'},
-                ]
-            },
-            # 855 PO Acknowledgment
-            'BAK': {
-                'name': 'Beginning Segment for Purchase Order Acknowledgment',
-                'elements': [
-                    {'id': 'BAK01', 'purpose': 'Transaction Set Purpose Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '353'},
-                    {'id': 'BAK02', 'purpose': 'Acknowledgment Type', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '587'},
-                    {'id': 'BAK03', 'purpose': 'Purchase Order Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': True},
-                    {'id': 'BAK04', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
-                    {'id': 'BAK05', 'purpose': 'Release Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
-                    {'id': 'BAK06', 'purpose': 'Request Reference Number', 'type': 'AN', 'min': 1, 'max': 45, 'mand': False},
-                    {'id': 'BAK07', 'purpose': 'Contract Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
-                    {'id': 'BAK08', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
-                    {'id': 'BAK09', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                ]
-            },
-            'ACK': {
-                'name': 'Line Item Acknowledgment',
-                'elements': [
-                    {'id': 'ACK01', 'purpose': 'Line Item Status Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '668'},
-                    {'id': 'ACK02', 'purpose': 'Quantity', 'type': 'R', 'min': 1, 'max': 15, 'mand': True},
-                    {'id': 'ACK03', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
-                    {'id': 'ACK04', 'purpose': 'Date/Time Qualifier', 'type': 'ID', 'min': 3, 'max': 3, 'mand': False, 'codeList': '374'},
-                    {'id': 'ACK05', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                    {'id': 'ACK06', 'purpose': 'Request Reference Number', 'type': 'AN', 'min': 1, 'max': 45, 'mand': False},
-                ]
-            },
-            # 856 Ship Notice
-            'BSN': {
-                'name': 'Beginning Segment for Ship Notice',
-                'elements': [
-                    {'id': 'BSN01', 'purpose': 'Transaction Set Purpose Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '353'},
-                    {'id': 'BSN02', 'purpose': 'Shipment Identification', 'type': 'AN', 'min': 2, 'max': 30, 'mand': True},
-                    {'id': 'BSN03', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
-                    {'id': 'BSN04', 'purpose': 'Time', 'type': 'TM', 'min': 4, 'max': 8, 'mand': True, 'format': 'HHmm'},
-                    {'id': 'BSN05', 'purpose': 'Hierarchical Structure Code', 'type': 'ID', 'min': 4, 'max': 4, 'mand': False, 'codeList': '1005'},
-                ]
-            },
-            'HL': {
-                'name': 'Hierarchical Level',
-                'elements': [
-                    {'id': 'HL01', 'purpose': 'Hierarchical ID Number', 'type': 'AN', 'min': 1, 'max': 12, 'mand': True},
-                    {'id': 'HL02', 'purpose': 'Hierarchical Parent ID Number', 'type': 'AN', 'min': 1, 'max': 12, 'mand': False},
-                    {'id': 'HL03', 'purpose': 'Hierarchical Level Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '735'},
-                    {'id': 'HL04', 'purpose': 'Hierarchical Child Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': False, 'codeList': '736'},
-                ]
-            },
-            'SN1': {
-                'name': 'Item Detail (Shipment)',
-                'elements': [
-                    {'id': 'SN101', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
-                    {'id': 'SN102', 'purpose': 'Number of Units Shipped', 'type': 'R', 'min': 1, 'max': 10, 'mand': True},
-                    {'id': 'SN103', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
-                    {'id': 'SN104', 'purpose': 'Quantity Shipped to Date', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
-                    {'id': 'SN105', 'purpose': 'Quantity Ordered', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
-                ]
-            },
-            # 810 Invoice
-            'BIG': {
-                'name': 'Beginning Segment for Invoice',
-                'elements': [
-                    {'id': 'BIG01', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': True, 'format': 'yyyyMMdd'},
-                    {'id': 'BIG02', 'purpose': 'Invoice Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': True},
-                    {'id': 'BIG03', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                    {'id': 'BIG04', 'purpose': 'Purchase Order Number', 'type': 'AN', 'min': 1, 'max': 22, 'mand': False},
-                    {'id': 'BIG05', 'purpose': 'Release Number', 'type': 'AN', 'min': 1, 'max': 30, 'mand': False},
-                    {'id': 'BIG06', 'purpose': 'Change Order Sequence Number', 'type': 'AN', 'min': 1, 'max': 8, 'mand': False},
-                    {'id': 'BIG07', 'purpose': 'Transaction Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '640'},
-                ]
-            },
-            'IT1': {
-                'name': 'Baseline Item Data (Invoice)',
-                'elements': [
-                    {'id': 'IT101', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
-                    {'id': 'IT102', 'purpose': 'Quantity Invoiced', 'type': 'R', 'min': 1, 'max': 15, 'mand': True},
-                    {'id': 'IT103', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
-                    {'id': 'IT104', 'purpose': 'Unit Price', 'type': 'R', 'min': 1, 'max': 17, 'mand': True},
-                    {'id': 'IT105', 'purpose': 'Basis of Unit Price Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '639'},
-                    {'id': 'IT106', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
-                    {'id': 'IT107', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
-                    {'id': 'IT108', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
-                    {'id': 'IT109', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
-                    {'id': 'IT110', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
-                    {'id': 'IT111', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
-                ]
-            },
-            'TDS': {
-                'name': 'Total Monetary Value Summary',
-                'elements': [
-                    {'id': 'TDS01', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': True},
-                    {'id': 'TDS02', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
-                    {'id': 'TDS03', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
-                    {'id': 'TDS04', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
-                ]
-            },
-            # 820 Payment
-            'BPR': {
-                'name': 'Beginning Segment for Payment Order/Remittance Advice',
-                'elements': [
-                    {'id': 'BPR01', 'purpose': 'Transaction Handling Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '305'},
-                    {'id': 'BPR02', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': True},
-                    {'id': 'BPR03', 'purpose': 'Credit/Debit Flag Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '478'},
-                    {'id': 'BPR04', 'purpose': 'Payment Method Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '591'},
-                    {'id': 'BPR05', 'purpose': 'Payment Format Code', 'type': 'ID', 'min': 1, 'max': 10, 'mand': False, 'codeList': '812'},
-                    {'id': 'BPR16', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                ]
-            },
-            'TRN': {
-                'name': 'Trace',
-                'elements': [
-                    {'id': 'TRN01', 'purpose': 'Trace Type Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '481'},
-                    {'id': 'TRN02', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': True},
-                    {'id': 'TRN03', 'purpose': 'Originating Company Identifier', 'type': 'AN', 'min': 10, 'max': 10, 'mand': False},
-                    {'id': 'TRN04', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
-                ]
-            },
-            'RMR': {
-                'name': 'Remittance Advice Accounts Receivable Open Item Reference',
-                'elements': [
-                    {'id': 'RMR01', 'purpose': 'Reference Identification Qualifier', 'type': 'ID', 'min': 2, 'max': 3, 'mand': False, 'codeList': '128'},
-                    {'id': 'RMR02', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
-                    {'id': 'RMR03', 'purpose': 'Payment Action Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '426'},
-                    {'id': 'RMR04', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
-                    {'id': 'RMR05', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
-                    {'id': 'RMR06', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
-                ]
-            },
-            # 997 Functional Ack
-            'AK1': {
-                'name': 'Functional Group Response Header',
-                'elements': [
-                    {'id': 'AK101', 'purpose': 'Functional Identifier Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '479'},
-                    {'id': 'AK102', 'purpose': 'Group Control Number', 'type': 'N0', 'min': 1, 'max': 9, 'mand': True},
-                    {'id': 'AK103', 'purpose': 'Version/Release/Industry Identifier Code', 'type': 'AN', 'min': 1, 'max': 12, 'mand': False},
-                ]
-            },
-            'AK2': {
-                'name': 'Transaction Set Response Header',
-                'elements': [
-                    {'id': 'AK201', 'purpose': 'Transaction Set Identifier Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '143'},
-                    {'id': 'AK202', 'purpose': 'Transaction Set Control Number', 'type': 'AN', 'min': 4, 'max': 9, 'mand': True},
-                    {'id': 'AK203', 'purpose': 'Implementation Convention Reference', 'type': 'AN', 'min': 1, 'max': 35, 'mand': False},
-                ]
-            },
-            'AK5': {
-                'name': 'Transaction Set Response Trailer',
-                'elements': [
-                    {'id': 'AK501', 'purpose': 'Transaction Set Acknowledgment Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '717'},
-                    {'id': 'AK502', 'purpose': 'Transaction Set Syntax Error Code', 'type': 'ID', 'min': 1, 'max': 3, 'mand': False, 'codeList': '718'},
-                ]
-            },
-            'AK9': {
-                'name': 'Functional Group Response Trailer',
-                'elements': [
-                    {'id': 'AK901', 'purpose': 'Functional Group Acknowledge Code', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '715'},
-                    {'id': 'AK902', 'purpose': 'Number of Transaction Sets Included', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
-                    {'id': 'AK903', 'purpose': 'Number of Received Transaction Sets', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
-                    {'id': 'AK904', 'purpose': 'Number of Accepted Transaction Sets', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
-                    {'id': 'AK905', 'purpose': 'Functional Group Syntax Error Code', 'type': 'ID', 'min': 1, 'max': 3, 'mand': False, 'codeList': '716'},
-                ]
-            },
-            # Common Segments
-            'CUR': {
-                'name': 'Currency',
-                'elements': [
-                    {'id': 'CUR01', 'purpose': 'Entity Identifier Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': True, 'codeList': '98'},
-                    {'id': 'CUR02', 'purpose': 'Currency Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True},
-                    {'id': 'CUR03', 'purpose': 'Exchange Rate', 'type': 'R', 'min': 4, 'max': 10, 'mand': False},
-                ]
-            },
-            'REF': {
-                'name': 'Reference Identification',
-                'elements': [
-                    {'id': 'REF01', 'purpose': 'Reference Identification Qualifier', 'type': 'ID', 'min': 2, 'max': 3, 'mand': True, 'codeList': '128'},
-                    {'id': 'REF02', 'purpose': 'Reference Identification', 'type': 'AN', 'min': 1, 'max': 50, 'mand': False},
-                    {'id': 'REF03', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': False},
-                ]
-            },
-            'DTM': {
-                'name': 'Date/Time Reference',
-                'elements': [
-                    {'id': 'DTM01', 'purpose': 'Date/Time Qualifier', 'type': 'ID', 'min': 3, 'max': 3, 'mand': True, 'codeList': '374'},
-                    {'id': 'DTM02', 'purpose': 'Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                    {'id': 'DTM03', 'purpose': 'Time', 'type': 'TM', 'min': 4, 'max': 8, 'mand': False, 'format': 'HHmm'},
-                    {'id': 'DTM04', 'purpose': 'Time Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '623'},
-                ]
-            },
-            'N1': {
-                'name': 'Party Identification',
-                'elements': [
-                    {'id': 'N101', 'purpose': 'Entity Identifier Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': True, 'codeList': '98'},
-                    {'id': 'N102', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': False},
-                    {'id': 'N103', 'purpose': 'Identification Code Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '66'},
-                    {'id': 'N104', 'purpose': 'Identification Code', 'type': 'AN', 'min': 2, 'max': 80, 'mand': False},
-                ]
-            },
-            'N2': {
-                'name': 'Additional Name Information',
-                'elements': [
-                    {'id': 'N201', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': True},
-                    {'id': 'N202', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': False},
-                ]
-            },
-            'N3': {
-                'name': 'Party Location',
-                'elements': [
-                    {'id': 'N301', 'purpose': 'Address Information', 'type': 'AN', 'min': 1, 'max': 55, 'mand': True},
-                    {'id': 'N302', 'purpose': 'Address Information', 'type': 'AN', 'min': 1, 'max': 55, 'mand': False},
-                ]
-            },
-            'N4': {
-                'name': 'Geographic Location',
-                'elements': [
-                    {'id': 'N401', 'purpose': 'City Name', 'type': 'AN', 'min': 2, 'max': 30, 'mand': False},
-                    {'id': 'N402', 'purpose': 'State or Province Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False},
-                    {'id': 'N403', 'purpose': 'Postal Code', 'type': 'ID', 'min': 3, 'max': 15, 'mand': False},
-                    {'id': 'N404', 'purpose': 'Country Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': False},
-                ]
-            },
-            'PER': {
-                'name': 'Administrative Communications Contact',
-                'elements': [
-                    {'id': 'PER01', 'purpose': 'Contact Function Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '366'},
-                    {'id': 'PER02', 'purpose': 'Name', 'type': 'AN', 'min': 1, 'max': 60, 'mand': False},
-                    {'id': 'PER03', 'purpose': 'Communication Number Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '365'},
-                    {'id': 'PER04', 'purpose': 'Communication Number', 'type': 'AN', 'min': 1, 'max': 256, 'mand': False},
-                ]
-            },
-            'PID': {
-                'name': 'Product/Item Description',
-                'elements': [
-                    {'id': 'PID01', 'purpose': 'Item Description Type', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '349'},
-                    {'id': 'PID02', 'purpose': 'Product/Process Characteristic Code', 'type': 'ID', 'min': 2, 'max': 3, 'mand': False, 'codeList': '750'},
-                    {'id': 'PID03', 'purpose': 'Agency Qualifier Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '559'},
-                    {'id': 'PID04', 'purpose': 'Product Description Code', 'type': 'AN', 'min': 1, 'max': 12, 'mand': False},
-                    {'id': 'PID05', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': False},
-                ]
-            },
-            'TD5': {
-                'name': 'Carrier Details (Routing Sequence/Transit Time)',
-                'elements': [
-                    {'id': 'TD501', 'purpose': 'Routing Sequence Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '133'},
-                    {'id': 'TD502', 'purpose': 'Identification Code Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '66'},
-                    {'id': 'TD503', 'purpose': 'Identification Code', 'type': 'AN', 'min': 2, 'max': 80, 'mand': False},
-                    {'id': 'TD504', 'purpose': 'Transportation Method/Type Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '91'},
-                    {'id': 'TD505', 'purpose': 'Routing', 'type': 'AN', 'min': 1, 'max': 35, 'mand': False},
-                ]
-            },
-            'PO1': {
-                'name': 'Baseline Item Data',
-                'elements': [
-                    {'id': 'PO101', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
-                    {'id': 'PO102', 'purpose': 'Quantity Ordered', 'type': 'R', 'min': 1, 'max': 15, 'mand': True},
-                    {'id': 'PO103', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '355'},
-                    {'id': 'PO104', 'purpose': 'Unit Price', 'type': 'R', 'min': 1, 'max': 17, 'mand': False},
-                    {'id': 'PO105', 'purpose': 'Basis of Unit Price Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '639'},
-                    {'id': 'PO106', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
-                    {'id': 'PO107', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
-                    {'id': 'PO108', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
-                    {'id': 'PO109', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
-                ]
-            },
-            'LIN': {
-                'name': 'Item Identification',
-                'elements': [
-                    {'id': 'LIN01', 'purpose': 'Assigned Identification', 'type': 'AN', 'min': 1, 'max': 20, 'mand': False},
-                    {'id': 'LIN02', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '235'},
-                    {'id': 'LIN03', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': True},
-                    {'id': 'LIN04', 'purpose': 'Product/Service ID Qualifier', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '235'},
-                    {'id': 'LIN05', 'purpose': 'Product/Service ID', 'type': 'AN', 'min': 1, 'max': 48, 'mand': False},
-                ]
-            },
-            'CTT': {
-                'name': 'Transaction Totals',
-                'elements': [
-                    {'id': 'CTT01', 'purpose': 'Number of Line Items', 'type': 'N0', 'min': 1, 'max': 6, 'mand': True},
-                    {'id': 'CTT02', 'purpose': 'Hash Total', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
-                ]
-            },
-            'AMT': {
-                'name': 'Monetary Amount Information',
-                'elements': [
-                    {'id': 'AMT01', 'purpose': 'Amount Qualifier Code', 'type': 'ID', 'min': 1, 'max': 3, 'mand': True, 'codeList': '522'},
-                    {'id': 'AMT02', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': True},
-                ]
-            },
-            'ITD': {
-                'name': 'Terms of Sale/Deferred Terms of Sale',
-                'elements': [
-                    {'id': 'ITD01', 'purpose': 'Terms Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '336'},
-                    {'id': 'ITD02', 'purpose': 'Terms Basis Date Code', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '333'},
-                    {'id': 'ITD03', 'purpose': 'Terms Discount Percent', 'type': 'R', 'min': 1, 'max': 6, 'mand': False},
-                    {'id': 'ITD04', 'purpose': 'Terms Discount Due Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                    {'id': 'ITD05', 'purpose': 'Terms Discount Days Due', 'type': 'N0', 'min': 1, 'max': 3, 'mand': False},
-                    {'id': 'ITD06', 'purpose': 'Terms Net Due Date', 'type': 'DT', 'min': 8, 'max': 8, 'mand': False, 'format': 'yyyyMMdd'},
-                    {'id': 'ITD07', 'purpose': 'Terms Net Days', 'type': 'N0', 'min': 1, 'max': 3, 'mand': False},
-                ]
-            },
-            'FOB': {
-                'name': 'F.O.B. Related Instructions',
-                'elements': [
-                    {'id': 'FOB01', 'purpose': 'Shipment Method of Payment', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '146'},
-                    {'id': 'FOB02', 'purpose': 'Location Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': False, 'codeList': '309'},
-                    {'id': 'FOB03', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': False},
-                ]
-            },
-            'TD1': {
-                'name': 'Carrier Details (Quantity and Weight)',
-                'elements': [
-                    {'id': 'TD101', 'purpose': 'Packaging Code', 'type': 'AN', 'min': 3, 'max': 5, 'mand': False},
-                    {'id': 'TD102', 'purpose': 'Lading Quantity', 'type': 'N0', 'min': 1, 'max': 7, 'mand': False},
-                    {'id': 'TD106', 'purpose': 'Weight', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
-                    {'id': 'TD107', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '355'},
-                ]
-            },
-            'MAN': {
-                'name': 'Marks and Numbers',
-                'elements': [
-                    {'id': 'MAN01', 'purpose': 'Marks and Numbers Qualifier', 'type': 'ID', 'min': 1, 'max': 2, 'mand': True, 'codeList': '88'},
-                    {'id': 'MAN02', 'purpose': 'Marks and Numbers', 'type': 'AN', 'min': 1, 'max': 48, 'mand': True},
-                ]
-            },
-            'NTE': {
-                'name': 'Note/Special Instruction',
-                'elements': [
-                    {'id': 'NTE01', 'purpose': 'Note Reference Code', 'type': 'ID', 'min': 3, 'max': 3, 'mand': False, 'codeList': '363'},
-                    {'id': 'NTE02', 'purpose': 'Description', 'type': 'AN', 'min': 1, 'max': 80, 'mand': True},
-                ]
-            },
-            'SAC': {
-                'name': 'Service, Promotion, Allowance, or Charge Information',
-                'elements': [
-                    {'id': 'SAC01', 'purpose': 'Allowance or Charge Indicator', 'type': 'ID', 'min': 1, 'max': 1, 'mand': True, 'codeList': '248'},
-                    {'id': 'SAC02', 'purpose': 'Service, Promotion, Allowance, or Charge Code', 'type': 'ID', 'min': 4, 'max': 4, 'mand': False, 'codeList': '1300'},
-                    {'id': 'SAC05', 'purpose': 'Amount', 'type': 'N2', 'min': 1, 'max': 15, 'mand': False},
-                ]
-            },
-            'TXI': {
-                'name': 'Tax Information',
-                'elements': [
-                    {'id': 'TXI01', 'purpose': 'Tax Type Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': True, 'codeList': '963'},
-                    {'id': 'TXI02', 'purpose': 'Monetary Amount', 'type': 'R', 'min': 1, 'max': 18, 'mand': False},
-                    {'id': 'TXI03', 'purpose': 'Percent', 'type': 'R', 'min': 1, 'max': 10, 'mand': False},
-                ]
-            },
-            'MEA': {
-                'name': 'Measurements',
-                'elements': [
-                    {'id': 'MEA01', 'purpose': 'Measurement Reference ID Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '737'},
-                    {'id': 'MEA02', 'purpose': 'Measurement Qualifier', 'type': 'ID', 'min': 1, 'max': 3, 'mand': False, 'codeList': '738'},
-                    {'id': 'MEA03', 'purpose': 'Measurement Value', 'type': 'R', 'min': 1, 'max': 20, 'mand': False},
-                    {'id': 'MEA04', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '355'},
-                ]
-            },
-            'PO4': {
-                'name': 'Item Physical Details',
-                'elements': [
-                    {'id': 'PO401', 'purpose': 'Pack', 'type': 'N0', 'min': 1, 'max': 6, 'mand': False},
-                    {'id': 'PO402', 'purpose': 'Size', 'type': 'R', 'min': 1, 'max': 8, 'mand': False},
-                    {'id': 'PO403', 'purpose': 'Unit or Basis for Measurement Code', 'type': 'ID', 'min': 2, 'max': 2, 'mand': False, 'codeList': '355'},
-                    {'id': 'PO404', 'purpose': 'Packaging Code', 'type': 'AN', 'min': 3, 'max': 5, 'mand': False},
-                ]
-            },
-        }
+        self._cached_timestamp: Tuple[int, str] = (-1, "")
+        self.segments = SEGMENTS
+        self.transaction_sets = TRANSACTION_SETS
     
     def next_key(self) -> int:
         """Generate next unique key"""
         self.key_counter += 1
         return self.key_counter
     
+    def _timestamp(self) -> str:
+        """UTC timestamp string, formatted at most once per second for batch runs"""
+        second = int(time.time())
+        if self._cached_timestamp[0] != second:
+            self._cached_timestamp = (
+                second,
+                datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            )
+        return self._cached_timestamp[1]
+    
     def escape_xml(self, text: str) -> str:
         """Escape special XML characters"""
         if not text:
@@ -653,13 +749,17 @@ class BoomiEDIProfileConverter:
                    .replace('"', '&quot;')
                    .replace("'", '&apos;'))
     
+    @staticmethod
+    def field_name_blob(fields: List[Dict]) -> str:
+        """Upper-cased, space-joined field names used for segment pattern checks"""
+        return ' '.join(f.get('name', '').upper() for f in fields)
+    
     def detect_transaction_set(self, fields: List[Dict], namespace: str = "") -> str:
         """
         Detect EDI transaction set from webMethods field names
         
         Returns: Transaction set code (850, 855, 856, 810, etc.)
         """
-        field_names = ' '.join([f.get('name', '').upper() for f in fields])
         ns_lower = namespace.lower()
         
         # Check namespace first
@@ -668,6 +768,7 @@ class BoomiEDIProfileConverter:
                 return ts
         
         # Check field patterns
+        field_names = self.field_name_blob(fields)
         if 'BEG' in field_names and 'PO1' in field_names:
             return '850'
         elif 'BAK' in field_names or ('ACK' in field_names and 'PO1' in field_names):
@@ -722,7 +823,7 @@ class BoomiEDIProfileConverter:
             return True
         
         # Check field patterns
-        field_names = ' '.join([f.get('name', '').upper() for f in fields])
+        field_names = self.field_name_blob(fields)
         edi_segments = ['ISA', 'GS0', 'ST0', 'BEG', 'BAK', 'BSN', 'BIG', 'BPR', 
                         'N1_', 'N10', 'PO1', 'IT1', 'HL0', 'SN1', 'CTT', 'SE0',
                         'AK1', 'AK9', 'DTM', 'REF', 'PER', 'TD5', 'FOB']
@@ -731,45 +832,23 @@ class BoomiEDIProfileConverter:
         
         return False
     
-    def create_segment(self, seg_id: str, position: str = None) -> Optional[EDISegment]:
-        """Create a segment from definition"""
-        if seg_id not in self.segments:
-            return None
-        
+    def _build_segment(self, seg_id: str, position: str, next_key) -> EDISegment:
+        """Build a segment from its definition, drawing keys from next_key"""
         seg_def = self.segments[seg_id]
         elements = []
         
         for elem_def in seg_def['elements']:
-            data_format = None
             dtype = elem_def['type']
-            
-            if dtype == 'DT':
-                data_format = EDIDataFormat(
-                    format_type='date',
-                    date_format=elem_def.get('format', 'yyyyMMdd')
-                )
-            elif dtype == 'TM':
-                data_format = EDIDataFormat(
-                    format_type='date',
-                    date_format=elem_def.get('format', 'HHmm')
-                )
-            elif dtype in ['R', 'N', 'N0', 'N2']:
-                data_format = EDIDataFormat(
-                    format_type='number',
-                    number_format='#.#' if dtype == 'R' else '#',
-                    signed_field=False
-                )
-            else:
-                data_format = EDIDataFormat(format_type='character')
+            data_format = _data_format_for(dtype, elem_def.get('format'))
             
             qualifier_list = None
             if 'codeList' in elem_def:
-                qualifier_list = EDICodeList(code_list_id=elem_def['codeList'])
+                qualifier_list = _code_list_for(elem_def['codeList'])
             
             element = EDIDataElement(
-                key=self.next_key(),
+                key=next_key(),
                 name=elem_def['id'],
-                data_type=EDIDataType[dtype] if dtype in EDIDataType.__members__ else EDIDataType.AN,
+                data_type=_EDI_DATA_TYPES.get(dtype, EDIDataType.AN),
                 element_purpose=elem_def['purpose'],
                 mandatory=elem_def['mand'],
                 min_length=elem_def['min'],
@@ -780,15 +859,33 @@ class BoomiEDIProfileConverter:
             elements.append(element)
         
         return EDISegment(
-            key=self.next_key(),
+            key=next_key(),
             name=seg_id,
             segment_name=seg_def['name'],
             position=position or '0100',
-            mandatory=seg_id in ['ST', 'SE', 'BEG', 'BAK', 'BSN', 'BIG', 'BPR', 'AK1', 'AK9'],
-            max_use=1 if seg_id in ['ST', 'SE', 'BEG', 'BAK', 'BSN', 'BIG', 'BPR'] else -1,
+            mandatory=seg_id in MANDATORY_SEGMENTS,
+            max_use=1 if seg_id in SINGLE_USE_SEGMENTS else -1,
             elements=elements
         )
     
+    def create_segment(self, seg_id: str, position: str = None) -> Optional[EDISegment]:
+        """Create a segment from definition"""
+        if seg_id not in self.segments:
+            return None
+        
+        return self._build_segment(seg_id, position, self.next_key)
+    
+    def _build_segment_list(self, seg_ids: Sequence[str]) -> List[EDISegment]:
+        """Create segments for the known ids, numbering positions 0100, 0200, ..."""
+        segments = []
+        for seg_id in seg_ids:
+            index = len(segments)
+            position = _POSITIONS[index] if index < len(_POSITIONS) else f'{(index + 1) * 100:04d}'
+            segment = self.create_segment(seg_id, position)
+            if segment:
+                segments.append(segment)
+        return segments
+    
     def create_profile(self, transaction_set: str, version: str, name: str = None) -> BoomiEDIProfile:
         """Create complete EDI profile for a transaction set"""
         
@@ -798,14 +895,9 @@ class BoomiEDIProfileConverter:
         ts_config = self.transaction_sets[transaction_set]
         
         # Create Header Loop
-        header_segments = []
-        position = 100
-        for seg_id in ['ST'] + [s for s in ts_config['header_segments'] if s != 'ST']:
-            if seg_id in self.segments:
-                segment = self.create_segment(seg_id, f'{position:04d}')
-                if segment:
-                    header_segments.append(segment)
-                    position += 100
+        header_segments = self._build_segment_list(
+            ['ST'] + [s for s in ts_config['header_segments'] if s != 'ST']
+        )
         
         header_loop = EDILoop(
             key=self.next_key(),
@@ -817,14 +909,7 @@ class BoomiEDIProfileConverter:
         
         # Add N1 Loop if applicable
         if ts_config.get('n1_loop', False):
-            n1_segments = []
-            n1_position = 100
-            for seg_id in ['N1', 'N2', 'N3', 'N4', 'PER', 'REF']:
-                if seg_id in self.segments:
-                    segment = self.create_segment(seg_id, f'{n1_position:04d}')
-                    if segment:
-                        n1_segments.append(segment)
-                        n1_position += 100
+            n1_segments = self._build_segment_list(['N1', 'N2', 'N3', 'N4', 'PER', 'REF'])
             
             if n1_segments:
                 n1_loop = EDILoop(
@@ -837,14 +922,7 @@ class BoomiEDIProfileConverter:
                 header_loop.child_loops.append(n1_loop)
         
         # Create Detail Loop
-        detail_segments = []
-        position = 100
-        for seg_id in ts_config['detail_segments']:
-            if seg_id in self.segments:
-                segment = self.create_segment(seg_id, f'{position:04d}')
-                if segment:
-                    detail_segments.append(segment)
-                    position += 100
+        detail_segments = self._build_segment_list(ts_config['detail_segments'])
         
         detail_loop = EDILoop(
             key=self.next_key(),
@@ -855,14 +933,7 @@ class BoomiEDIProfileConverter:
         )
         
         # Create Summary Loop
-        summary_segments = []
-        position = 100
-        for seg_id in ts_config['summary_segments']:
-            if seg_id in self.segments:
-                segment = self.create_segment(seg_id, f'{position:04d}')
-                if segment:
-                    summary_segments.append(segment)
-                    position += 100
+        summary_segments = self._build_segment_list(ts_config['summary_segments'])
         
         summary_loop = EDILoop(
             key=self.next_key(),
@@ -886,121 +957,150 @@ class BoomiEDIProfileConverter:
     
     def generate_data_format_xml(self, data_format: EDIDataFormat, indent: str) -> str:
         """Generate DataFormat XML"""
-        if not data_format:
-            return f"{indent}<DataFormat>\n{indent}  <ProfileCharacterFormat/>\n{indent}</DataFormat>"
-        
-        if data_format.format_type == 'date':
-            return f'{indent}<DataFormat>\n{indent}  <ProfileDateFormat dateFormat="{data_format.date_format}"/>\n{indent}</DataFormat>'
-        elif data_format.format_type == 'number':
-            signed = 'true' if data_format.signed_field else 'false'
-            fmt = data_format.number_format or '#.#'
-            return f'{indent}<DataFormat>\n{indent}  <ProfileNumberFormat numberFormat="{fmt}" signedField="{signed}"/>\n{indent}</DataFormat>'
-        else:
-            return f"{indent}<DataFormat>\n{indent}  <ProfileCharacterFormat/>\n{indent}</DataFormat>"
+        out: List[str] = []
+        self._emit_data_format_xml(data_format, indent, out)
+        return ''.join(out)
     
     def generate_element_xml(self, element: EDIDataElement, indent: str) -> str:
         """Generate EdiDataElement XML"""
-        
-        qualifier_xml = ""
-        if element.qualifier_list:
-            qualifier_xml = f'\n{indent}  <QualifierList codeList="{element.qualifier_list.code_list_id}"/>'
-        
-        data_format_xml = self.generate_data_format_xml(element.data_format, f"{indent}  ")
-        purpose = self.escape_xml(element.element_purpose)
-        
-        return f'''{indent}<EdiDataElement comments="{purpose}" dataType="{element.data_type.value}" elementPurpose="{purpose}" isMappable="true" isNode="true" key="{element.key}" mandatory="{str(element.mandatory).lower()}" maxLength="{element.max_length}" minLength="{element.min_length}" name="{element.name}" validateData="true">
-{data_format_xml}{qualifier_xml}
-{indent}</EdiDataElement>'''
+        out: List[str] = []
+        self._emit_element_xml(element, indent, out)
+        return ''.join(out)
     
     def generate_segment_xml(self, segment: EDISegment, indent: str) -> str:
         """Generate EdiSegment XML"""
-        
-        max_use = str(segment.max_use) if segment.max_use != -1 else "-1"
-        elements_xml = "\n".join([
-            self.generate_element_xml(elem, f"{indent}  ")
-            for elem in segment.elements
-        ])
-        
-        return f'''{indent}<EdiSegment isNode="true" key="{segment.key}" mandatory="{str(segment.mandatory).lower()}" maxUse="{max_use}" name="{segment.name}" position="{segment.position}" repeatAction="na" segmentName="{self.escape_xml(segment.segment_name)}">
-{elements_xml}
-{indent}</EdiSegment>'''
+        out: List[str] = []
+        self._emit_segment_xml(segment, indent, out)
+        return ''.join(out)
     
     def generate_loop_xml(self, loop: EDILoop, indent: str) -> str:
         """Generate EdiLoop XML"""
-        
+        out: List[str] = []
+        self._emit_loop_xml(loop, indent, out)
+        return ''.join(out)
+    
+    # The _emit_* methods append XML fragments to a shared output list which
+    # is joined once at the top level, instead of every nesting level
+    # building (and copying) its own intermediate string.
+    
+    def _emit_data_format_xml(self, data_format: EDIDataFormat, indent: str, out: List[str]):
+        """Append DataFormat XML to out"""
+        if data_format and data_format.format_type == 'date':
+            out.append(f'{indent}<DataFormat>\n{indent}  <ProfileDateFormat dateFormat="{data_format.date_format}"/>\n{indent}</DataFormat>')
+        elif data_format and data_format.format_type == 'number':
+            signed = _BOOL_STR[data_format.signed_field]
+            fmt = data_format.number_format or '#.#'
+            out.append(f'{indent}<DataFormat>\n{indent}  <ProfileNumberFormat numberFormat="{fmt}" signedField="{signed}"/>\n{indent}</DataFormat>')
+        else:
+            out.append(f"{indent}<DataFormat>\n{indent}  <ProfileCharacterFormat/>\n{indent}</DataFormat>")
+    
+    def _emit_element_xml(self, element: EDIDataElement, indent: str, out: List[str]):
+        """Append EdiDataElement XML to out"""
+        purpose = self.escape_xml(element.element_purpose)
+        out.append(f'{indent}<EdiDataElement comments="{purpose}" dataType="{element.data_type.value}" elementPurpose="{purpose}" isMappable="true" isNode="true" key="{element.key}" mandatory="{_BOOL_STR[element.mandatory]}" maxLength="{element.max_length}" minLength="{element.min_length}" name="{element.name}" validateData="true">\n')
+        self._emit_data_format_xml(element.data_format, f"{indent}  ", out)
+        if element.qualifier_list:
+            out.append(f'\n{indent}  <QualifierList codeList="{element.qualifier_list.code_list_id}"/>')
+        out.append(f'\n{indent}</EdiDataElement>')
+    
+    def _emit_segment_xml(self, segment: EDISegment, indent: str, out: List[str]):
+        """Append EdiSegment XML to out"""
+        max_use = str(segment.max_use) if segment.max_use != -1 else "-1"
+        out.append(f'{indent}<EdiSegment isNode="true" key="{segment.key}" mandatory="{_BOOL_STR[segment.mandatory]}" maxUse="{max_use}" name="{segment.name}" position="{segment.position}" repeatAction="na" segmentName="{self.escape_xml(segment.segment_name)}">\n')
+        child_indent = f"{indent}  "
+        for i, elem in enumerate(segment.elements):
+            if i:
+                out.append("\n")
+            self._emit_element_xml(elem, child_indent, out)
+        out.append(f'\n{indent}</EdiSegment>')
+    
+    def _emit_loop_xml(self, loop: EDILoop, indent: str, out: List[str]):
+        """Append EdiLoop XML to out"""
         loop_repeat = str(loop.loop_repeat) if loop.loop_repeat != -1 else "-1"
         
-        segments_xml = "\n".join([
-            self.generate_segment_xml(seg, f"{indent}  ")
-            for seg in loop.segments
-        ])
-        
-        child_loops_xml = ""
-        if loop.child_loops:
-            child_loops_xml = "\n" + "\n".join([
-                self.generate_loop_xml(child, f"{indent}  ")
-                for child in loop.child_loops
-            ])
-        
-        return f'''{indent}<EdiLoop isContainer="true" isNode="true" key="{loop.key}" loopId="{loop.loop_id}" loopRepeat="{loop_repeat}" loopingOption="{loop.looping_option}" name="{loop.name}">
-{segments_xml}{child_loops_xml}
-{indent}</EdiLoop>'''
+        out.append(f'{indent}<EdiLoop isContainer="true" isNode="true" key="{loop.key}" loopId="{loop.loop_id}" loopRepeat="{loop_repeat}" loopingOption="{loop.looping_option}" name="{loop.name}">\n')
+        child_indent = f"{indent}  "
+        for i, seg in enumerate(loop.segments):
+            if i:
+                out.append("\n")
+            self._emit_segment_xml(seg, child_indent, out)
+        for child in loop.child_loops:
+            out.append("\n")
+            self._emit_loop_xml(child, child_indent, out)
+        out.append(f'\n{indent}</EdiLoop>')
     
     def generate_profile_xml(self, profile: BoomiEDIProfile) -> str:
         """Generate complete Boomi EDI Profile XML"""
         
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        now = self._timestamp()
         
-        loops_xml = "\n".join([
-            self.generate_loop_xml(loop, "        ")
-            for loop in profile.loops
-        ])
+        out: List[str] = [_PROFILE_HEAD_TEMPLATE.format(
+            now=now,
+            name=self.escape_xml(profile.name),
+            strict=_BOOL_STR[profile.strict],
+            conditional_validation=_BOOL_STR[profile.conditional_validation],
+            standard=profile.standard.value,
+            file_type=profile.file_type,
+            file_delimiter=profile.file_delimiter,
+            segment_char=profile.segment_char,
+            isa_control_standard=profile.isa_control_standard,
+            isa_control_version=profile.isa_control_version,
+            version=profile.version,
+            transaction_func_id=profile.transaction_func_id,
+            transaction_set=profile.transaction_set,
+        )]
+        for i, loop in enumerate(profile.loops):
+            if i:
+                out.append("\n")
+            self._emit_loop_xml(loop, "        ", out)
+        out.append(_PROFILE_TAIL)
         
-        return f'''<?xml version="1.0" encoding="UTF-8"?><bns:Component xmlns:bns="http://api.platform.boomi.com/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" branchId="{DEFAULT_BRANCH_ID}" branchName="{DEFAULT_BRANCH_NAME}" createdBy="{DEFAULT_CREATED_BY}" createdDate="{now}" currentVersion="true" deleted="false" folderFullPath="{DEFAULT_FOLDER_FULL_PATH}" folderId="{DEFAULT_FOLDER_ID}" folderName="{DEFAULT_FOLDER_NAME}" modifiedBy="{DEFAULT_MODIFIED_BY}" modifiedDate="{now}" name="{self.escape_xml(profile.name)}" type="profile.edi" version="1">
-  <bns:encryptedValues/>
-  <bns:description>Converted from webMethods EDI Document Type</bns:description>
-  <bns:object>
-    <EdiProfile strict="{str(profile.strict).lower()}">
-      <ProfileProperties>
-        <EdiGeneralInfo conditionalValidationEnabled="{str(profile.conditional_validation).lower()}" standard="{profile.standard.value}"/>
-        <EdiFileOptions fileType="{profile.file_type}">
-          <EdiDelimitedOptions fileDelimiter="{profile.file_delimiter}" segmentchar="{profile.segment_char}"/>
-          <EdiDataOptions/>
-        </EdiFileOptions>
-        <EdiOptions>
-          <EdiX12Options isacontrolstandard="{profile.isa_control_standard}" isacontrolversion="{profile.isa_control_version}" stdversion="{profile.version}" tranfuncid="{profile.transaction_func_id}" transmission="{profile.transaction_set}"/>
-        </EdiOptions>
-      </ProfileProperties>
-      <DataElements>
-{loops_xml}
-      </DataElements>
-      <tagLists/>
-    </EdiProfile>
-  </bns:object>
-</bns:Component>'''
+        return ''.join(out)
     
-    def convert_webmethods_to_boomi_edi(self, service: Dict) -> str:
+    def build_profile(self, service: Dict, transaction_set: Optional[str] = None) -> BoomiEDIProfile:
         """
-        Main conversion function: Convert webMethods EDI document to Boomi EDI Profile
+        Build the in-memory EDI profile for a webMethods EDI document
         
         Args:
             service: Parsed webMethods service/document dict with fields, namespace, name
-            
-        Returns:
-            Complete Boomi EDI Profile XML
+            transaction_set: Already-detected transaction set (detected if omitted)
         """
         fields = service.get('fields', [])
         namespace = service.get('namespace', '')
         name = service.get('name', '')
         
         # Detect transaction set and version
-        transaction_set = self.detect_transaction_set(fields, namespace)
+        if transaction_set is None:
+            transaction_set = self.detect_transaction_set(fields, namespace)
         version = self.detect_version(fields, namespace)
         
-        # Create profile
-        profile = self.create_profile(transaction_set, version, name)
+        return self.create_profile(transaction_set, version, name)
+    
+    def count_profile_nodes(self, profile: BoomiEDIProfile) -> Tuple[int, int]:
+        """Count (segments, data elements) in a profile without rendering it"""
+        segment_count = 0
+        element_count = 0
+        stack = list(profile.loops)
+        while stack:
+            loop = stack.pop()
+            segment_count += len(loop.segments)
+            for segment in loop.segments:
+                element_count += len(segment.elements)
+            stack.extend(loop.child_loops)
+        return segment_count, element_count
+    
+    def convert_webmethods_to_boomi_edi(self, service: Dict, transaction_set: Optional[str] = None) -> str:
+        """
+        Main conversion function: Convert webMethods EDI document to Boomi EDI Profile
         
-        # Generate XML
+        Args:
+            service: Parsed webMethods service/document dict with fields, namespace, name
+            transaction_set: Already-detected transaction set (detected if omitted)
+            
+        Returns:
+            Complete Boomi EDI Profile XML
+        """
+        profile = self.build_profile(service, transaction_set)
         return self.generate_profile_xml(profile)
 
 
@@ -1037,11 +1137,11 @@ def convert_to_boomi_edi_profile(service: Dict) -> Dict[str, Any]:
     ts_name = ts_info.get('name', 'Unknown')
     
     # Generate profile XML
-    boomi_xml = converter.convert_webmethods_to_boomi_edi(service)
+    profile = converter.build_profile(service, transaction_set)
+    boomi_xml = converter.generate_profile_xml(profile)
     
     # Count elements
-    segment_count = boomi_xml.count('<EdiSegment')
-    element_count = boomi_xml.count('<EdiDataElement')
+    segment_count, element_count = converter.count_profile_nodes(profile)
     
     return {
         'boomiXml': boomi_xml,
@@ -1058,6 +1158,30 @@ def convert_to_boomi_edi_profile(service: Dict) -> Dict[str, Any]:
     }
 
 
+def convert_many(services: Iterable[Dict], workers: Optional[int] = None,
+                 chunksize: int = 32) -> List[Dict[str, Any]]:
+    """
+    Convert a batch of webMethods EDI documents in parallel
+    
+    Each document is independent, so the batch is spread over a process pool;
+    every worker lazily builds its own converter via get_edi_converter().
+    
+    Args:
+        services: Parsed webMethods documents/services
+        workers: Worker process count (defaults to CPU count)
+        chunksize: Documents sent to a worker per round trip
+        
+    Returns:
+        Conversion results in input order (see convert_to_boomi_edi_profile)
+    """
+    services = list(services)
+    if workers == 1 or len(services) <= 1:
+        return [convert_to_boomi_edi_profile(service) for service in services]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert_to_boomi_edi_profile, services, chunksize=chunksize))
+
+
 def is_edi_document(service: Dict) -> bool:
     """Check if a document type is an EDI document"""
     converter = get_edi_converter()
@@ -8,16 +8,76 @@ Boomi's exact expected format.
 Author: Jade Global Migration Accelerator
 """
 
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any, Optional, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, BinaryIO
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-import re
+from functools import lru_cache
 import json
+import os
+import re
+import time
+from xml.sax.saxutils import escape
+
+# Prefer the C-backed lxml parser; fall back to the stdlib tree if missing.
+# Both expose fromstring/find/findall, Element/SubElement/tostring and a
+# ParseError base class.
+try:
+    from lxml import etree as ET
+    _LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _LXML = False
+
+
+def _parse_xml(content: Union[str, bytes]) -> "ET.Element":
+    """Parse an XML document given as text or bytes"""
+    # lxml rejects str input that carries an encoding declaration
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if _LXML:
+        # lxml parser objects are not thread-safe, so every call gets its own
+        return ET.fromstring(content, ET.XMLParser(resolve_entities=False))
+    return ET.fromstring(content)
+
+
+# node.ndf input: the document itself (text or bytes), a path-like object
+# (e.g. pathlib.Path; a plain str is always document text) or a binary file
+# object
+NdfSource = Union[str, bytes, "os.PathLike[str]", BinaryIO]
+
+
+def _ndf_stream(source: NdfSource):
+    """Turn a path or file NdfSource into something iterparse reads incrementally"""
+    if isinstance(source, os.PathLike):
+        return os.fspath(source)
+    return source
+
+
+# XML Schema namespace, in the {uri} form parsed tags carry
+XSD_NS = "http://www.w3.org/2001/XMLSchema"
+_XSD = f"{{{XSD_NS}}}"
 
 
-@dataclass
+def _safe_int(text: str, default: int = 0) -> int:
+    """int(text), or default if text is not an integer"""
+    if text.isdecimal():
+        return int(text)
+    try:
+        return int(text)
+    except ValueError:
+        return default
+
+
+def _iterparse(source, events: Tuple[str, ...]):
+    """Incrementally parse an XML stream, yielding (event, element) pairs"""
+    if _LXML:
+        return ET.iterparse(source, events=events, resolve_entities=False)
+    return ET.iterparse(source, events=events)
+
+
+@dataclass(slots=True)
 class BoomiDeploymentConfig:
     """Configuration for Boomi component deployment"""
     folder_id: str = "Rjo3NTQ1MTg0"
@@ -36,7 +96,7 @@ class BoomiDataType(Enum):
     DATETIME = "datetime"
 
 
-@dataclass
+@dataclass(slots=True)
 class XMLElementDef:
     """Definition of an XML element for Boomi profile"""
     name: str
@@ -54,7 +114,7 @@ class XMLElementDef:
     attributes: List['XMLElementDef'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XMLNamespaceDef:
     """Definition of an XML namespace"""
     key: int
@@ -94,6 +154,12 @@ class WebMethodsDocTypeParser:
         "java.lang.boolean": BoomiDataType.CHARACTER,
     }
     
+    # XSD model groups whose element children make up a content model
+    XSD_MODEL_GROUPS = (f"{_XSD}sequence", f"{_XSD}all", f"{_XSD}choice")
+    
+    # node.ndf <value> names that may carry the document name, by priority
+    DOC_NAME_VALUES = ("node_nsName", "svc_name", "name")
+    
     # Common date formats
     DATE_FORMATS = {
         "date": "yyyy-MM-dd",
@@ -101,10 +167,14 @@ class WebMethodsDocTypeParser:
         "timestamp": "yyyy-MM-dd'T'HH:mm:ss.SSS'Z'",
     }
     
-    def parse_node_ndf(self, content: str) -> Tuple[XMLElementDef, Dict[str, Any]]:
+    def parse_node_ndf(self, content: NdfSource) -> Tuple[XMLElementDef, Dict[str, Any]]:
         """
         Parse webMethods node.ndf content and return root XMLElementDef.
         
+        content may also be a path or binary file object; it is then read
+        incrementally and never held in memory as a whole. In-memory
+        content is parsed in one go, which is faster.
+        
         Returns:
             Tuple of (root_element, metadata)
         """
@@ -117,13 +187,12 @@ class WebMethodsDocTypeParser:
         }
         
         try:
-            root = ET.fromstring(content)
-            
-            # Extract document name from the content
-            doc_name = self._extract_doc_name(root)
-            
-            # Parse the rec_fields array to get field definitions
-            fields = self._parse_rec_fields(root)
+            if isinstance(content, (str, bytes)):
+                doc_name, fields = self._read_node_ndf(_parse_xml(content))
+            else:
+                # Stream the document: name values and field records are picked
+                # up as they complete instead of building the whole tree first
+                doc_name, fields = self._stream_node_ndf(content)
             
             metadata["field_count"] = len(fields)
             
@@ -154,92 +223,140 @@ class WebMethodsDocTypeParser:
                 max_occurs=1
             ), {"error": str(e), **metadata}
     
-    def _extract_doc_name(self, root: ET.Element) -> str:
-        """Extract document name from node.ndf"""
+    def _read_node_ndf(self, root: ET.Element) -> Tuple[str, List[XMLElementDef]]:
+        """Extract document name and field definitions from a parsed node.ndf"""
+        name_values: Dict[str, Optional[str]] = {}
+        for value in root.iter("value"):
+            # Remember the first occurrence of each candidate name value
+            key = value.get("name")
+            if key in self.DOC_NAME_VALUES and key not in name_values:
+                name_values[key] = value.text
+        
+        fields: List[XMLElementDef] = []
+        for array_elem in root.iter("array"):
+            if array_elem.get("name") == "rec_fields":
+                self._parse_records(array_elem.findall("record"), fields)
+                break
+        
+        return self._doc_name_from_values(name_values), fields
+    
+    def _stream_node_ndf(self, content: NdfSource) -> Tuple[str, List[XMLElementDef]]:
+        """
+        Extract document name and field definitions from node.ndf via iterparse.
+        
+        Each record of the top-level rec_fields array is parsed as soon as its
+        end tag is seen and then discarded, so peak memory is bounded by the
+        largest single field record rather than the whole document.
+        """
+        fields: List[XMLElementDef] = []
+        name_values: Dict[str, Optional[str]] = {}
+        path: List[Any] = []   # open ancestors of the current element
+        rec_fields = None      # the top-level rec_fields array while open
+        rec_fields_seen = False
+        
+        for event, elem in _iterparse(_ndf_stream(content), ("start", "end")):
+            if event == "start":
+                if (not rec_fields_seen and elem.tag == "array"
+                        and elem.get("name") == "rec_fields"):
+                    rec_fields = elem
+                    rec_fields_seen = True
+                path.append(elem)
+                continue
+            
+            path.pop()
+            if elem.tag == "value":
+                # Remember the first occurrence of each candidate name value
+                key = elem.get("name")
+                if key in self.DOC_NAME_VALUES and key not in name_values:
+                    name_values[key] = elem.text
+            elif elem.tag == "record" and path and path[-1] is rec_fields:
+                self._parse_records([elem], fields)
+                # Drop the parsed record and everything before it
+                elem.clear()
+                del rec_fields[:-1]
+            elif elem is rec_fields:
+                rec_fields = None
+        
+        return self._doc_name_from_values(name_values), fields
+    
+    def _doc_name_from_values(self, name_values: Dict[str, Optional[str]]) -> str:
+        """Pick the document name from the node.ndf name values"""
         # Try different locations where name might be stored
-        name_elem = root.find(".//value[@name='node_nsName']")
-        if name_elem is not None and name_elem.text:
+        node_ns_name = name_values.get("node_nsName")
+        if node_ns_name:
             # Extract just the document name from namespace path
-            parts = name_elem.text.split("/")
+            parts = node_ns_name.split("/")
             return parts[-1] if parts else "Document"
         
-        name_elem = root.find(".//value[@name='svc_name']")
-        if name_elem is not None and name_elem.text:
-            return name_elem.text
+        if name_values.get("svc_name"):
+            return name_values["svc_name"]
         
-        name_elem = root.find(".//value[@name='name']")
-        if name_elem is not None and name_elem.text:
-            return name_elem.text
+        if name_values.get("name"):
+            return name_values["name"]
         
         return "Document"
     
-    def _parse_rec_fields(self, root: ET.Element) -> List[XMLElementDef]:
-        """Parse rec_fields array from node.ndf"""
-        fields = []
-        
-        rec_fields = root.find(".//array[@name='rec_fields']")
-        if rec_fields is None:
-            return fields
-        
-        for record in rec_fields.findall("record"):
-            field_def = self._parse_field_record(record)
-            if field_def:
-                fields.append(field_def)
+    def _parse_field_record(self, record: ET.Element) -> Optional[XMLElementDef]:
+        """Parse a single field record (and its nested records) from rec_fields"""
+        parsed: List[XMLElementDef] = []
+        self._parse_records([record], parsed)
+        return parsed[0] if parsed else None
+    
+    def _parse_records(self, records: List[ET.Element], target: List[XMLElementDef]):
+        """
+        Parse field records into target, walking nested rec_fields with an
+        explicit work stack rather than recursion.
+        """
+        # Each entry is (record, list its XMLElementDef is appended to);
+        # siblings are pushed in reverse so they are appended in order.
+        stack = [(record, target) for record in reversed(records)]
         
-        return fields
+        while stack:
+            record, siblings = stack.pop()
+            field_name, field_type, field_dim = self._read_field_values(record)
+            
+            if not field_name:
+                continue
+            
+            # Determine Boomi data type (and date format if datetime)
+            boomi_type, date_format = _resolve_wm_type(field_type)
+            
+            # Create XMLElementDef
+            field_def = XMLElementDef(
+                name=field_name,
+                data_type=boomi_type,
+                min_occurs=0 if field_dim >= 0 else 1,  # Arrays are optional by default
+                max_occurs=-1 if field_dim > 0 else 1,  # -1 for unbounded arrays
+                looping_option="unique" if field_dim > 0 else "",
+                validate_data=field_dim == 0,  # Don't validate arrays
+                date_format=date_format,
+                children=[]
+            )
+            siblings.append(field_def)
+            
+            # Queue nested fields for record types
+            nested_fields = record.find("array[@name='rec_fields']")
+            if nested_fields is not None:
+                for nested_record in reversed(nested_fields.findall("record")):
+                    stack.append((nested_record, field_def.children))
     
-    def _parse_field_record(self, record: ET.Element) -> Optional[XMLElementDef]:
-        """Parse a single field record from rec_fields"""
+    def _read_field_values(self, record: ET.Element) -> Tuple[str, str, int]:
+        """Extract (field_name, raw field_type, field_dim) from a field record"""
         field_name = ""
         field_type = "string"
         field_dim = 0  # 0 = scalar, 1 = array
-        children = []
         
-        # Extract field properties
-        for value in record.findall("value"):
-            name = value.get("name", "")
-            text = value.text or ""
+        for value in record.iterfind("value"):
+            name = value.get("name")
             
             if name == "field_name":
-                field_name = text
+                field_name = value.text or ""
             elif name == "field_type":
-                field_type = text.lower()
+                field_type = value.text or ""
             elif name == "field_dim":
-                try:
-                    field_dim = int(text)
-                except ValueError:
-                    field_dim = 0
-        
-        if not field_name:
-            return None
-        
-        # Parse nested fields for record types
-        nested_fields = record.find("array[@name='rec_fields']")
-        if nested_fields is not None:
-            for nested_record in nested_fields.findall("record"):
-                child = self._parse_field_record(nested_record)
-                if child:
-                    children.append(child)
-        
-        # Determine Boomi data type
-        boomi_type = self.WMTYPE_TO_BOOMI.get(field_type, BoomiDataType.CHARACTER)
-        
-        # Determine date format if datetime
-        date_format = ""
-        if boomi_type == BoomiDataType.DATETIME:
-            date_format = self.DATE_FORMATS.get("datetime", "yyyy-MM-dd'T'HH:mm:ss")
-        
-        # Create XMLElementDef
-        return XMLElementDef(
-            name=field_name,
-            data_type=boomi_type,
-            min_occurs=0 if field_dim >= 0 else 1,  # Arrays are optional by default
-            max_occurs=-1 if field_dim > 0 else 1,  # -1 for unbounded arrays
-            looping_option="unique" if field_dim > 0 else "",
-            validate_data=field_dim == 0,  # Don't validate arrays
-            date_format=date_format,
-            children=children
-        )
+                field_dim = _safe_int(value.text or "")
+        
+        return field_name, field_type, field_dim
     
     def parse_from_xsd(self, xsd_content: str) -> Tuple[XMLElementDef, Dict[str, Any]]:
         """Parse an XSD schema and convert to XMLElementDef hierarchy"""
@@ -252,21 +369,17 @@ class WebMethodsDocTypeParser:
         }
         
         try:
-            # Remove namespace prefixes for easier parsing
-            xsd_content = re.sub(r'xmlns[^=]*="[^"]*"', '', xsd_content)
-            xsd_content = re.sub(r'</?xs:', '</', xsd_content).replace('</', '<')
-            
-            root = ET.fromstring(xsd_content)
+            root = _parse_xml(xsd_content)
             
             # Find the root element
-            root_elem = root.find(".//element")
+            root_elem = root.find(f".//{_XSD}element")
             if root_elem is None:
                 return XMLElementDef(name="Root"), metadata
             
             root_name = root_elem.get("name", "Root")
-            children = self._parse_xsd_complex_type(root_elem)
+            children, field_count = self._parse_xsd_tree(root_elem)
             
-            metadata["field_count"] = self._count_elements(children)
+            metadata["field_count"] = field_count
             
             return XMLElementDef(
                 name=root_name,
@@ -281,46 +394,294 @@ class WebMethodsDocTypeParser:
     
     def _parse_xsd_complex_type(self, elem: ET.Element) -> List[XMLElementDef]:
         """Parse XSD complexType children"""
-        children = []
-        
-        # Look for sequence/all/choice
-        for container in elem.findall(".//*"):
-            if container.tag in ["sequence", "all", "choice"]:
-                for child in container.findall("element"):
-                    name = child.get("name", "")
-                    if name:
-                        xsd_type = child.get("type", "string").lower()
-                        min_occurs = int(child.get("minOccurs", "1"))
-                        max_occurs_str = child.get("maxOccurs", "1")
-                        max_occurs = -1 if max_occurs_str == "unbounded" else int(max_occurs_str)
-                        
-                        # Determine data type
-                        if "int" in xsd_type or "decimal" in xsd_type or "float" in xsd_type:
-                            data_type = BoomiDataType.NUMBER
-                        elif "date" in xsd_type or "time" in xsd_type:
-                            data_type = BoomiDataType.DATETIME
-                        else:
-                            data_type = BoomiDataType.CHARACTER
-                        
-                        nested = self._parse_xsd_complex_type(child)
-                        
-                        children.append(XMLElementDef(
-                            name=name,
-                            data_type=data_type,
-                            min_occurs=min_occurs,
-                            max_occurs=max_occurs,
-                            looping_option="unique" if max_occurs == -1 else "",
-                            children=nested
-                        ))
-        
-        return children
-    
-    def _count_elements(self, elements: List[XMLElementDef]) -> int:
-        """Count total elements including nested"""
-        count = len(elements)
-        for elem in elements:
-            count += self._count_elements(elem.children)
-        return count
+        return self._parse_xsd_tree(elem)[0]
+    
+    def _parse_xsd_tree(self, elem: ET.Element) -> Tuple[List[XMLElementDef], int]:
+        """
+        Parse XSD complexType children, returning them with the total number
+        of element definitions created (counted while building, so no second
+        walk over the tree is needed).
+        """
+        children: List[XMLElementDef] = []
+        count = 0
+        
+        # Explicit work stack of (schema element, list its children go into)
+        stack = [(elem, children)]
+        while stack:
+            current, target = stack.pop()
+            
+            for child in self._xsd_child_elements(current):
+                name = child.get("name", "")
+                if name:
+                    xsd_type = child.get("type", "string")
+                    min_occurs = int(child.get("minOccurs", "1"))
+                    max_occurs_str = child.get("maxOccurs", "1")
+                    max_occurs = -1 if max_occurs_str == "unbounded" else int(max_occurs_str)
+                    
+                    # Determine data type from the type's local name
+                    data_type = _XSD_TYPE_MAP.get(
+                        xsd_type.rpartition(":")[2], BoomiDataType.CHARACTER
+                    )
+                    
+                    child_def = XMLElementDef(
+                        name=name,
+                        data_type=data_type,
+                        min_occurs=min_occurs,
+                        max_occurs=max_occurs,
+                        looping_option="unique" if max_occurs == -1 else "",
+                        children=[]
+                    )
+                    target.append(child_def)
+                    count += 1
+                    stack.append((child, child_def.children))
+        
+        return children, count
+    
+    def _xsd_child_elements(self, elem: ET.Element) -> List[ET.Element]:
+        """
+        Return the element declarations of elem's own content model.
+        
+        Only sequence/all/choice groups directly under elem (or under its
+        inline complexType) are followed, including nested groups, but never
+        into another element's declaration - so each schema node is visited
+        once instead of rescanning every descendant at each level.
+        """
+        groups = self.XSD_MODEL_GROUPS
+        element_tag = f"{_XSD}element"
+        top: List[ET.Element] = []
+        for node in elem:
+            if node.tag in groups:
+                top.append(node)
+            elif node.tag == f"{_XSD}complexType":
+                top.extend(g for g in node if g.tag in groups)
+        
+        declarations = []
+        pending = list(reversed(top))
+        while pending:
+            node = pending.pop()
+            if node.tag == element_tag:
+                declarations.append(node)
+            else:
+                pending.extend(reversed([c for c in node if c.tag == element_tag or c.tag in groups]))
+        return declarations
+
+
+# (Boomi data type, date format) per lower-cased webMethods field type
+_WM_TYPE_INFO: Dict[str, Tuple[BoomiDataType, str]] = {
+    wm_type: (
+        boomi_type,
+        WebMethodsDocTypeParser.DATE_FORMATS.get("datetime", "yyyy-MM-dd'T'HH:mm:ss")
+        if boomi_type == BoomiDataType.DATETIME else ""
+    )
+    for wm_type, boomi_type in WebMethodsDocTypeParser.WMTYPE_TO_BOOMI.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _resolve_wm_type(field_type: str) -> Tuple[BoomiDataType, str]:
+    """Map a raw (any case) webMethods field type to (Boomi data type, date format)"""
+    return _WM_TYPE_INFO.get(field_type.lower(), (BoomiDataType.CHARACTER, ""))
+
+
+# Boomi data type per XSD built-in simple type (local name); anything else
+# (string types, user-defined types) is character data
+_XSD_TYPE_MAP: Dict[str, BoomiDataType] = {
+    **dict.fromkeys((
+        "int", "integer", "long", "short", "byte", "decimal", "float", "double",
+        "unsignedInt", "unsignedLong", "unsignedShort", "unsignedByte",
+        "positiveInteger", "negativeInteger", "nonPositiveInteger", "nonNegativeInteger",
+    ), BoomiDataType.NUMBER),
+    **dict.fromkeys((
+        "date", "dateTime", "dateTimeStamp", "time",
+    ), BoomiDataType.DATETIME),
+}
+
+
+# Attribute values also need quotes and whitespace characters escaped
+_ATTR_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'}
+_XML_SPECIAL_CHARS = re.compile(r'[&<>"\n\r\t]')
+
+
+def _escape_xml(text: Any) -> str:
+    """Escape a value for use as XML text or a double-quoted attribute"""
+    if text is None:
+        return ""
+    text = str(text)
+    # Identifier-like names (the common case) need no escaping at all
+    if not _XML_SPECIAL_CHARS.search(text):
+        return text
+    return escape(text, _ATTR_ENTITIES)
+
+
+@lru_cache(maxsize=64)
+def _data_format(data_type: BoomiDataType, date_format: str, number_format: str) -> str:
+    """The Profile*Format tag that goes inside DataFormat, cached across profiles"""
+    if data_type == BoomiDataType.DATETIME:
+        date_format = _escape_xml(date_format or "yyyy-MM-dd'T'HH:mm:ss")
+        return f'<ProfileDateFormat dateFormat="{date_format}"/>'
+    elif data_type == BoomiDataType.NUMBER:
+        return f'<ProfileNumberFormat numberFormat="{_escape_xml(number_format or "")}"/>'
+    return '<ProfileCharacterFormat/>'
+
+
+@lru_cache(maxsize=32)
+def _component_attrs(
+    branch_id: str,
+    branch_name: str,
+    created_by: str,
+    folder_full_path: str,
+    folder_id: str,
+    folder_name: str,
+    modified_by: str,
+) -> Tuple[str, str]:
+    """
+    Escaped bns:Component attributes of a deployment config, split around
+    createdDate: (attributes before it, attributes between it and modifiedDate)
+    """
+    return (
+        f'branchId="{_escape_xml(branch_id)}" branchName="{_escape_xml(branch_name)}" '
+        f'createdBy="{_escape_xml(created_by)}"',
+        f'currentVersion="true" deleted="false" folderFullPath="{_escape_xml(folder_full_path)}" '
+        f'folderId="{_escape_xml(folder_id)}" folderName="{_escape_xml(folder_name)}" '
+        f'modifiedBy="{_escape_xml(modified_by)}"',
+    )
+
+
+# Open-tag templates for XMLElement / XMLAttribute, filled with a single
+# %-format per node
+_ELEMENT_OPEN_TAG = (
+    '%s<XMLElement dataType="%s" isMappable="true" isNode="true" key="%s" '
+    '%smaxOccurs="%s" minOccurs="%s" name="%s" typeExpanded="false" '
+    'typeKey="%s" useNamespace="%s"%s>\n'
+)
+_ATTRIBUTE_OPEN_TAG = (
+    '%s<XMLAttribute dataType="%s" isMappable="true" isNode="true" key="%s" '
+    'name="%s" useNamespace="%s">\n'
+)
+
+
+# Element keys as strings, precomputed for all but very large profiles
+_KEY_STRS_SIZE = 8192
+_KEY_STRS: List[str] = [str(i) for i in range(_KEY_STRS_SIZE)]
+
+# Emitted XMLElement XML by (first key, indent, structural fingerprint), in
+# least-recently-used order (dicts keep insertion order)
+_ELEMENT_XML_CACHE: Dict[Tuple, str] = {}
+_ELEMENT_XML_CACHE_SIZE = 64
+
+# (epoch second, formatted UTC timestamp) of the last _utcnow_string call
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _utcnow_string() -> str:
+    """Current UTC time for Boomi, formatted at most once per second"""
+    global _TS_CACHE
+    second = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] == second:
+        return cached[1]
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+    _TS_CACHE = (second, stamp)
+    return stamp
+
+
+
+class XMLProfileArrays:
+    """
+    Struct-of-arrays view of an XMLElementDef tree, used for emission.
+    
+    Nodes are stored in document (pre-order) order as parallel columns, with
+    each element's attributes placed directly after it. Nesting is recovered
+    from the depth column, so emission is a single linear scan instead of a
+    pointer-chasing walk over node objects. Names are escaped once here and
+    DataFormat tags are deduplicated into a small pool referenced by index.
+    """
+    
+    ELEMENT = 0
+    ATTRIBUTE = 1
+    
+    __slots__ = (
+        "kinds", "depths", "names", "data_types", "min_occurs", "max_occurs",
+        "looping_options", "validate_data", "type_keys", "namespace_keys",
+        "format_idx", "formats",
+    )
+    
+    def __init__(self):
+        self.kinds = array("b")
+        self.depths = array("i")
+        self.names: List[str] = []
+        self.data_types: List[str] = []
+        self.min_occurs: List[int] = []
+        self.max_occurs: List[int] = []
+        self.looping_options: List[str] = []
+        self.validate_data: List[bool] = []
+        self.type_keys: List[int] = []
+        self.namespace_keys: List[int] = []
+        self.format_idx = array("i")
+        self.formats: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.kinds)
+    
+    def fingerprint(self) -> Tuple:
+        """Hashable key that is equal for structurally identical trees"""
+        return (
+            self.kinds.tobytes(),
+            self.depths.tobytes(),
+            tuple(self.names),
+            tuple(self.data_types),
+            tuple(self.min_occurs),
+            tuple(self.max_occurs),
+            tuple(self.looping_options),
+            tuple(self.validate_data),
+            tuple(self.type_keys),
+            tuple(self.namespace_keys),
+            self.format_idx.tobytes(),
+            tuple(self.formats),
+        )
+    
+    @classmethod
+    def from_tree(cls, root: XMLElementDef) -> "XMLProfileArrays":
+        """Flatten an XMLElementDef tree (AoS) into columns"""
+        arrays = cls()
+        format_pool: Dict[Tuple[BoomiDataType, str, str], int] = {}
+        
+        stack = [(root, 0)]
+        while stack:
+            element, depth = stack.pop()
+            arrays._append(cls.ELEMENT, element, depth, format_pool)
+            for attr in element.attributes:
+                arrays._append(cls.ATTRIBUTE, attr, depth + 1, format_pool)
+            for child in reversed(element.children):
+                stack.append((child, depth + 1))
+        
+        return arrays
+    
+    def _append(
+        self,
+        kind: int,
+        node: XMLElementDef,
+        depth: int,
+        format_pool: Dict[Tuple[BoomiDataType, str, str], int],
+    ):
+        """Append one node as a row"""
+        format_args = (node.data_type, node.date_format, node.number_format)
+        index = format_pool.get(format_args)
+        if index is None:
+            index = format_pool[format_args] = len(self.formats)
+            self.formats.append(_data_format(*format_args))
+        
+        self.kinds.append(kind)
+        self.depths.append(depth)
+        self.names.append(_escape_xml(node.name))
+        self.data_types.append(node.data_type.value)
+        self.min_occurs.append(node.min_occurs)
+        self.max_occurs.append(node.max_occurs)
+        self.looping_options.append(_escape_xml(node.looping_option))
+        self.validate_data.append(node.validate_data)
+        self.type_keys.append(node.type_key)
+        self.namespace_keys.append(node.namespace_key)
+        self.format_idx.append(index)
 
 
 class BoomiXMLProfileGenerator:
@@ -354,22 +715,12 @@ class BoomiXMLProfileGenerator:
     def _next_key(self) -> str:
         """Generate next unique key for XML elements"""
         self.key_counter += 1
-        return str(self.key_counter)
-    
-    def _escape_xml(self, text: str) -> str:
-        """Escape XML special characters"""
-        if text is None:
-            return ""
-        return (str(text)
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&apos;'))
+        key = self.key_counter
+        return _KEY_STRS[key] if key < _KEY_STRS_SIZE else str(key)
     
     def _format_datetime(self) -> str:
         """Format current datetime for Boomi"""
-        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return _utcnow_string()
     
     def generate_profile(
         self,
@@ -392,12 +743,22 @@ class BoomiXMLProfileGenerator:
         """
         self.key_counter = 0
         now = self._format_datetime()
+        config = self.config
+        before_created, before_modified = _component_attrs(
+            config.branch_id,
+            config.branch_name,
+            config.created_by,
+            config.folder_full_path,
+            config.folder_id,
+            config.folder_name,
+            config.modified_by,
+        )
         
-        # Build the XML
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Component xmlns:bns="http://api.platform.boomi.com/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" branchId="{self.config.branch_id}" branchName="{self.config.branch_name}" createdBy="{self.config.created_by}" createdDate="{now}" currentVersion="true" deleted="false" folderFullPath="{self.config.folder_full_path}" folderId="{self.config.folder_id}" folderName="{self.config.folder_name}" modifiedBy="{self.config.modified_by}" modifiedDate="{now}" name="{self._escape_xml(name)}" type="profile.xml" version="1">
+        # All fragments are appended to one buffer and joined once at the end
+        buf: List[str] = [f'''<?xml version="1.0" encoding="UTF-8"?>
+<bns:Component xmlns:bns="http://api.platform.boomi.com/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" {before_created} createdDate="{now}" {before_modified} modifiedDate="{now}" name="{_escape_xml(name)}" type="profile.xml" version="1">
   <bns:encryptedValues/>
-  <bns:description>{self._escape_xml(description)}</bns:description>
+  <bns:description>{_escape_xml(description)}</bns:description>
   <bns:object>
     <XMLProfile modelVersion="2" strict="true">
       <ProfileProperties>
@@ -405,138 +766,123 @@ class BoomiXMLProfileGenerator:
         <XMLOptions encoding="utf8" implicitElementOrdering="true" parseRespectMaxOccurs="true" respectMinOccurs="false" respectMinOccursAlways="false"/>
       </ProfileProperties>
       <DataElements>
-'''
+''']
         
         # Generate root element and all children
-        xml += self._generate_element_xml(root_element, indent=8)
+        self._emit_element(root_element, buf)
         
-        xml += '''      </DataElements>
+        buf.append('''      </DataElements>
       <Namespaces>
-'''
+''')
         
         # Generate namespace declarations
         if namespaces:
             for ns in namespaces:
-                xml += f'''        <XMLNamespace key="{ns.key}" name="{self._escape_xml(ns.name)}" prefix="{ns.prefix}">
-          <Types>
-          </Types>
+                buf.append(f'''        <XMLNamespace key="{ns.key}" name="{_escape_xml(ns.name)}" prefix="{_escape_xml(ns.prefix)}">
+          <Types/>
         </XMLNamespace>
-'''
+''')
         else:
             # Default empty namespace
-            xml += '''        <XMLNamespace key="-1" name="Empty Namespace" prefix="ns1">
-          <Types>
-          </Types>
+            buf.append('''        <XMLNamespace key="-1" name="Empty Namespace" prefix="ns1">
+          <Types/>
         </XMLNamespace>
-'''
+''')
         
-        xml += '''      </Namespaces>
+        buf.append('''      </Namespaces>
       <tagLists/>
     </XMLProfile>
   </bns:object>
-</bns:Component>'''
-        
-        return xml
-    
-    def _generate_element_xml(self, element: XMLElementDef, indent: int = 8) -> str:
-        """Generate XMLElement XML for a single element and its children"""
-        ind = ' ' * indent
-        key = self._next_key()
-        
-        # Build attributes
-        attrs = []
-        attrs.append(f'dataType="{element.data_type.value}"')
-        attrs.append('isMappable="true"')
-        attrs.append('isNode="true"')
-        attrs.append(f'key="{key}"')
-        
-        # Handle looping option for arrays
-        if element.looping_option:
-            attrs.append(f'loopingOption="{element.looping_option}"')
-        
-        # Max/Min occurs
-        max_occurs_str = "-1" if element.max_occurs == -1 else str(element.max_occurs)
-        attrs.append(f'maxOccurs="{max_occurs_str}"')
-        attrs.append(f'minOccurs="{element.min_occurs}"')
-        attrs.append(f'name="{self._escape_xml(element.name)}"')
-        attrs.append('typeExpanded="false"')
-        attrs.append(f'typeKey="{element.type_key}"')
-        attrs.append(f'useNamespace="{element.namespace_key}"')
-        
-        # Validate data (false for arrays typically)
-        if not element.validate_data:
-            attrs.append('validateData="false"')
-        
-        attrs_str = ' '.join(attrs)
-        
-        # Check if element has children
-        has_children = bool(element.children) or bool(element.attributes)
-        
-        if has_children:
-            xml = f'{ind}<XMLElement {attrs_str}>\n'
-            
-            # Add DataFormat
-            xml += self._generate_data_format(element, indent + 2)
-            
-            # Add attributes first
-            for attr in element.attributes:
-                xml += self._generate_attribute_xml(attr, indent + 2)
-            
-            # Add child elements
-            for child in element.children:
-                xml += self._generate_element_xml(child, indent + 2)
-            
-            xml += f'{ind}</XMLElement>\n'
-        else:
-            xml = f'{ind}<XMLElement {attrs_str}>\n'
-            xml += self._generate_data_format(element, indent + 2)
-            xml += f'{ind}</XMLElement>\n'
+</bns:Component>''')
         
-        return xml
+        return ''.join(buf)
     
-    def _generate_attribute_xml(self, attr: XMLElementDef, indent: int) -> str:
-        """Generate XMLAttribute XML"""
-        ind = ' ' * indent
-        key = self._next_key()
-        
-        attrs = []
-        attrs.append(f'dataType="{attr.data_type.value}"')
-        attrs.append('isMappable="true"')
-        attrs.append('isNode="true"')
-        attrs.append(f'key="{key}"')
-        attrs.append(f'name="{self._escape_xml(attr.name)}"')
-        attrs.append(f'useNamespace="{attr.namespace_key}"')
-        
-        attrs_str = ' '.join(attrs)
+    def _emit_element(self, element: XMLElementDef, buf: List[str], indent: int = 8):
+        """
+        Append XMLElement XML for an element and all its descendants to buf.
         
-        xml = f'{ind}<XMLAttribute {attrs_str}>\n'
-        xml += self._generate_data_format(attr, indent + 2)
-        xml += f'{ind}</XMLAttribute>\n'
+        The emitted string is cached by structural fingerprint (and starting
+        key and indent), so repeated conversions of the same document type
+        reuse it as is.
+        """
+        arrays = XMLProfileArrays.from_tree(element)
+        cache_key = (self.key_counter, indent, arrays.fingerprint())
         
-        return xml
+        xml = _ELEMENT_XML_CACHE.pop(cache_key, None)
+        if xml is None:
+            out: List[str] = []
+            self._emit_arrays(arrays, out, indent)
+            xml = ''.join(out)
+            if len(_ELEMENT_XML_CACHE) >= _ELEMENT_XML_CACHE_SIZE:
+                # Evict the least recently used entry
+                del _ELEMENT_XML_CACHE[next(iter(_ELEMENT_XML_CACHE))]
+        else:
+            self.key_counter += len(arrays)
+        _ELEMENT_XML_CACHE[cache_key] = xml
+        buf.append(xml)
     
-    def _generate_data_format(self, element: XMLElementDef, indent: int) -> str:
-        """Generate DataFormat XML based on data type"""
-        ind = ' ' * indent
+    def _emit_arrays(self, arrays: XMLProfileArrays, buf: List[str], indent: int = 8):
+        """
+        Append XML for a flattened profile tree to buf.
         
-        xml = f'{ind}<DataFormat>\n'
+        Rows are visited in document order; an XMLElement stays open until a
+        row at the same or a shallower depth (or the end) is reached.
+        """
+        kinds = arrays.kinds
+        depths = arrays.depths
+        names = arrays.names
+        data_types = arrays.data_types
+        formats = arrays.formats
+        format_idx = arrays.format_idx
         
-        if element.data_type == BoomiDataType.DATETIME:
-            date_format = element.date_format or "yyyy-MM-dd'T'HH:mm:ss"
-            xml += f'{ind}  <ProfileDateFormat dateFormat="{date_format}"/>\n'
-        elif element.data_type == BoomiDataType.NUMBER:
-            number_format = element.number_format or ""
-            xml += f'{ind}  <ProfileNumberFormat numberFormat="{number_format}"/>\n'
+        # Rows take consecutive keys, so they are handed out as one slice
+        first = self.key_counter + 1
+        end = first + len(kinds)
+        self.key_counter = end - 1
+        if end <= _KEY_STRS_SIZE:
+            keys = _KEY_STRS[first:end]
         else:
-            xml += f'{ind}  <ProfileCharacterFormat/>\n'
+            keys = [str(key) for key in range(first, end)]
         
-        xml += f'{ind}</DataFormat>\n'
+        open_depths: List[int] = []
+        for i in range(len(kinds)):
+            depth = depths[i]
+            ind = ' ' * (indent + 2 * depth)
+            
+            if kinds[i] == XMLProfileArrays.ATTRIBUTE:
+                buf.append(_ATTRIBUTE_OPEN_TAG % (
+                    ind, data_types[i], keys[i], names[i], arrays.namespace_keys[i]
+                ))
+                buf.append(f'{ind}  <DataFormat>\n{ind}    {formats[format_idx[i]]}\n{ind}  </DataFormat>\n{ind}</XMLAttribute>\n')
+                continue
+            
+            # Close elements that are not ancestors of this one
+            while open_depths and open_depths[-1] >= depth:
+                buf.append(f"{' ' * (indent + 2 * open_depths.pop())}</XMLElement>\n")
+            
+            # Open tag: one format call; looping option (arrays) and
+            # validateData="false" are only present when set
+            looping_option = arrays.looping_options[i]
+            buf.append(_ELEMENT_OPEN_TAG % (
+                ind,
+                data_types[i],
+                keys[i],
+                f'loopingOption="{looping_option}" ' if looping_option else '',
+                arrays.max_occurs[i],
+                arrays.min_occurs[i],
+                names[i],
+                arrays.type_keys[i],
+                arrays.namespace_keys[i],
+                '' if arrays.validate_data[i] else ' validateData="false"',
+            ))
+            buf.append(f'{ind}  <DataFormat>\n{ind}    {formats[format_idx[i]]}\n{ind}  </DataFormat>\n')
+            open_depths.append(depth)
         
-        return xml
-
+        while open_depths:
+            buf.append(f"{' ' * (indent + 2 * open_depths.pop())}</XMLElement>\n")
 
 def convert_webmethods_to_boomi_xml_profile(
-    node_ndf_content: str = None,
+    node_ndf_content: NdfSource = None,
     xsd_content: str = None,
     name: str = None,
     description: str = None,
@@ -546,7 +892,8 @@ def convert_webmethods_to_boomi_xml_profile(
     Main conversion function for webMethods Document Type to Boomi XML Profile.
     
     Args:
-        node_ndf_content: Content of webMethods node.ndf file
+        node_ndf_content: Content of webMethods node.ndf file, or its path /
+            a binary file object (streamed)
         xsd_content: Content of XSD schema (alternative input)
         name: Profile name (auto-detected if not provided)
         description: Profile description
@@ -573,6 +920,18 @@ def convert_webmethods_to_boomi_xml_profile(
     parser = WebMethodsDocTypeParser()
     generator = BoomiXMLProfileGenerator(config)
     
+    return _convert_document(parser, generator, node_ndf_content, xsd_content, name, description)
+
+
+def _convert_document(
+    parser: WebMethodsDocTypeParser,
+    generator: BoomiXMLProfileGenerator,
+    node_ndf_content: Optional[NdfSource],
+    xsd_content: Optional[str],
+    name: Optional[str],
+    description: Optional[str],
+) -> str:
+    """Parse one document with parser and render it with generator"""
     # Parse input
     if node_ndf_content:
         root_element, metadata = parser.parse_node_ndf(node_ndf_content)
@@ -606,11 +965,9 @@ def convert_webmethods_to_boomi_xml_profile(
     )
 
 
-def convert_sample_order_structure() -> str:
-    """
-    Generate a sample Order XML Profile matching the structure in the user's example.
-    This demonstrates the exact output format.
-    """
+@lru_cache(maxsize=None)
+def _sample_order_element() -> XMLElementDef:
+    """Sample Order structure (shared; must not be modified)"""
     # Create the Order structure from the example
     order = XMLElementDef(
         name="Order",
@@ -744,11 +1101,19 @@ def convert_sample_order_structure() -> str:
         ]
     )
     
+    return order
+
+
+def convert_sample_order_structure() -> str:
+    """
+    Generate a sample Order XML Profile matching the structure in the user's example.
+    This demonstrates the exact output format.
+    """
     config = BoomiDeploymentConfig()
     generator = BoomiXMLProfileGenerator(config)
     
     return generator.generate_profile(
-        root_element=order,
+        root_element=_sample_order_element(),
         name="Order_sample_profile",
         description="Sample Order XML Profile - Migrated from webMethods"
     )
@@ -769,6 +1134,79 @@ def create_deployment_config_from_customer(customer_settings: dict) -> BoomiDepl
     )
 
 
+# Parser/generator pair reused by every convert_many task in a process
+_worker_parser: Optional[WebMethodsDocTypeParser] = None
+_worker_generator: Optional[BoomiXMLProfileGenerator] = None
+
+
+def _init_worker():
+    """Process pool initializer: build this worker's parser and generator"""
+    global _worker_parser, _worker_generator
+    _worker_parser = WebMethodsDocTypeParser()
+    _worker_generator = BoomiXMLProfileGenerator()
+
+
+def _item_config(customer_settings: Optional[Dict]) -> BoomiDeploymentConfig:
+    """Deployment config for a batch item's customer settings"""
+    if customer_settings:
+        return create_deployment_config_from_customer(customer_settings)
+    return BoomiDeploymentConfig()
+
+
+def _convert_item(item: Tuple[NdfSource, Optional[str], Optional[Dict]]) -> str:
+    """
+    Pool task: convert one (node_ndf_content, name, customer_settings) item
+    with this worker process's parser and generator
+    """
+    node_ndf_content, name, customer_settings = item
+    if _worker_generator is None:
+        _init_worker()
+    
+    _worker_generator.config = _item_config(customer_settings)
+    return _convert_document(_worker_parser, _worker_generator, node_ndf_content, None, name, None)
+
+
+def _convert_item_local(item: Tuple[NdfSource, Optional[str], Optional[Dict]]) -> str:
+    """
+    In-process conversion of one batch item. Uses its own parser and
+    generator rather than the worker globals, so concurrent callers (e.g.
+    via asyncio.to_thread) never see each other's deployment config.
+    """
+    node_ndf_content, name, customer_settings = item
+    generator = BoomiXMLProfileGenerator(_item_config(customer_settings))
+    return _convert_document(WebMethodsDocTypeParser(), generator, node_ndf_content, None, name, None)
+
+
+def convert_many(
+    items: Iterable[Tuple[NdfSource, Optional[str], Optional[Dict]]],
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+) -> List[str]:
+    """
+    Convert a batch of webMethods Document Types to Boomi XML Profiles in parallel
+    
+    Documents are independent, so the batch is spread over a process pool.
+    Each worker builds one parser and generator up front and reuses them for
+    every task; only the (content, name, settings) tuples are pickled.
+    
+    Args:
+        items: (node_ndf_content, name, customer_settings) per document; name
+            and customer_settings may be None. Passing paths keeps the
+            pickled payload small and lets each worker stream its file.
+        workers: Worker process count (defaults to CPU count)
+        chunksize: Documents sent to a worker per round trip
+    
+    Returns:
+        Boomi XML Profile XML strings in input order
+    """
+    items = list(items)
+    if workers == 1 or len(items) <= 1:
+        return [_convert_item_local(item) for item in items]
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return list(executor.map(_convert_item, items, chunksize=chunksize))
+
+
 if __name__ == "__main__":
     # Test the converter with sample Order structure
     print("=" * 80)
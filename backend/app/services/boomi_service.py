@@ -3,7 +3,14 @@ Boomi API service for pushing components to Boomi Platform.
 """
 import base64
 import asyncio
-from typing import Optional, Tuple
+import hashlib
+import json
+import os
+import random
+import ssl
+from functools import lru_cache
+from typing import AsyncIterator, Callable, List, Optional, Set, Tuple, Union
+import certifi
 import httpx
 
 from app.models import (
@@ -13,29 +20,184 @@ from app.models import (
 )
 from app.services.logging_service import log_activity
 
+# orjson (optional) works on bytes directly, several times faster than json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    """
+    TLS context with the trust store httpx would use by default.
+    
+    Passing a context as verify= bypasses httpx's trust_env handling, so
+    SSL_CERT_FILE / SSL_CERT_DIR are honored here, falling back to certifi.
+    """
+    cert_file = os.environ.get("SSL_CERT_FILE")
+    cert_dir = os.environ.get("SSL_CERT_DIR")
+    if cert_file and os.path.isfile(cert_file):
+        context = ssl.create_default_context(cafile=cert_file)
+    elif cert_dir and os.path.isdir(cert_dir):
+        context = ssl.create_default_context(capath=cert_dir)
+    else:
+        context = ssl.create_default_context(cafile=certifi.where())
+    context.set_alpn_protocols(["h2", "http/1.1"] if _HTTP2 else ["http/1.1"])
+    return context
+
+
+# Built once per process: loading the CA bundle is the costly part of a
+# TLS context, so client rebuilds reuse it
+_SSL_CONTEXT = _create_ssl_context()
+
+# Shared client: one connection pool (and TLS session) for all API calls
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared Boomi API client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=_HTTP2,
+            verify=_SSL_CONTEXT,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _client
+
+
+def _body_prefix(response: httpx.Response, limit: int) -> str:
+    """First limit bytes of the response body as text, for error messages."""
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+# Background log_activity tasks still running (kept referenced until done)
+_pending_logs: Set[asyncio.Task] = set()
+
+
+def _log_in_background(**kwargs) -> None:
+    """Schedule log_activity without making the caller wait for it."""
+    task = asyncio.create_task(log_activity(**kwargs))
+    _pending_logs.add(task)
+    task.add_done_callback(_pending_logs.discard)
+
+
+async def aclose() -> None:
+    """Flush background logging and close the shared Boomi API client (application shutdown hook)."""
+    global _client
+    if _pending_logs:
+        await asyncio.gather(*_pending_logs, return_exceptions=True)
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+
+class _RateLimiter:
+    """Spaces request starts at least 1/rps seconds apart across tasks."""
+    
+    MAX_INTERVAL = 10.0  # seconds; floor of 0.1 requests/second
+    
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait for this caller's slot (reserved under the lock, slept outside)."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    def slow_down(self) -> None:
+        """Halve the rate, e.g. after a 429 from Boomi."""
+        self._interval = min(self._interval * 2, self.MAX_INTERVAL)
+
+
+@lru_cache(maxsize=32)
+def _auth_header_cached(username: str, token: str) -> str:
+    """Full Basic Authorization header value for a Boomi API user and token."""
+    auth_string = f"BOOMI_TOKEN.{username}:{token}"
+    return "Basic " + base64.b64encode(auth_string.encode()).decode()
+
 
 class BoomiAPIService:
     """Service for interacting with Boomi Platform API."""
     
     MAX_RETRIES = 3
-    RETRY_DELAY = 1  # seconds
+    RETRY_DELAY = 1  # seconds, base of the exponential backoff
+    RETRY_DELAY_CAP = 30.0  # seconds
+    RETRY_JITTER = 0.5  # up to +50% random stretch per delay
+    RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+    
+    # Folder query body without a parent filter, serialized once
+    # (same serializer as the parent-filter body in list_folders)
+    _EMPTY_FOLDER_QUERY = _json_dumps(
+        {"QueryFilter": {"expression": {"operator": "and", "nestedExpression": []}}}
+    )
     
     @staticmethod
     def _get_auth_header(settings: BoomiSettings) -> str:
-        """Generate Basic auth header for Boomi API."""
-        auth_string = f"BOOMI_TOKEN.{settings.username}:{settings.apiToken}"
-        return base64.b64encode(auth_string.encode()).decode()
+        """Generate Basic auth header for Boomi API (credentials part only)."""
+        return _auth_header_cached(settings.username, settings.apiToken)[len("Basic "):]
+    
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Jittered exponential backoff, stretched to honor a Retry-After header."""
+        delay = min(
+            BoomiAPIService.RETRY_DELAY_CAP,
+            BoomiAPIService.RETRY_DELAY * (2 ** attempt)
+        )
+        delay *= 1 + random.random() * BoomiAPIService.RETRY_JITTER
+        
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), BoomiAPIService.RETRY_DELAY_CAP))
+            except ValueError:
+                pass  # HTTP-date form; keep the computed delay
+        return delay
     
     @staticmethod
     async def create_component(
         settings: BoomiSettings,
-        xml_content: str,
+        xml_content: Union[str, bytes, Callable[[], AsyncIterator[bytes]]],
         customer_id: str,
-        project_id: str
+        project_id: str,
+        rate_limiter: Optional[_RateLimiter] = None
     ) -> Tuple[bool, str, Optional[BoomiComponentInfo]]:
         """
         Create a component in Boomi via API.
         
+        xml_content may be text, UTF-8 bytes (sent as-is, e.g. from
+        CompleteProcessGenerator.generate_process_bytes), or a zero-argument
+        callable returning an async iterator of UTF-8 chunks (e.g.
+        functools.partial(generator.stream_process_xml, name)); the body is
+        then streamed as it is generated, and the callable is invoked again
+        for each retry.
+        
+        If rate_limiter is given, every attempt waits for a slot from it and
+        a 429 response slows it down for all tasks sharing it.
+        
         Returns:
             Tuple of (success, message, component_info)
         """
@@ -44,67 +206,89 @@ class BoomiAPIService:
         
         url = f"{settings.baseUrl}/{settings.accountId}/Component"
         headers = {
-            "Authorization": f"Basic {BoomiAPIService._get_auth_header(settings)}",
+            "Authorization": _auth_header_cached(settings.username, settings.apiToken),
             "Content-Type": "application/xml",
-            "Accept": "application/json"
+            "Accept": "application/json",
         }
         
+        if callable(xml_content):
+            body_factory = xml_content
+            body = None
+        else:
+            body_factory = None
+            body = xml_content if isinstance(xml_content, bytes) else xml_content.encode('utf-8')
+            # Same content -> same key, so a delayed retry is not a new component
+            headers["Idempotency-Key"] = hashlib.sha256(body).hexdigest()
+        
         last_error = None
+        attempts = 0
         
         for attempt in range(BoomiAPIService.MAX_RETRIES):
+            attempts = attempt + 1
+            response = None
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        url,
-                        content=xml_content.encode('utf-8'),
-                        headers=headers
-                    )
-                    
-                    if response.status_code == 200 or response.status_code == 201:
-                        # Parse response
-                        try:
-                            data = response.json()
-                            component_id = data.get('componentId', '')
-                            
-                            component_info = BoomiComponentInfo(
-                                componentId=component_id,
-                                componentUrl=f"https://platform.boomi.com/AtomSphere.html#build;accountId={settings.accountId};components={component_id}",
-                                folderPath=settings.defaultFolder,
-                            )
-                            
-                            await log_activity(
-                                action="boomi_push_success",
-                                message=f"Component created: {component_id}",
-                                category="push",
-                                customer_id=customer_id,
-                                project_id=project_id,
-                                componentId=component_id
-                            )
-                            
-                            return True, "Component created successfully", component_info
-                            
-                        except Exception as e:
-                            # Response wasn't JSON, but still successful
-                            component_info = BoomiComponentInfo(
-                                componentId="unknown",
-                                componentUrl="",
-                                folderPath=settings.defaultFolder,
-                            )
-                            return True, "Component created (response parsing issue)", component_info
-                    
-                    elif response.status_code == 401:
-                        return False, "Authentication failed - check Boomi credentials", None
-                    
-                    elif response.status_code == 403:
-                        return False, "Access denied - check account permissions", None
-                    
-                    elif response.status_code == 400:
-                        error_msg = response.text[:500] if response.text else "Bad request"
-                        return False, f"Invalid request: {error_msg}", None
-                    
-                    else:
-                        last_error = f"API returned status {response.status_code}: {response.text[:200]}"
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                client = await _get_client()
+                response = await client.post(
+                    url,
+                    content=body_factory() if body_factory is not None else body,
+                    headers=headers
+                )
+                
+                if response.status_code == 200 or response.status_code == 201:
+                    # Parse response
+                    try:
+                        data = _loads(response.content)
+                        component_id = data.get('componentId', '')
                         
+                        component_info = BoomiComponentInfo(
+                            componentId=component_id,
+                            componentUrl=f"https://platform.boomi.com/AtomSphere.html#build;accountId={settings.accountId};components={component_id}",
+                            folderPath=settings.defaultFolder,
+                        )
+                        
+                        # Off the critical path; failures are still awaited below
+                        _log_in_background(
+                            action="boomi_push_success",
+                            message=f"Component created: {component_id}",
+                            category="push",
+                            customer_id=customer_id,
+                            project_id=project_id,
+                            componentId=component_id
+                        )
+                        
+                        return True, "Component created successfully", component_info
+                        
+                    except Exception as e:
+                        # Response wasn't JSON, but still successful
+                        component_info = BoomiComponentInfo(
+                            componentId="unknown",
+                            componentUrl="",
+                            folderPath=settings.defaultFolder,
+                        )
+                        return True, "Component created (response parsing issue)", component_info
+                
+                elif response.status_code == 401:
+                    return False, "Authentication failed - check Boomi credentials", None
+                
+                elif response.status_code == 403:
+                    return False, "Access denied - check account permissions", None
+                
+                elif response.status_code == 400:
+                    error_msg = _body_prefix(response, 500) or "Bad request"
+                    return False, f"Invalid request: {error_msg}", None
+                
+                elif response.status_code in BoomiAPIService.RETRYABLE_STATUS:
+                    if response.status_code == 429 and rate_limiter is not None:
+                        rate_limiter.slow_down()
+                    last_error = f"API returned status {response.status_code}: {_body_prefix(response, 200)}"
+                
+                else:
+                    # Not transient: retrying would only repeat the error
+                    last_error = f"API returned status {response.status_code}: {_body_prefix(response, 200)}"
+                    break
+                    
             except httpx.TimeoutException:
                 last_error = "Request timed out"
             except httpx.ConnectError:
@@ -112,20 +296,49 @@ class BoomiAPIService:
             except Exception as e:
                 last_error = str(e)
             
-            # Exponential backoff
+            # Jittered exponential backoff (decorrelates concurrent pushers)
             if attempt < BoomiAPIService.MAX_RETRIES - 1:
-                await asyncio.sleep(BoomiAPIService.RETRY_DELAY * (2 ** attempt))
+                await asyncio.sleep(BoomiAPIService._retry_delay(attempt, response))
         
         await log_activity(
             action="boomi_push_failed",
-            message=f"Push failed after {BoomiAPIService.MAX_RETRIES} attempts: {last_error}",
+            message=f"Push failed after {attempts} attempts: {last_error}",
             category="push",
             level="error",
             customer_id=customer_id,
             project_id=project_id
         )
         
-        return False, f"Failed after {BoomiAPIService.MAX_RETRIES} attempts: {last_error}", None
+        return False, f"Failed after {attempts} attempts: {last_error}", None
+    
+    @staticmethod
+    async def create_components_bulk(
+        settings: BoomiSettings,
+        xml_contents: List[Union[str, bytes]],
+        customer_id: str,
+        project_id: str,
+        concurrency: int = 20,
+        rps: float = 10.0
+    ) -> List[Tuple[bool, str, Optional[BoomiComponentInfo]]]:
+        """
+        Create several components in Boomi concurrently.
+        
+        At most `concurrency` pushes are in flight, and request starts
+        (retries included) are held to `rps` per second, halved on each 429.
+        
+        Returns:
+            One create_component result per XML document, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = _RateLimiter(rps)
+        
+        async def push(xml_content: Union[str, bytes]) -> Tuple[bool, str, Optional[BoomiComponentInfo]]:
+            async with semaphore:
+                return await BoomiAPIService.create_component(
+                    settings, xml_content, customer_id, project_id, rate_limiter=limiter
+                )
+        
+        return list(await asyncio.gather(*(push(xml) for xml in xml_contents)))
     
     @staticmethod
     async def get_component(
@@ -143,21 +356,21 @@ class BoomiAPIService:
         
         url = f"{settings.baseUrl}/{settings.accountId}/Component/{component_id}"
         headers = {
-            "Authorization": f"Basic {BoomiAPIService._get_auth_header(settings)}",
+            "Authorization": _auth_header_cached(settings.username, settings.apiToken),
             "Accept": "application/json"
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
+            client = await _get_client()
+            response = await client.get(url, headers=headers)
+            
+            if response.status_code == 200:
+                return True, _loads(response.content), ""
+            elif response.status_code == 404:
+                return False, None, "Component not found"
+            else:
+                return False, None, f"API returned status {response.status_code}"
                 
-                if response.status_code == 200:
-                    return True, response.json(), ""
-                elif response.status_code == 404:
-                    return False, None, "Component not found"
-                else:
-                    return False, None, f"API returned status {response.status_code}"
-                    
         except Exception as e:
             return False, None, str(e)
     
@@ -174,25 +387,25 @@ class BoomiAPIService:
         
         url = f"{settings.baseUrl}/{settings.accountId}/Account/{settings.accountId}"
         headers = {
-            "Authorization": f"Basic {BoomiAPIService._get_auth_header(settings)}",
+            "Authorization": _auth_header_cached(settings.username, settings.apiToken),
             "Accept": "application/json"
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, headers=headers)
+            client = await _get_client()
+            response = await client.get(url, headers=headers, timeout=10.0)
+            
+            if response.status_code == 200:
+                data = _loads(response.content)
+                account_name = data.get('name', settings.accountId)
+                return True, f"Connected to Boomi account: {account_name}"
+            elif response.status_code == 401:
+                return False, "Authentication failed"
+            elif response.status_code == 403:
+                return False, "Access denied"
+            else:
+                return False, f"API returned status {response.status_code}"
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    account_name = data.get('name', settings.accountId)
-                    return True, f"Connected to Boomi account: {account_name}"
-                elif response.status_code == 401:
-                    return False, "Authentication failed"
-                elif response.status_code == 403:
-                    return False, "Access denied"
-                else:
-                    return False, f"API returned status {response.status_code}"
-                    
         except httpx.TimeoutException:
             return False, "Connection timed out"
         except httpx.ConnectError:
@@ -216,29 +429,33 @@ class BoomiAPIService:
         
         url = f"{settings.baseUrl}/{settings.accountId}/Folder/query"
         headers = {
-            "Authorization": f"Basic {BoomiAPIService._get_auth_header(settings)}",
+            "Authorization": _auth_header_cached(settings.username, settings.apiToken),
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
         
-        query = {"QueryFilter": {"expression": {"operator": "and", "nestedExpression": []}}}
         if parent_id:
-            query["QueryFilter"]["expression"]["nestedExpression"].append({
-                "argument": [parent_id],
-                "operator": "EQUALS",
-                "property": "parentId"
-            })
+            body = _json_dumps({"QueryFilter": {"expression": {
+                "operator": "and",
+                "nestedExpression": [{
+                    "argument": [parent_id],
+                    "operator": "EQUALS",
+                    "property": "parentId"
+                }]
+            }}})
+        else:
+            body = BoomiAPIService._EMPTY_FOLDER_QUERY
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=query)
+            client = await _get_client()
+            response = await client.post(url, headers=headers, content=body)
+            
+            if response.status_code == 200:
+                data = _loads(response.content)
+                folders = data.get('result', [])
+                return True, folders, ""
+            else:
+                return False, [], f"API returned status {response.status_code}"
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    folders = data.get('result', [])
-                    return True, folders, ""
-                else:
-                    return False, [], f"API returned status {response.status_code}"
-                    
         except Exception as e:
             return False, [], str(e)
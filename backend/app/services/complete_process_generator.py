@@ -3,10 +3,77 @@ Complete Boomi Process XML Generator
 Generates fully-wired, deployable Boomi process XML with proper shape connections
 """
 
-from typing import List, Dict, Any, Optional
+from array import array
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
-import uuid
+import os
+from xml.sax.saxutils import escape
+
+# Fixed parts of the process document; shapes and connections go in between
+_PROCESS_HEAD = """<?xml version="1.0" encoding="UTF-8"?>
+<bns:Process xmlns:bns="http://api.platform.boomi.com/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+    <bns:name>{name}</bns:name>
+    <bns:type>process</bns:type>
+    <bns:description>Auto-generated from webMethods by Migration Accelerator</bns:description>
+    <bns:processVersion>1.0</bns:processVersion>
+    <bns:shapes>
+"""
+_PROCESS_MIDDLE = """    </bns:shapes>
+    <bns:connections>
+"""
+_PROCESS_TAIL = """    </bns:connections>
+</bns:Process>"""
+
+
+def _emit_config_dict(out: List[str], key: str, value: Dict) -> None:
+    """Config entry holding a dict: one child element per item"""
+    out.append(f"                <bns:{key}>\n")
+    for k, v in value.items():
+        out.append(f"                    <bns:{k}>{escape(str(v))}</bns:{k}>\n")
+    out.append(f"                </bns:{key}>\n")
+
+
+def _emit_config_list(out: List[str], key: str, value: List) -> None:
+    """Config entry holding a list: one bns:item per element"""
+    out.append(f"                <bns:{key}>\n")
+    for item in value:
+        out.append(f"                    <bns:item>{escape(str(item))}</bns:item>\n")
+    out.append(f"                </bns:{key}>\n")
+
+
+def _emit_config_scalar(out: List[str], key: str, value: Any) -> None:
+    """Config entry holding a single value"""
+    out.append(f"                <bns:{key}>{escape(str(value))}</bns:{key}>\n")
+
+
+def _emit_config_other(out: List[str], key: str, value: Any) -> None:
+    """Slow path for types not in _CONFIG_EMITTERS (e.g. dict/list subclasses)"""
+    if isinstance(value, dict):
+        _emit_config_dict(out, key, value)
+    elif isinstance(value, list):
+        _emit_config_list(out, key, value)
+    else:
+        _emit_config_scalar(out, key, value)
+
+
+# Config value emitter by exact type: one dict lookup per entry
+_CONFIG_EMITTERS = {
+    dict: _emit_config_dict,
+    list: _emit_config_list,
+    str: _emit_config_scalar,
+    int: _emit_config_scalar,
+    float: _emit_config_scalar,
+    bool: _emit_config_scalar,
+    type(None): _emit_config_scalar,
+}
+
+
+def _uuid4_str() -> str:
+    """Random (version 4) UUID string, formatted without building a uuid.UUID"""
+    h = os.urandom(16).hex()
+    # Version nibble is 4; the variant nibble is one of 8, 9, a, b
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 class ShapeType(Enum):
     START = "Start"
@@ -20,7 +87,7 @@ class ShapeType(Enum):
     SET_PROPERTIES = "SetProperties"
     NOTIFICATION = "Notification"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Shape:
     id: str
     type: ShapeType
@@ -29,7 +96,7 @@ class Shape:
     y: int
     config: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     id: str
     from_shape: str
@@ -40,32 +107,65 @@ class CompleteProcessGenerator:
     """Generates complete, deployable Boomi Process XML"""
     
     def __init__(self):
-        self.shapes: List[Shape] = []
+        # Shapes are stored column-wise (one entry per shape in each list);
+        # Shape objects are only built on demand by the shapes property
+        self._ids: List[str] = []
+        self._types: List[ShapeType] = []
+        self._labels: List[str] = []
+        self._xs = array('i')
+        self._ys = array('i')
+        self._configs: List[Dict[str, Any]] = []
         self.connections: List[Connection] = []
         self.x_offset = 50
         self.y_start = 50
         self.y_spacing = 150
         self.current_y = self.y_start
+    
+    @property
+    def shapes(self) -> List[Shape]:
+        """Shapes added so far, in order"""
+        return [
+            Shape(id=id_, type=type_, label=label, x=x, y=y, config=config)
+            for id_, type_, label, x, y, config in zip(
+                self._ids, self._types, self._labels, self._xs, self._ys, self._configs
+            )
+        ]
         
     def generate_uuid(self) -> str:
         """Generate Boomi-style UUID"""
-        return str(uuid.uuid4())
+        return _uuid4_str()
     
     def add_shape(self, shape_type: ShapeType, label: str, config: Dict = None) -> str:
         """Add a shape and return its ID"""
         shape_id = self.generate_uuid()
-        shape = Shape(
-            id=shape_id,
-            type=shape_type,
-            label=label,
-            x=self.x_offset,
-            y=self.current_y,
-            config=config or {}
-        )
-        self.shapes.append(shape)
+        self._ids.append(shape_id)
+        self._types.append(shape_type)
+        self._labels.append(label)
+        self._xs.append(self.x_offset)
+        self._ys.append(self.current_y)
+        self._configs.append(config or {})
         self.current_y += self.y_spacing
         return shape_id
     
+    def add_shapes(
+        self,
+        shape_types: List[ShapeType],
+        labels: List[str],
+        configs: List[Optional[Dict]]
+    ) -> List[str]:
+        """Add a run of shapes laid out one below the other and return their IDs"""
+        count = len(shape_types)
+        shape_ids = [self.generate_uuid() for _ in range(count)]
+        start_y = self.current_y
+        self.current_y += count * self.y_spacing
+        self._ids.extend(shape_ids)
+        self._types.extend(shape_types)
+        self._labels.extend(labels)
+        self._xs.extend([self.x_offset] * count)
+        self._ys.extend(range(start_y, self.current_y, self.y_spacing))
+        self._configs.extend([config or {} for config in configs])
+        return shape_ids
+    
     def connect_shapes(self, from_id: str, to_id: str, label: Optional[str] = None):
         """Connect two shapes"""
         connection = Connection(
@@ -96,7 +196,7 @@ class CompleteProcessGenerator:
             f"Get from {source_connector_type}",
             {
                 "connectorType": source_connector_type,
-                "operation": source_config.get("operation", "GET"),
+                "operation": "GET",
                 **source_config
             }
         )
@@ -119,7 +219,7 @@ class CompleteProcessGenerator:
             f"Send to {target_connector_type}",
             {
                 "connectorType": target_connector_type,
-                "operation": target_config.get("operation", "POST"),
+                "operation": "POST",
                 **target_config
             }
         )
@@ -350,111 +450,120 @@ class CompleteProcessGenerator:
         )
         self.connect_shapes(source_id, decision_id)
         
-        # Create branch for each routing rule
-        for i, rule in enumerate(routing_rules):
-            route_id = self.add_shape(
-                ShapeType.CONNECTOR,
-                f"Route to {rule.get('destination')}",
-                rule.get('connector_config', {})
-            )
-            self.connect_shapes(
-                decision_id, 
-                route_id, 
-                label=rule.get('condition', f'Branch {i+1}')
+        # Create branch for each routing rule: a route connector followed
+        # by its stop, all laid out in one batch
+        labels = []
+        configs = []
+        for i, rule in enumerate(routing_rules, 1):
+            labels += (f"Route to {rule.get('destination')}", f"Stop {i}")
+            configs += (rule.get('connector_config'), None)
+        branch_ids = self.add_shapes(
+            [ShapeType.CONNECTOR, ShapeType.STOP] * len(routing_rules),
+            labels,
+            configs
+        )
+        
+        generate_uuid = self.generate_uuid
+        self.connections.extend(
+            connection
+            for i, rule in enumerate(routing_rules)
+            for connection in (
+                Connection(
+                    id=generate_uuid(),
+                    from_shape=decision_id,
+                    to_shape=branch_ids[2 * i],
+                    label=rule.get('condition', f'Branch {i+1}')
+                ),
+                Connection(
+                    id=generate_uuid(),
+                    from_shape=branch_ids[2 * i],
+                    to_shape=branch_ids[2 * i + 1]
+                ),
             )
-            
-            stop_id = self.add_shape(ShapeType.STOP, f"Stop {i+1}")
-            self.connect_shapes(route_id, stop_id)
+        )
         
         return self._generate_process_xml(process_name)
     
     def _generate_process_xml(self, process_name: str) -> str:
         """Generate complete Boomi Process XML"""
-        
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<bns:Process xmlns:bns="http://api.platform.boomi.com/" 
-             xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
-    <bns:name>{process_name}</bns:name>
-    <bns:type>process</bns:type>
-    <bns:description>Auto-generated from webMethods by Migration Accelerator</bns:description>
-    <bns:processVersion>1.0</bns:processVersion>
+        # Shapes and connections append to one list, joined once here
+        out = [_PROCESS_HEAD.format(name=escape(process_name))]
+        for i in range(len(self._ids)):
+            self._generate_shape_xml(i, out)
+        out.append(_PROCESS_MIDDLE)
+        for conn in self.connections:
+            self._generate_connection_xml(conn, out)
+        out.append(_PROCESS_TAIL)
+        return ''.join(out)
     
-    <bns:shapes>
-'''
-        
-        # Add all shapes
-        for shape in self.shapes:
-            xml += self._generate_shape_xml(shape)
+    def generate_process_bytes(self, process_name: str) -> bytes:
+        """
+        Generate complete Boomi Process XML as UTF-8 bytes.
         
-        xml += '''    </bns:shapes>
+        Ready to send as a request body (BoomiAPIService.create_component).
+        """
+        return self._generate_process_xml(process_name).encode("utf-8")
     
-    <bns:connections>
-'''
-        
-        # Add all connections
+    def iter_process_xml(self, process_name: str) -> Iterator[bytes]:
+        """
+        Generate complete Boomi Process XML as UTF-8 chunks.
+        
+        Yields the envelope, then one chunk per shape and per connection, so
+        no full document string ever exists. The chunks join to exactly
+        what generate_process_bytes returns.
+        """
+        yield _PROCESS_HEAD.format(name=escape(process_name)).encode("utf-8")
+        
+        out: List[str] = []
+        for i in range(len(self._ids)):
+            self._generate_shape_xml(i, out)
+            yield ''.join(out).encode("utf-8")
+            out.clear()
+        
+        yield _PROCESS_MIDDLE.encode("utf-8")
         for conn in self.connections:
-            xml += self._generate_connection_xml(conn)
-        
-        xml += '''    </bns:connections>
-</bns:Process>'''
+            self._generate_connection_xml(conn, out)
+            yield ''.join(out).encode("utf-8")
+            out.clear()
         
-        return xml
+        yield _PROCESS_TAIL.encode("utf-8")
     
-    def _generate_shape_xml(self, shape: Shape) -> str:
-        """Generate XML for a single shape"""
-        
-        shape_xml = f'''        <bns:shape>
-            <bns:shapeId>{shape.id}</bns:shapeId>
-            <bns:type>{shape.type.value}</bns:type>
-            <bns:label>{shape.label}</bns:label>
-            <bns:x>{shape.x}</bns:x>
-            <bns:y>{shape.y}</bns:y>
-'''
+    async def stream_process_xml(self, process_name: str) -> AsyncIterator[bytes]:
+        """iter_process_xml as an async iterator, e.g. for an httpx request body"""
+        for chunk in self.iter_process_xml(process_name):
+            yield chunk
+    
+    def _generate_shape_xml(self, index: int, out: List[str]):
+        """Append XML for the shape at index to out"""
+        out.append(f"""        <bns:shape>
+            <bns:shapeId>{self._ids[index]}</bns:shapeId>
+            <bns:type>{self._types[index].value}</bns:type>
+            <bns:label>{escape(self._labels[index])}</bns:label>
+            <bns:x>{self._xs[index]}</bns:x>
+            <bns:y>{self._ys[index]}</bns:y>
+""")
         
         # Add shape-specific configuration
-        if shape.config:
-            shape_xml += '            <bns:configuration>\n'
-            for key, value in shape.config.items():
-                if isinstance(value, dict):
-                    shape_xml += f'                <bns:{key}>\n'
-                    for k, v in value.items():
-                        shape_xml += f'                    <bns:{k}>{self._escape_xml(str(v))}</bns:{k}>\n'
-                    shape_xml += f'                </bns:{key}>\n'
-                elif isinstance(value, list):
-                    shape_xml += f'                <bns:{key}>\n'
-                    for item in value:
-                        shape_xml += f'                    <bns:item>{self._escape_xml(str(item))}</bns:item>\n'
-                    shape_xml += f'                </bns:{key}>\n'
-                else:
-                    shape_xml += f'                <bns:{key}>{self._escape_xml(str(value))}</bns:{key}>\n'
-            shape_xml += '            </bns:configuration>\n'
-        
-        shape_xml += '        </bns:shape>\n'
-        return shape_xml
+        config = self._configs[index]
+        if config:
+            out.append("            <bns:configuration>\n")
+            get_emitter = _CONFIG_EMITTERS.get
+            for key, value in config.items():
+                get_emitter(type(value), _emit_config_other)(out, key, value)
+            out.append("            </bns:configuration>\n")
+        
+        out.append("        </bns:shape>\n")
     
-    def _generate_connection_xml(self, conn: Connection) -> str:
-        """Generate XML for a connection"""
-        
-        conn_xml = f'''        <bns:connection>
+    def _generate_connection_xml(self, conn: Connection, out: List[str]):
+        """Append XML for a connection to out"""
+        out.append(f"""        <bns:connection>
             <bns:connectionId>{conn.id}</bns:connectionId>
             <bns:fromShapeId>{conn.from_shape}</bns:fromShapeId>
             <bns:toShapeId>{conn.to_shape}</bns:toShapeId>
-'''
+""")
         if conn.label:
-            conn_xml += f'            <bns:label>{self._escape_xml(conn.label)}</bns:label>\n'
-        
-        conn_xml += '        </bns:connection>\n'
-        return conn_xml
-    
-    def _escape_xml(self, text: str) -> str:
-        """Escape XML special characters"""
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&apos;'))
-
+            out.append(f"            <bns:label>{escape(conn.label)}</bns:label>\n")
+        out.append("        </bns:connection>\n")
 
 def generate_process_from_flow_analysis(
     flow_analysis: Dict,
@@ -477,9 +586,8 @@ def generate_process_from_flow_analysis(
     
     if pattern == "fetch_transform_send":
         # Extract configurations from analysis
-        adapters = flow_analysis.get('adapters', [])
-        source_adapter = adapters[0] if len(adapters) > 0 else {"type": "HTTP"}
-        target_adapter = adapters[1] if len(adapters) > 1 else {"type": "HTTP"}
+        adapters = flow_analysis.get('adapters') or ()
+        source_adapter, target_adapter = [*adapters, {}, {}][:2]
         
         return generator.generate_fetch_transform_send_process(
             source_connector_type=source_adapter.get('type', 'HTTP'),
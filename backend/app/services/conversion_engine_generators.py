@@ -9,23 +9,43 @@ Generates valid Boomi Platform API XML for:
 - Connectors
 """
 
-import uuid
+import copy
+import json
+import secrets
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple, Union, BinaryIO
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from lxml import etree
-from enum import Enum
+from enum import StrEnum
+from xml.sax.saxutils import escape
 import logging
 
+# orjson (optional) serializes JSON schemas several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _uuid4_str() -> str:
+    """Random (version 4) UUID string, formatted without building a uuid.UUID"""
+    h = secrets.token_hex(16)
+    # Version nibble is 4; the variant nibble is one of 8, 9, a, b
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
 # =============================================================================
 # BOOMI COMPONENT TYPES
 # =============================================================================
 
-class BoomiComponentType(str, Enum):
+class BoomiComponentType(StrEnum):
     """Boomi component types"""
     PROCESS = "process"
     PROFILE_XML = "profile.xml"
@@ -39,7 +59,7 @@ class BoomiComponentType(str, Enum):
     OPERATION = "operation"
 
 
-class BoomiShapeType(str, Enum):
+class BoomiShapeType(StrEnum):
     """Boomi process shapes"""
     START = "start"
     STOP = "stop"
@@ -80,6 +100,143 @@ BOOMI_NSMAP = {
 # XSD namespace for profiles
 XSD_NS = "http://www.w3.org/2001/XMLSchema"
 
+# Clark-notation tags, built once instead of per SubElement call
+_BNS = f"{{{BOOMI_NS}}}"
+_XSD = f"{{{XSD_NS}}}"
+_BNS_COMPONENT = _BNS + "Component"
+_BNS_NAME = _BNS + "name"
+_BNS_TYPE = _BNS + "type"
+_BNS_DESCRIPTION = _BNS + "description"
+_BNS_OBJECT = _BNS + "object"
+_XSD_SCHEMA = _XSD + "schema"
+_XSD_ELEMENT = _XSD + "element"
+_XSD_COMPLEXTYPE = _XSD + "complexType"
+_XSD_SEQUENCE = _XSD + "sequence"
+
+# Shared namespace maps (lxml copies them, so one dict serves every component)
+_BOOMI_NSMAP_ROOT = {'bns': BOOMI_NS}
+_XSD_NSMAP = {'xsd': XSD_NS}
+
+# Connector tags and credential placeholders, shared by every generated
+# connection/connector instead of rebuilt per call
+_TAG_CONNECTION = sys.intern("Connection")
+_TAG_CONNECTOR = sys.intern("Connector")
+_TAG_OPERATION = sys.intern("Operation")
+_TAG_HOST = sys.intern("Host")
+_TAG_PORT = sys.intern("Port")
+_TAG_USER = sys.intern("User")
+_TAG_PASSWORD = sys.intern("Password")
+_DB_USER = sys.intern("${db.user}")
+_DB_PASSWORD = sys.intern("${db.password}")
+_FTP_USER = sys.intern("${ftp.user}")
+_FTP_PASSWORD = sys.intern("${ftp.password}")
+_JMS_CONNECTION_FACTORY = sys.intern("${jms.connection.factory}")
+
+# Fixed-shape connection components are formatted straight from a template;
+# the output matches what to_string() would serialize for the same tree
+_CONNECTION_TMPL = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    f'<bns:Component xmlns:bns="{BOOMI_NS}">'
+    "<bns:name>{name}</bns:name>"
+    "<bns:type>connection</bns:type>"
+    "<bns:description>{description}</bns:description>"
+    '<bns:object><Connection type="{type}">{body}</Connection></bns:object>'
+    "</bns:Component>"
+)
+_DB_CONNECTION_BODY = (
+    "<DriverType>{driver_type}</DriverType>"
+    "<ConnectionString>{connection_string}</ConnectionString>"
+    "<User>{user}</User><Password>{password}</Password>"
+)
+_HTTP_CONNECTION_BODY = (
+    "<BaseURL>{base_url}</BaseURL>"
+    "<AuthenticationType>{auth_type}</AuthenticationType>"
+)
+_FTP_CONNECTION_BODY = (
+    "<Host>{host}</Host><Port>{port}</Port>"
+    "<User>{user}</User><Password>{password}</Password>"
+)
+# lxml writes carriage returns in text as character references
+_TEXT_ENTITIES = {"\r": "&#13;"}
+
+
+# Characters XML 1.0 does not allow anywhere in a document
+_INVALID_XML_CHARS = re.compile('[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+
+def _xml_text(value: Optional[str]) -> str:
+    """
+    Escape a value for use as element text. Like lxml, None gives an empty
+    element and control characters are rejected with ValueError.
+    """
+    if value is None:
+        return ""
+    if _INVALID_XML_CHARS.search(value):
+        raise ValueError(
+            "All strings must be XML compatible: Unicode or ASCII, "
+            "no NULL bytes or control characters"
+        )
+    return escape(value, _TEXT_ENTITIES)
+
+
+# =============================================================================
+# TYPE MAPS (webMethods type, lower-cased -> profile type)
+# =============================================================================
+
+_XSD_TYPE_MAP = {
+    'string': 'xsd:string',
+    'integer': 'xsd:integer',
+    'int': 'xsd:int',
+    'long': 'xsd:long',
+    'float': 'xsd:float',
+    'double': 'xsd:double',
+    'decimal': 'xsd:decimal',
+    'boolean': 'xsd:boolean',
+    'date': 'xsd:date',
+    'datetime': 'xsd:dateTime',
+    'time': 'xsd:time',
+    'binary': 'xsd:base64Binary',
+    'object': 'xsd:anyType',
+}
+
+_JSON_TYPE_MAP = {
+    'string': 'string',
+    'integer': 'integer',
+    'int': 'integer',
+    'long': 'integer',
+    'float': 'number',
+    'double': 'number',
+    'boolean': 'boolean',
+    'date': 'string',
+    'datetime': 'string',
+}
+
+_FLATFILE_TYPE_MAP = {
+    'string': 'Character',
+    'integer': 'Number',
+    'int': 'Number',
+    'long': 'Number',
+    'float': 'Number',
+    'double': 'Number',
+    'date': 'Date/Time',
+    'datetime': 'Date/Time',
+    'boolean': 'Character',
+}
+
+# Canonical (interned) object for every known type name, so map lookups
+# with a key from _type_key succeed on the identity check
+_TYPE_KEYS = {
+    sys.intern(t): sys.intern(t)
+    for t in (*_XSD_TYPE_MAP, *_JSON_TYPE_MAP, *_FLATFILE_TYPE_MAP)
+}
+
+
+@lru_cache(maxsize=256)
+def _type_key(wm_type: str) -> str:
+    """Lower-cased type name, as the interned map key when it is a known type"""
+    key = wm_type.lower()
+    return _TYPE_KEYS.get(key, key)
+
 
 # =============================================================================
 # XML BUILDERS
@@ -99,42 +256,97 @@ class BoomiXMLBuilder:
                                description: str = "") -> etree._Element:
         """Create root Component element"""
         # Generate new component ID
-        self.component_id = str(uuid.uuid4())
+        self.component_id = _uuid4_str()
         
         root = etree.Element(
-            f"{{{BOOMI_NS}}}Component",
-            nsmap={'bns': BOOMI_NS}
+            _BNS_COMPONENT,
+            nsmap=_BOOMI_NSMAP_ROOT
         )
         
         # Add standard elements
-        etree.SubElement(root, f"{{{BOOMI_NS}}}name").text = name
-        etree.SubElement(root, f"{{{BOOMI_NS}}}type").text = component_type
+        etree.SubElement(root, _BNS_NAME).text = name
+        etree.SubElement(root, _BNS_TYPE).text = component_type
         if description:
-            etree.SubElement(root, f"{{{BOOMI_NS}}}description").text = description
+            etree.SubElement(root, _BNS_DESCRIPTION).text = description
         
         return root
     
     def _add_object_element(self, parent: etree._Element) -> etree._Element:
         """Add object element that contains component-specific XML"""
-        return etree.SubElement(parent, f"{{{BOOMI_NS}}}object")
+        return etree.SubElement(parent, _BNS_OBJECT)
     
-    def to_string(self, root: etree._Element, pretty: bool = True) -> str:
-        """Convert element tree to string"""
+    def to_bytes(self, root: etree._Element, pretty: bool = False) -> bytes:
+        """
+        Serialize element tree to UTF-8 bytes (compact unless pretty is set,
+        e.g. for debug dumps). Use this when the result goes to a file or
+        socket; it skips the str copy that to_string makes.
+        """
         return etree.tostring(
             root, 
             pretty_print=pretty, 
             xml_declaration=True, 
             encoding='UTF-8'
-        ).decode('utf-8')
+        )
+    
+    def to_string(self, root: etree._Element, pretty: bool = False) -> str:
+        """Convert element tree to string"""
+        return self.to_bytes(root, pretty).decode('utf-8')
 
 
 # =============================================================================
 # PROFILE GENERATOR
 # =============================================================================
 
+# Serialized profiles by (kind, arguments, frozen fields); the same document
+# type is typically emitted again for every process/map that references it
+_PROFILE_CACHE: Dict[Tuple, str] = {}
+_PROFILE_CACHE_SIZE = 256
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a field definition tree (equal for equal definitions)"""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return value
+    # Keep 5 and 5.0 (or 1 and True) apart: they render differently
+    return (type(value), value)
+
 class ProfileGenerator(BoomiXMLBuilder):
     """Generates Boomi Profile XML"""
     
+    # write_xml_profile streams profiles with more top-level fields than this
+    STREAM_FIELD_THRESHOLD = 500
+    
+    @staticmethod
+    def generate_many(specs: Iterable[Dict[str, Any]],
+                      workers: Optional[int] = None,
+                      chunksize: int = 16) -> List[str]:
+        """
+        Generate a batch of independent profiles in parallel.
+        
+        Profiles are pure functions of their spec, so the batch is spread
+        over a process pool; each worker reuses one ProfileGenerator.
+        
+        Args:
+            specs: One dict per profile: "kind" ("xml", "json", "flatfile"
+                   or "edi"; default "xml") plus the keyword arguments of
+                   the matching generate_*_profile method
+            workers: Worker process count (defaults to CPU count)
+            chunksize: Specs sent to a worker per round trip
+        
+        Returns:
+            Profile XML strings in input order
+        """
+        specs = list(specs)
+        if workers == 1 or len(specs) <= 1:
+            return [_generate_one(spec) for spec in specs]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_one, specs, chunksize=chunksize))
+    
     def generate_xml_profile(self, name: str, fields: List[Dict], 
                             root_element: str = "Root",
                             description: str = "") -> str:
@@ -151,8 +363,75 @@ class ProfileGenerator(BoomiXMLBuilder):
             root_element: Root XML element name
             description: Profile description
         """
+        return self._cached_profile(
+            ("xml", name, root_element, description), fields,
+            lambda: self.to_string(
+                self._build_xml_profile(name, fields, root_element, description)
+            )
+        )
+    
+    def write_xml_profile(self, output: Union[str, BinaryIO], name: str,
+                          fields: List[Dict], root_element: str = "Root",
+                          description: str = ""):
+        """
+        Write XML Profile component to a file path or binary file object.
+        
+        Large profiles (more than STREAM_FIELD_THRESHOLD top-level fields)
+        are written incrementally with etree.xmlfile, so neither the element
+        tree nor the serialized document is held in memory. Smaller ones are
+        built in memory and written exactly as generate_xml_profile returns them.
+        """
+        if len(fields) <= self.STREAM_FIELD_THRESHOLD:
+            etree.ElementTree(
+                self._build_xml_profile(name, fields, root_element, description)
+            ).write(output, xml_declaration=True, encoding='UTF-8')
+            return
+        
+        self.component_id = _uuid4_str()
+        
+        with etree.xmlfile(output, encoding='UTF-8') as xf:
+            xf.write_declaration()
+            with xf.element(_BNS_COMPONENT, nsmap=_BOOMI_NSMAP_ROOT):
+                with xf.element(_BNS_NAME):
+                    xf.write(name)
+                with xf.element(_BNS_TYPE):
+                    xf.write(BoomiComponentType.PROFILE_XML)
+                with xf.element(_BNS_DESCRIPTION):
+                    xf.write(description or f"XML Profile: {name}")
+                
+                with xf.element(_BNS_OBJECT), xf.element("ProfileXML"):
+                    with xf.element(_XSD_SCHEMA, {"elementFormDefault": "qualified"},
+                                    nsmap=_XSD_NSMAP):
+                        with xf.element(_XSD_ELEMENT, {"name": root_element}), \
+                                xf.element(_XSD_COMPLEXTYPE), xf.element(_XSD_SEQUENCE):
+                            self._write_xsd_fields(xf, fields)
+    
+    def _cached_profile(self, args: Tuple, fields: List[Dict],
+                        build: Callable[[], str]) -> str:
+        """Serialized profile from _PROFILE_CACHE, calling build on a miss"""
+        try:
+            key = (args, _freeze(fields))
+            hash(key)
+        except (TypeError, RecursionError):
+            # Unhashable or unsortable values, or nesting too deep to freeze
+            return build()
+        
+        xml = _PROFILE_CACHE.get(key)
+        if xml is None:
+            xml = build()
+            if len(_PROFILE_CACHE) >= _PROFILE_CACHE_SIZE:
+                _PROFILE_CACHE.clear()
+            _PROFILE_CACHE[key] = xml
+        else:
+            # The profile XML does not contain its ID; still hand out a fresh one
+            self.component_id = _uuid4_str()
+        return xml
+    
+    def _build_xml_profile(self, name: str, fields: List[Dict],
+                           root_element: str, description: str) -> etree._Element:
+        """XML Profile component tree"""
         root = self._create_component_root(
-            BoomiComponentType.PROFILE_XML.value,
+            BoomiComponentType.PROFILE_XML,
             name,
             description or f"XML Profile: {name}"
         )
@@ -165,85 +444,118 @@ class ProfileGenerator(BoomiXMLBuilder):
         # Add XSD schema
         schema = etree.SubElement(
             profile, 
-            f"{{{XSD_NS}}}schema",
-            nsmap={'xsd': XSD_NS}
+            _XSD_SCHEMA,
+            {"elementFormDefault": "qualified"},
+            nsmap=_XSD_NSMAP
         )
-        schema.set("elementFormDefault", "qualified")
         
         # Create root element definition
-        root_elem = etree.SubElement(schema, f"{{{XSD_NS}}}element")
-        root_elem.set("name", root_element)
+        root_elem = etree.SubElement(schema, _XSD_ELEMENT, {"name": root_element})
         
         # Create complex type for root
-        complex_type = etree.SubElement(root_elem, f"{{{XSD_NS}}}complexType")
-        sequence = etree.SubElement(complex_type, f"{{{XSD_NS}}}sequence")
+        complex_type = etree.SubElement(root_elem, _XSD_COMPLEXTYPE)
+        sequence = etree.SubElement(complex_type, _XSD_SEQUENCE)
         
         # Add fields
         self._add_xsd_fields(sequence, fields, schema)
         
-        return self.to_string(root)
+        return root
     
     def _add_xsd_fields(self, parent: etree._Element, fields: List[Dict],
                        schema: etree._Element, prefix: str = ""):
         """Add XSD field definitions"""
+        # Explicit work stack instead of recursion, so deeply nested
+        # schemas cannot run into the recursion limit. Each sequence only
+        # receives its own children, so the visiting order does not matter.
+        stack = [(parent, fields, prefix)]
+        
+        # Fields differ mostly by name: clone a detached prototype per
+        # cardinality/type combination and fill in the name, which is about
+        # twice as fast as creating the element and its attributes each time
+        prototypes = {}
+        element_attrib = self._xsd_element_attrib
+        sub_element = etree.SubElement
+        clone = copy.copy
+        
+        while stack:
+            parent, fields, prefix = stack.pop()
+            append = parent.append
+            for field_def in fields:
+                name = field_def.get('name', '')
+                if not name:
+                    continue
+                
+                children = field_def.get('children', [])
+                
+                # Name, cardinality and (simple fields only) type
+                attrib = element_attrib(field_def, name)
+                key = (attrib["minOccurs"], attrib["maxOccurs"], attrib.get("type"))
+                prototype = prototypes.get(key)
+                if prototype is None:
+                    attrib["name"] = ""
+                    prototype = prototypes[key] = etree.Element(_XSD_ELEMENT, attrib)
+                elem = clone(prototype)
+                append(elem)
+                elem.set("name", name)
+                
+                # Nested structure: complex type with children
+                if children:
+                    complex_type = sub_element(elem, _XSD_COMPLEXTYPE)
+                    sequence = sub_element(complex_type, _XSD_SEQUENCE)
+                    stack.append((sequence, children, f"{prefix}{name}/"))
+    
+    def _write_xsd_fields(self, xf, fields: List[Dict]):
+        """Stream XSD field definitions into an open etree.xmlfile"""
         for field_def in fields:
             name = field_def.get('name', '')
             if not name:
                 continue
             
-            field_type = field_def.get('type', 'string')
-            is_array = field_def.get('is_array', False)
             children = field_def.get('children', [])
-            
-            elem = etree.SubElement(parent, f"{{{XSD_NS}}}element")
-            elem.set("name", name)
-            
-            # Handle array cardinality
-            if is_array:
-                elem.set("minOccurs", "0")
-                elem.set("maxOccurs", "unbounded")
-            else:
-                elem.set("minOccurs", field_def.get('min_occurs', '0'))
-                max_occurs = field_def.get('max_occurs', '1')
-                if max_occurs == -1:
-                    max_occurs = 'unbounded'
-                elem.set("maxOccurs", str(max_occurs))
-            
-            # Handle nested structure vs simple type
-            if children:
-                # Complex type with children
-                complex_type = etree.SubElement(elem, f"{{{XSD_NS}}}complexType")
-                sequence = etree.SubElement(complex_type, f"{{{XSD_NS}}}sequence")
-                self._add_xsd_fields(sequence, children, schema, f"{prefix}{name}/")
-            else:
-                # Simple type
-                xsd_type = self._map_type_to_xsd(field_type)
-                elem.set("type", xsd_type)
+            with xf.element(_XSD_ELEMENT, self._xsd_element_attrib(field_def, name)):
+                if children:
+                    with xf.element(_XSD_COMPLEXTYPE), xf.element(_XSD_SEQUENCE):
+                        self._write_xsd_fields(xf, children)
+    
+    def _xsd_element_attrib(self, field_def: Dict, name: str) -> Dict[str, str]:
+        """xsd:element attributes for a field: name, cardinality and, for simple fields, type"""
+        if field_def.get('is_array', False):
+            attrib = {"name": name, "minOccurs": "0", "maxOccurs": "unbounded"}
+        else:
+            max_occurs = field_def.get('max_occurs', '1')
+            if max_occurs == -1:
+                max_occurs = 'unbounded'
+            attrib = {
+                "name": name,
+                "minOccurs": field_def.get('min_occurs', '0'),
+                "maxOccurs": str(max_occurs),
+            }
+        
+        if not field_def.get('children', []):
+            attrib["type"] = self._map_type_to_xsd(field_def.get('type', 'string'))
+        return attrib
     
     def _map_type_to_xsd(self, wm_type: str) -> str:
         """Map webMethods type to XSD type"""
-        type_map = {
-            'string': 'xsd:string',
-            'integer': 'xsd:integer',
-            'int': 'xsd:int',
-            'long': 'xsd:long',
-            'float': 'xsd:float',
-            'double': 'xsd:double',
-            'decimal': 'xsd:decimal',
-            'boolean': 'xsd:boolean',
-            'date': 'xsd:date',
-            'datetime': 'xsd:dateTime',
-            'time': 'xsd:time',
-            'binary': 'xsd:base64Binary',
-            'object': 'xsd:anyType',
-        }
-        return type_map.get(wm_type.lower(), 'xsd:string')
+        # Type names usually arrive lower-case already: one lookup, no .lower()
+        xsd_type = _XSD_TYPE_MAP.get(wm_type)
+        if xsd_type is None:
+            xsd_type = _XSD_TYPE_MAP.get(_type_key(wm_type), 'xsd:string')
+        return xsd_type
     
     def generate_json_profile(self, name: str, fields: List[Dict],
                              description: str = "") -> str:
         """Generate JSON Profile component"""
+        return self._cached_profile(
+            ("json", name, description), fields,
+            lambda: self._build_json_profile(name, fields, description)
+        )
+    
+    def _build_json_profile(self, name: str, fields: List[Dict],
+                            description: str) -> str:
+        """Serialized JSON Profile component"""
         root = self._create_component_root(
-            BoomiComponentType.PROFILE_JSON.value,
+            BoomiComponentType.PROFILE_JSON,
             name,
             description or f"JSON Profile: {name}"
         )
@@ -261,7 +573,9 @@ class ProfileGenerator(BoomiXMLBuilder):
     
     def _generate_json_schema(self, fields: List[Dict]) -> str:
         """Generate JSON Schema string"""
-        import json
+        # (properties dict, child fields) still to fill in; worked off
+        # iteratively so nesting depth is not bounded by the recursion limit
+        pending = []
         
         def field_to_schema(field_def: Dict) -> Dict:
             name = field_def.get('name', '')
@@ -272,23 +586,14 @@ class ProfileGenerator(BoomiXMLBuilder):
             if children:
                 # Object with properties
                 props = {}
-                for child in children:
-                    props[child.get('name', '')] = field_to_schema(child)
+                pending.append((props, children))
                 
                 schema = {"type": "object", "properties": props}
             else:
                 # Simple type
-                json_type = {
-                    'string': 'string',
-                    'integer': 'integer',
-                    'int': 'integer',
-                    'long': 'integer',
-                    'float': 'number',
-                    'double': 'number',
-                    'boolean': 'boolean',
-                    'date': 'string',
-                    'datetime': 'string',
-                }.get(field_type.lower(), 'string')
+                json_type = _JSON_TYPE_MAP.get(field_type)
+                if json_type is None:
+                    json_type = _JSON_TYPE_MAP.get(_type_key(field_type), 'string')
                 
                 schema = {"type": json_type}
             
@@ -308,14 +613,25 @@ class ProfileGenerator(BoomiXMLBuilder):
             if name:
                 root_schema["properties"][name] = field_to_schema(field_def)
         
-        return json.dumps(root_schema, indent=2)
+        while pending:
+            props, children = pending.pop()
+            for child in children:
+                props[child.get('name', '')] = field_to_schema(child)
+        
+        # Compact: the schema is embedded in the component XML, not read by people
+        if orjson is not None:
+            try:
+                return orjson.dumps(root_schema).decode()
+            except orjson.JSONEncodeError:
+                pass  # non-string field names or nesting deeper than orjson allows
+        return json.dumps(root_schema, separators=(',', ':'))
     
     def generate_flatfile_profile(self, name: str, fields: List[Dict],
                                   delimiter: str = ",",
                                   description: str = "") -> str:
         """Generate Flat File Profile component"""
         root = self._create_component_root(
-            BoomiComponentType.PROFILE_FLATFILE.value,
+            BoomiComponentType.PROFILE_FLATFILE,
             name,
             description or f"Flat File Profile: {name}"
         )
@@ -348,25 +664,17 @@ class ProfileGenerator(BoomiXMLBuilder):
     
     def _map_type_to_flatfile(self, wm_type: str) -> str:
         """Map type to Flat File data type"""
-        type_map = {
-            'string': 'Character',
-            'integer': 'Number',
-            'int': 'Number',
-            'long': 'Number',
-            'float': 'Number',
-            'double': 'Number',
-            'date': 'Date/Time',
-            'datetime': 'Date/Time',
-            'boolean': 'Character',
-        }
-        return type_map.get(wm_type.lower(), 'Character')
+        flatfile_type = _FLATFILE_TYPE_MAP.get(wm_type)
+        if flatfile_type is None:
+            flatfile_type = _FLATFILE_TYPE_MAP.get(_type_key(wm_type), 'Character')
+        return flatfile_type
     
     def generate_edi_profile(self, name: str, transaction_set: str,
                             version: str = "005010",
                             description: str = "") -> str:
         """Generate EDI Profile component"""
         root = self._create_component_root(
-            BoomiComponentType.PROFILE_EDI.value,
+            BoomiComponentType.PROFILE_EDI,
             name,
             description or f"EDI Profile: {transaction_set}"
         )
@@ -387,22 +695,106 @@ class ProfileGenerator(BoomiXMLBuilder):
         return self.to_string(root)
 
 
+# generate_many spec "kind" -> ProfileGenerator method
+_PROFILE_METHODS = {
+    "xml": "generate_xml_profile",
+    "json": "generate_json_profile",
+    "flatfile": "generate_flatfile_profile",
+    "edi": "generate_edi_profile",
+}
+
+# Generator reused by every generate_many task in a process
+_worker_profile_generator: Optional[ProfileGenerator] = None
+
+
+def _generate_one(spec: Dict[str, Any]) -> str:
+    """Generate the profile for one generate_many spec"""
+    global _worker_profile_generator
+    if _worker_profile_generator is None:
+        _worker_profile_generator = ProfileGenerator()
+    
+    kwargs = dict(spec)
+    method = _PROFILE_METHODS[kwargs.pop("kind", "xml")]
+    return getattr(_worker_profile_generator, method)(**kwargs)
+
+
 # =============================================================================
 # PROCESS GENERATOR
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessShape:
-    """Represents a shape in a Boomi process"""
+    """
+    Represents a shape in a Boomi process.
+    
+    Frozen: the generator keeps its own copy of each shape's fields, so a
+    handle is a read-only snapshot (its configuration object is shared).
+    """
     id: str
     type: BoomiShapeType
     name: str
     x: int = 0
     y: int = 0
-    configuration: Dict[str, Any] = field(default_factory=dict)
+    configuration: Any = field(default_factory=dict)
+
+
+# Typed shape configurations. new_shape converts a configuration dict for
+# these shape types once, keeping only the known keys; a field left at None
+# means the key was not given and its element is omitted.
+
+@dataclass(slots=True)
+class MapShapeConfig:
+    """Map shape configuration"""
+    source_profile: Optional[str] = None
+    target_profile: Optional[str] = None
+    mappings: Optional[List[Dict]] = None
+
+
+@dataclass(slots=True)
+class DecisionShapeConfig:
+    """Decision shape configuration"""
+    property: Optional[str] = None
+    routes: Optional[List[Dict]] = None
+
+
+@dataclass(slots=True)
+class DataProcessShapeConfig:
+    """Data Process shape configuration"""
+    type: str = 'Custom Scripting'
+    script: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ConnectorShapeConfig:
+    """Connector shape configuration"""
+    connector_type: str = 'HTTP'
+    connection_id: Optional[str] = None
+    operation_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SetPropertiesShapeConfig:
+    """Set Properties shape configuration"""
+    properties: Optional[List[Dict]] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class FlowControlShapeConfig:
+    """Flow Control shape configuration"""
+    flow_type: str = 'For Each Document'
+
+
+_SHAPE_CONFIG_TYPES = {
+    BoomiShapeType.MAP: MapShapeConfig,
+    BoomiShapeType.DECISION: DecisionShapeConfig,
+    BoomiShapeType.DATA_PROCESS: DataProcessShapeConfig,
+    BoomiShapeType.CONNECTOR: ConnectorShapeConfig,
+    BoomiShapeType.SET_PROPERTIES: SetPropertiesShapeConfig,
+    BoomiShapeType.FLOW_CONTROL: FlowControlShapeConfig,
+}
+
+
+@dataclass(slots=True)
 class ProcessConnection:
     """Connection between shapes"""
     from_shape: str
@@ -415,17 +807,53 @@ class ProcessGenerator(BoomiXMLBuilder):
     
     def __init__(self):
         super().__init__()
-        self.shapes: List[ProcessShape] = []
+        # Shapes are stored column-wise (one entry per shape in each list);
+        # ProcessShape objects are only built on demand by the shapes property
+        self._sh_ids: List[str] = []
+        self._sh_types: List[BoomiShapeType] = []
+        self._sh_names: List[str] = []
+        self._sh_x = array('i')
+        self._sh_y = array('i')
+        self._sh_cfg: List[Any] = []
         self.connections: List[ProcessConnection] = []
+        # Shape-specific configuration writers, one lookup per shape
+        self._shape_dispatch = {
+            BoomiShapeType.MAP: self._add_map_config,
+            BoomiShapeType.DECISION: self._add_decision_config,
+            BoomiShapeType.DATA_PROCESS: self._add_data_process_config,
+            BoomiShapeType.CONNECTOR: self._add_connector_config,
+            BoomiShapeType.SET_PROPERTIES: self._add_set_properties_config,
+            BoomiShapeType.FLOW_CONTROL: self._add_flow_control_config,
+        }
         self.shape_counter = 0
         self.current_x = 100
         self.current_y = 100
     
     def new_shape(self, shape_type: BoomiShapeType, name: str, 
-                  config: Dict = None) -> ProcessShape:
-        """Create a new shape"""
+                  config: Any = None) -> ProcessShape:
+        """
+        Create a new shape.
+        
+        config is a dict or, for configurable shape types, the matching
+        typed configuration (MapShapeConfig, ...); dicts are converted.
+        """
         self.shape_counter += 1
         shape_id = f"shape_{self.shape_counter}"
+        configuration = config or {}
+        
+        config_type = _SHAPE_CONFIG_TYPES.get(shape_type)
+        if config_type is not None and isinstance(configuration, dict):
+            configuration = config_type(**{
+                key: configuration[key]
+                for key in config_type.__slots__ if key in configuration
+            })
+        
+        self._sh_ids.append(shape_id)
+        self._sh_types.append(shape_type)
+        self._sh_names.append(name)
+        self._sh_x.append(self.current_x)
+        self._sh_y.append(self.current_y)
+        self._sh_cfg.append(configuration)
         
         shape = ProcessShape(
             id=shape_id,
@@ -433,11 +861,9 @@ class ProcessGenerator(BoomiXMLBuilder):
             name=name,
             x=self.current_x,
             y=self.current_y,
-            configuration=config or {}
+            configuration=configuration
         )
         
-        self.shapes.append(shape)
-        
         # Move position for next shape
         self.current_x += 150
         if self.current_x > 800:
@@ -446,6 +872,17 @@ class ProcessGenerator(BoomiXMLBuilder):
         
         return shape
     
+    @property
+    def shapes(self) -> Tuple[ProcessShape, ...]:
+        """Shapes added so far, in order (read-only; add shapes with new_shape)"""
+        return tuple(
+            ProcessShape(id=id_, type=type_, name=name, x=x, y=y, configuration=cfg)
+            for id_, type_, name, x, y, cfg in zip(
+                self._sh_ids, self._sh_types, self._sh_names,
+                self._sh_x, self._sh_y, self._sh_cfg
+            )
+        )
+    
     def connect(self, from_shape: ProcessShape, to_shape: ProcessShape,
                 label: str = ""):
         """Connect two shapes"""
@@ -458,7 +895,7 @@ class ProcessGenerator(BoomiXMLBuilder):
     def generate_process(self, name: str, description: str = "") -> str:
         """Generate complete process XML"""
         root = self._create_component_root(
-            BoomiComponentType.PROCESS.value,
+            BoomiComponentType.PROCESS,
             name,
             description or f"Process: {name}"
         )
@@ -466,63 +903,59 @@ class ProcessGenerator(BoomiXMLBuilder):
         obj = self._add_object_element(root)
         
         # Create Process element
-        process = etree.SubElement(obj, "Process")
-        process.set("processId", self.component_id)
+        process = etree.SubElement(obj, "Process", {"processId": self.component_id})
         
         # Add shapes
         shapes_elem = etree.SubElement(process, "Shapes")
-        for shape in self.shapes:
-            self._add_shape(shapes_elem, shape)
+        shapes_elem.extend(
+            self._build_shape_elem(index) for index in range(len(self._sh_ids))
+        )
         
         # Add connections
         conns_elem = etree.SubElement(process, "Connectors")
-        for conn in self.connections:
-            self._add_connection(conns_elem, conn)
+        conns_elem.extend(self._build_connection_elem(conn) for conn in self.connections)
         
         return self.to_string(root)
     
-    def _add_shape(self, parent: etree._Element, shape: ProcessShape):
-        """Add shape XML"""
-        shape_elem = etree.SubElement(parent, "Shape")
-        shape_elem.set("id", shape.id)
-        shape_elem.set("type", shape.type.value)
+    def _build_shape_elem(self, index: int) -> etree._Element:
+        """Detached Shape element for the shape at index"""
+        shape_type = self._sh_types[index]
+        configuration = self._sh_cfg[index]
+        
+        shape_elem = etree.Element(
+            "Shape", {"id": self._sh_ids[index], "type": shape_type}
+        )
         
         # Position
-        pos = etree.SubElement(shape_elem, "Position")
-        pos.set("x", str(shape.x))
-        pos.set("y", str(shape.y))
+        etree.SubElement(
+            shape_elem, "Position",
+            {"x": str(self._sh_x[index]), "y": str(self._sh_y[index])}
+        )
         
         # Name/Label
-        etree.SubElement(shape_elem, "Name").text = shape.name
+        etree.SubElement(shape_elem, "Name").text = self._sh_names[index]
         
         # Shape-specific configuration
-        if shape.type == BoomiShapeType.MAP:
-            self._add_map_config(shape_elem, shape.configuration)
-        elif shape.type == BoomiShapeType.DECISION:
-            self._add_decision_config(shape_elem, shape.configuration)
-        elif shape.type == BoomiShapeType.DATA_PROCESS:
-            self._add_data_process_config(shape_elem, shape.configuration)
-        elif shape.type == BoomiShapeType.CONNECTOR:
-            self._add_connector_config(shape_elem, shape.configuration)
-        elif shape.type == BoomiShapeType.SET_PROPERTIES:
-            self._add_set_properties_config(shape_elem, shape.configuration)
-        elif shape.type == BoomiShapeType.FLOW_CONTROL:
-            self._add_flow_control_config(shape_elem, shape.configuration)
-    
-    def _add_map_config(self, shape_elem: etree._Element, config: Dict):
+        handler = self._shape_dispatch.get(shape_type)
+        if handler is not None:
+            handler(shape_elem, configuration)
+        
+        return shape_elem
+    
+    def _add_map_config(self, shape_elem: etree._Element, config: MapShapeConfig):
         """Add Map shape configuration"""
         map_config = etree.SubElement(shape_elem, "MapConfiguration")
         
         # Profile references
-        if 'source_profile' in config:
-            etree.SubElement(map_config, "SourceProfile").text = config['source_profile']
-        if 'target_profile' in config:
-            etree.SubElement(map_config, "TargetProfile").text = config['target_profile']
+        if config.source_profile is not None:
+            etree.SubElement(map_config, "SourceProfile").text = config.source_profile
+        if config.target_profile is not None:
+            etree.SubElement(map_config, "TargetProfile").text = config.target_profile
         
         # Field mappings
-        if 'mappings' in config:
+        if config.mappings is not None:
             mappings = etree.SubElement(map_config, "Mappings")
-            for mapping in config['mappings']:
+            for mapping in config.mappings:
                 map_elem = etree.SubElement(mappings, "Mapping")
                 etree.SubElement(map_elem, "Source").text = mapping.get('source', '')
                 etree.SubElement(map_elem, "Target").text = mapping.get('target', '')
@@ -530,67 +963,67 @@ class ProcessGenerator(BoomiXMLBuilder):
                     func = etree.SubElement(map_elem, "Function")
                     func.set("name", mapping['function'])
     
-    def _add_decision_config(self, shape_elem: etree._Element, config: Dict):
+    def _add_decision_config(self, shape_elem: etree._Element, config: DecisionShapeConfig):
         """Add Decision shape configuration"""
         decision = etree.SubElement(shape_elem, "DecisionConfiguration")
         
         # Condition
-        if 'property' in config:
-            etree.SubElement(decision, "Property").text = config['property']
+        if config.property is not None:
+            etree.SubElement(decision, "Property").text = config.property
         
         # Routes
-        if 'routes' in config:
+        if config.routes is not None:
             routes = etree.SubElement(decision, "Routes")
-            for route in config['routes']:
+            for route in config.routes:
                 route_elem = etree.SubElement(routes, "Route")
                 etree.SubElement(route_elem, "Value").text = route.get('value', '')
                 etree.SubElement(route_elem, "Label").text = route.get('label', '')
     
-    def _add_data_process_config(self, shape_elem: etree._Element, config: Dict):
+    def _add_data_process_config(self, shape_elem: etree._Element, config: DataProcessShapeConfig):
         """Add Data Process shape configuration"""
         dp = etree.SubElement(shape_elem, "DataProcessConfiguration")
         
-        etree.SubElement(dp, "ProcessingType").text = config.get('type', 'Custom Scripting')
+        etree.SubElement(dp, "ProcessingType").text = config.type
         
-        if 'script' in config:
+        if config.script is not None:
             script = etree.SubElement(dp, "Script")
-            script.text = config['script']
+            script.text = config.script
     
-    def _add_connector_config(self, shape_elem: etree._Element, config: Dict):
+    def _add_connector_config(self, shape_elem: etree._Element, config: ConnectorShapeConfig):
         """Add Connector shape configuration"""
         conn = etree.SubElement(shape_elem, "ConnectorConfiguration")
         
-        etree.SubElement(conn, "ConnectorType").text = config.get('connector_type', 'HTTP')
+        etree.SubElement(conn, "ConnectorType").text = config.connector_type
         
-        if 'connection_id' in config:
-            etree.SubElement(conn, "ConnectionId").text = config['connection_id']
-        if 'operation_id' in config:
-            etree.SubElement(conn, "OperationId").text = config['operation_id']
+        if config.connection_id is not None:
+            etree.SubElement(conn, "ConnectionId").text = config.connection_id
+        if config.operation_id is not None:
+            etree.SubElement(conn, "OperationId").text = config.operation_id
     
-    def _add_set_properties_config(self, shape_elem: etree._Element, config: Dict):
+    def _add_set_properties_config(self, shape_elem: etree._Element,
+                                   config: SetPropertiesShapeConfig):
         """Add Set Properties configuration"""
         props = etree.SubElement(shape_elem, "SetPropertiesConfiguration")
         
-        if 'properties' in config:
-            for prop in config['properties']:
+        if config.properties is not None:
+            for prop in config.properties:
                 prop_elem = etree.SubElement(props, "Property")
                 etree.SubElement(prop_elem, "Name").text = prop.get('name', '')
                 etree.SubElement(prop_elem, "Value").text = prop.get('value', '')
                 etree.SubElement(prop_elem, "Type").text = prop.get('type', 'Document')
     
-    def _add_flow_control_config(self, shape_elem: etree._Element, config: Dict):
+    def _add_flow_control_config(self, shape_elem: etree._Element, config: FlowControlShapeConfig):
         """Add Flow Control configuration"""
         fc = etree.SubElement(shape_elem, "FlowControlConfiguration")
         
-        etree.SubElement(fc, "Type").text = config.get('flow_type', 'For Each Document')
+        etree.SubElement(fc, "Type").text = config.flow_type
     
-    def _add_connection(self, parent: etree._Element, conn: ProcessConnection):
-        """Add connection XML"""
-        conn_elem = etree.SubElement(parent, "Connector")
-        conn_elem.set("from", conn.from_shape)
-        conn_elem.set("to", conn.to_shape)
+    def _build_connection_elem(self, conn: ProcessConnection) -> etree._Element:
+        """Detached Connector element for a connection"""
+        attrib = {"from": conn.from_shape, "to": conn.to_shape}
         if conn.label:
-            conn_elem.set("label", conn.label)
+            attrib["label"] = conn.label
+        return etree.Element("Connector", attrib)
 
 
 # =============================================================================
@@ -618,7 +1051,7 @@ class MapGenerator(BoomiXMLBuilder):
                           - function: optional transformation function
         """
         root = self._create_component_root(
-            BoomiComponentType.MAP.value,
+            BoomiComponentType.MAP,
             name,
             description or f"Map: {name}"
         )
@@ -638,25 +1071,18 @@ class MapGenerator(BoomiXMLBuilder):
         for mapping in field_mappings:
             map_entry = etree.SubElement(mappings, "Mapping")
             
-            # Source field
-            source = etree.SubElement(map_entry, "SourceField")
-            source.set("path", mapping.get('source', ''))
-            
-            # Target field
-            target = etree.SubElement(map_entry, "TargetField")
-            target.set("path", mapping.get('target', ''))
+            # Source and target fields
+            etree.SubElement(map_entry, "SourceField", {"path": mapping.get('source', '')})
+            etree.SubElement(map_entry, "TargetField", {"path": mapping.get('target', '')})
             
             # Optional function
             if 'function' in mapping:
-                func = etree.SubElement(map_entry, "Function")
-                func.set("name", mapping['function'])
+                func = etree.SubElement(map_entry, "Function", {"name": mapping['function']})
                 
                 # Function parameters
                 if 'parameters' in mapping:
                     for param_name, param_value in mapping['parameters'].items():
-                        param = etree.SubElement(func, "Parameter")
-                        param.set("name", param_name)
-                        param.text = str(param_value)
+                        etree.SubElement(func, "Parameter", {"name": param_name}).text = str(param_value)
         
         return self.to_string(root)
 
@@ -668,74 +1094,60 @@ class MapGenerator(BoomiXMLBuilder):
 class ConnectorGenerator(BoomiXMLBuilder):
     """Generates Boomi Connector/Connection/Operation XML"""
     
+    def _format_connection(self, name: str, description: str,
+                           conn_type: str, body: str) -> str:
+        """Fill the connection component template (no tree is built)"""
+        self.component_id = _uuid4_str()
+        return _CONNECTION_TMPL.format(
+            name=_xml_text(name),
+            description=_xml_text(description),
+            type=conn_type,
+            body=body
+        )
+    
     def generate_database_connection(self, name: str, 
                                      connection_string: str,
                                      driver_type: str = "mysql",
                                      description: str = "") -> str:
         """Generate Database Connection component"""
-        root = self._create_component_root(
-            BoomiComponentType.CONNECTION.value,
-            name,
-            description or f"Database Connection: {name}"
-        )
-        
-        obj = self._add_object_element(root)
-        
-        conn = etree.SubElement(obj, "Connection")
-        conn.set("type", "database")
-        
-        etree.SubElement(conn, "DriverType").text = driver_type
-        etree.SubElement(conn, "ConnectionString").text = connection_string
-        
         # Credentials would be added via Boomi connection management
-        etree.SubElement(conn, "User").text = "${db.user}"
-        etree.SubElement(conn, "Password").text = "${db.password}"
-        
-        return self.to_string(root)
+        body = _DB_CONNECTION_BODY.format(
+            driver_type=_xml_text(driver_type),
+            connection_string=_xml_text(connection_string),
+            user=_DB_USER,
+            password=_DB_PASSWORD
+        )
+        return self._format_connection(
+            name, description or f"Database Connection: {name}", "database", body
+        )
     
     def generate_http_connection(self, name: str,
                                  base_url: str,
                                  auth_type: str = "None",
                                  description: str = "") -> str:
         """Generate HTTP Connection component"""
-        root = self._create_component_root(
-            BoomiComponentType.CONNECTION.value,
-            name,
-            description or f"HTTP Connection: {name}"
+        body = _HTTP_CONNECTION_BODY.format(
+            base_url=_xml_text(base_url),
+            auth_type=_xml_text(auth_type)
+        )
+        return self._format_connection(
+            name, description or f"HTTP Connection: {name}", "http", body
         )
-        
-        obj = self._add_object_element(root)
-        
-        conn = etree.SubElement(obj, "Connection")
-        conn.set("type", "http")
-        
-        etree.SubElement(conn, "BaseURL").text = base_url
-        etree.SubElement(conn, "AuthenticationType").text = auth_type
-        
-        return self.to_string(root)
     
     def generate_ftp_connection(self, name: str,
                                 host: str,
                                 port: int = 21,
                                 description: str = "") -> str:
         """Generate FTP Connection component"""
-        root = self._create_component_root(
-            BoomiComponentType.CONNECTION.value,
-            name,
-            description or f"FTP Connection: {name}"
+        body = _FTP_CONNECTION_BODY.format(
+            host=_xml_text(host),
+            port=_xml_text(str(port)),
+            user=_FTP_USER,
+            password=_FTP_PASSWORD
+        )
+        return self._format_connection(
+            name, description or f"FTP Connection: {name}", "ftp", body
         )
-        
-        obj = self._add_object_element(root)
-        
-        conn = etree.SubElement(obj, "Connection")
-        conn.set("type", "ftp")
-        
-        etree.SubElement(conn, "Host").text = host
-        etree.SubElement(conn, "Port").text = str(port)
-        etree.SubElement(conn, "User").text = "${ftp.user}"
-        etree.SubElement(conn, "Password").text = "${ftp.password}"
-        
-        return self.to_string(root)
     
     def generate_database_operation(self, name: str,
                                    connection_id: str,
@@ -744,16 +1156,16 @@ class ConnectorGenerator(BoomiXMLBuilder):
                                    description: str = "") -> str:
         """Generate Database Operation component"""
         root = self._create_component_root(
-            BoomiComponentType.OPERATION.value,
+            BoomiComponentType.OPERATION,
             name,
             description or f"Database {operation_type}: {name}"
         )
         
         obj = self._add_object_element(root)
         
-        op = etree.SubElement(obj, "Operation")
-        op.set("type", "database")
-        op.set("connectionId", connection_id)
+        op = etree.SubElement(
+            obj, _TAG_OPERATION, {"type": "database", "connectionId": connection_id}
+        )
         
         etree.SubElement(op, "OperationType").text = operation_type
         
@@ -776,19 +1188,19 @@ class ConnectorGenerator(BoomiXMLBuilder):
             config: Configuration from JDBC analyzer
         """
         root = self._create_component_root(
-            BoomiComponentType.CONNECTOR.value,
+            BoomiComponentType.CONNECTOR,
             name,
             f"Database Connector: {name} ({operation_type})"
         )
         
         obj = self._add_object_element(root)
         
-        connector = etree.SubElement(obj, "Connector")
-        connector.set("type", "database")
-        connector.set("componentId", str(uuid.uuid4()))
+        connector = etree.SubElement(
+            obj, _TAG_CONNECTOR, {"type": "database", "componentId": _uuid4_str()}
+        )
         
         # Operation
-        etree.SubElement(connector, "Operation").text = operation_type.upper()
+        etree.SubElement(connector, _TAG_OPERATION).text = operation_type.upper()
         
         # SQL
         sql_elem = etree.SubElement(connector, "SQL")
@@ -798,22 +1210,20 @@ class ConnectorGenerator(BoomiXMLBuilder):
         if 'tables' in config:
             tables_elem = etree.SubElement(connector, "Tables")
             for table in config['tables']:
-                t_elem = etree.SubElement(tables_elem, "Table")
-                t_elem.set("name", table.get('name', ''))
+                attrib = {"name": table.get('name', '')}
                 if table.get('alias'):
-                    t_elem.set("alias", table['alias'])
+                    attrib["alias"] = table['alias']
+                etree.SubElement(tables_elem, "Table", attrib)
         
         # Columns info
         if 'columns' in config:
             cols_elem = etree.SubElement(connector, "Columns")
             for col in config['columns']:
-                c_elem = etree.SubElement(cols_elem, "Column")
-                c_elem.set("name", col.get('name', ''))
+                etree.SubElement(cols_elem, "Column", {"name": col.get('name', '')})
         
-        # Add conversion notes as comments
-        if 'notes' in config:
-            for note in config['notes']:
-                connector.append(etree.Comment(f" {note} "))
+        # Add conversion notes as a single comment
+        if config.get('notes'):
+            connector.append(etree.Comment(f" {' | '.join(config['notes'])} "))
         
         return self.to_string(root)
     
@@ -826,16 +1236,16 @@ class ConnectorGenerator(BoomiXMLBuilder):
             config: HTTP configuration (url, method, headers)
         """
         root = self._create_component_root(
-            BoomiComponentType.CONNECTOR.value,
+            BoomiComponentType.CONNECTOR,
             name,
             f"HTTP Connector: {name}"
         )
         
         obj = self._add_object_element(root)
         
-        connector = etree.SubElement(obj, "Connector")
-        connector.set("type", "http-client")
-        connector.set("componentId", str(uuid.uuid4()))
+        connector = etree.SubElement(
+            obj, _TAG_CONNECTOR, {"type": "http-client", "componentId": _uuid4_str()}
+        )
         
         # URL
         etree.SubElement(connector, "URL").text = config.get('url', '')
@@ -847,14 +1257,11 @@ class ConnectorGenerator(BoomiXMLBuilder):
         if config.get('headers'):
             headers = etree.SubElement(connector, "Headers")
             for hdr_name, hdr_value in config['headers'].items():
-                h = etree.SubElement(headers, "Header")
-                h.set("name", hdr_name)
-                h.text = hdr_value
+                etree.SubElement(headers, "Header", {"name": hdr_name}).text = hdr_value
         
         # Authentication
         if config.get('auth_type'):
-            auth = etree.SubElement(connector, "Authentication")
-            auth.set("type", config['auth_type'])
+            etree.SubElement(connector, "Authentication", {"type": config['auth_type']})
         
         # Content Type
         if config.get('content_type'):
@@ -874,26 +1281,26 @@ class ConnectorGenerator(BoomiXMLBuilder):
         connector_type = "sftp" if is_sftp else "ftp"
         
         root = self._create_component_root(
-            BoomiComponentType.CONNECTOR.value,
+            BoomiComponentType.CONNECTOR,
             name,
             f"{'SFTP' if is_sftp else 'FTP'} Connector: {name}"
         )
         
         obj = self._add_object_element(root)
         
-        connector = etree.SubElement(obj, "Connector")
-        connector.set("type", connector_type)
-        connector.set("componentId", str(uuid.uuid4()))
+        connector = etree.SubElement(
+            obj, _TAG_CONNECTOR, {"type": connector_type, "componentId": _uuid4_str()}
+        )
         
         # Host
-        etree.SubElement(connector, "Host").text = config.get('host', '')
+        etree.SubElement(connector, _TAG_HOST).text = config.get('host', '')
         
         # Port
         default_port = 22 if is_sftp else 21
-        etree.SubElement(connector, "Port").text = str(config.get('port', default_port))
+        etree.SubElement(connector, _TAG_PORT).text = str(config.get('port', default_port))
         
         # Operation
-        etree.SubElement(connector, "Operation").text = config.get('operation', 'get').upper()
+        etree.SubElement(connector, _TAG_OPERATION).text = config.get('operation', 'get').upper()
         
         # Remote path
         if config.get('path'):
@@ -904,8 +1311,8 @@ class ConnectorGenerator(BoomiXMLBuilder):
             etree.SubElement(connector, "FileMask").text = config['file_mask']
         
         # Credentials placeholder
-        etree.SubElement(connector, "User").text = "${ftp.user}"
-        etree.SubElement(connector, "Password").text = "${ftp.password}"
+        etree.SubElement(connector, _TAG_USER).text = _FTP_USER
+        etree.SubElement(connector, _TAG_PASSWORD).text = _FTP_PASSWORD
         
         return self.to_string(root)
     
@@ -918,16 +1325,16 @@ class ConnectorGenerator(BoomiXMLBuilder):
             config: JMS configuration (queue/topic, operation)
         """
         root = self._create_component_root(
-            BoomiComponentType.CONNECTOR.value,
+            BoomiComponentType.CONNECTOR,
             name,
             f"JMS Connector: {name}"
         )
         
         obj = self._add_object_element(root)
         
-        connector = etree.SubElement(obj, "Connector")
-        connector.set("type", "jms")
-        connector.set("componentId", str(uuid.uuid4()))
+        connector = etree.SubElement(
+            obj, _TAG_CONNECTOR, {"type": "jms", "componentId": _uuid4_str()}
+        )
         
         # Destination (queue or topic)
         dest_type = config.get('destination_type', 'queue')
@@ -939,14 +1346,14 @@ class ConnectorGenerator(BoomiXMLBuilder):
         
         # Operation
         operation = config.get('operation', 'send')
-        etree.SubElement(connector, "Operation").text = operation.upper()
+        etree.SubElement(connector, _TAG_OPERATION).text = operation.upper()
         
         # Message type
         if config.get('message_type'):
             etree.SubElement(connector, "MessageType").text = config['message_type']
         
         # Connection factory (placeholder)
-        etree.SubElement(connector, "ConnectionFactory").text = "${jms.connection.factory}"
+        etree.SubElement(connector, "ConnectionFactory").text = _JMS_CONNECTION_FACTORY
         
         return self.to_string(root)
 
@@ -958,6 +1365,12 @@ __all__ = [
     'ProfileGenerator',
     'ProcessGenerator',
     'ProcessShape',
+    'MapShapeConfig',
+    'DecisionShapeConfig',
+    'DataProcessShapeConfig',
+    'ConnectorShapeConfig',
+    'SetPropertiesShapeConfig',
+    'FlowControlShapeConfig',
     'MapGenerator',
     'ConnectorGenerator',
 ]
@@ -1,9 +1,14 @@
 """
 Customer service for multi-customer management.
 """
+import asyncio
+import os
+import time
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import httpx
 from bson import ObjectId
 
@@ -16,15 +21,115 @@ from app.models import (
     CustomerListResponse,
     CustomerSettings,
     BoomiSettings,
+    BoomiDeploymentSettings,
     LLMSettings,
     ConnectionTestResult,
 )
 from app.services.logging_service import log_activity
+# One credential cache for all Boomi API calls
+from app.services.boomi_service import _auth_header_cached
+
+# LLM provider SDKs are optional; a missing one fails only its own provider's test
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Shared client for connection tests: repeated tests against the same Boomi
+# or Ollama host reuse the pooled connection instead of a new TCP/TLS handshake
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared connection-test client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared connection-test client (application shutdown hook)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Recent successful connection-test results keyed on (kind, customer,
+# credentials): dashboards polling every few seconds get the cached answer
+# for up to _TEST_RESULT_TTL seconds; changed credentials produce a new key.
+# Failures are never cached, so a retest after fixing the network or account
+# side goes straight to the live endpoint.
+_TEST_RESULT_TTL = 30.0
+_TEST_RESULT_CACHE_SIZE = 512
+_test_results: Dict[tuple, Tuple[float, ConnectionTestResult]] = {}
+
+
+def _cached_test_result(key: tuple) -> Optional[ConnectionTestResult]:
+    """Cached result for key, or None if missing or expired."""
+    entry = _test_results.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_test_result(key: tuple, result: ConnectionTestResult) -> ConnectionTestResult:
+    """Remember a successful result for key (cleared wholesale when full) and return it."""
+    if not result.success:
+        _test_results.pop(key, None)
+        return result
+    if len(_test_results) >= _TEST_RESULT_CACHE_SIZE:
+        _test_results.clear()
+    _test_results[key] = (time.monotonic() + _TEST_RESULT_TTL, result)
+    return result
+
+
+@lru_cache(maxsize=64)
+def _openai_client(api_key: str):
+    """AsyncOpenAI client per API key, built once and reused by later tests."""
+    return openai.AsyncOpenAI(api_key=api_key)
+
+
+# Retrieving a model verifies the key and model without a billable completion
+_ANTHROPIC_MODELS_URL = "https://api.anthropic.com/v1/models"
+_ANTHROPIC_VERSION = "2023-06-01"
 
 
 class CustomerService:
     """Service for managing customers."""
     
+    # Documents per cursor round trip when listing customers
+    LIST_BATCH_SIZE = 500
+    
+    # Only the fields CustomerResponse needs (skips _id and anything else
+    # stored on the document, so it is never sent or BSON-decoded)
+    _CUSTOMER_PROJECTION = {
+        "customerId": 1,
+        "customerName": 1,
+        "createdAt": 1,
+        "updatedAt": 1,
+        "settings": 1,
+        "isActive": 1,
+        "_id": 0,
+    }
+    
     @staticmethod
     def _encrypt_settings(settings: CustomerSettings) -> dict:
         """Encrypt sensitive fields in settings."""
@@ -65,7 +170,33 @@ class CustomerService:
             except Exception:
                 settings_dict["llm"]["apiKey"] = ""
         
-        return CustomerSettings(**settings_dict)
+        # The payload was written by _encrypt_settings from validated models,
+        # so build them directly instead of re-validating every field
+        boomi = settings_dict.get("boomi") or {}
+        if isinstance(boomi.get("deployment"), dict):
+            boomi = {
+                **boomi,
+                "deployment": BoomiDeploymentSettings.model_construct(**boomi["deployment"])
+            }
+        return CustomerSettings.model_construct(
+            boomi=BoomiSettings.model_construct(**boomi),
+            llm=LLMSettings.model_construct(**(settings_dict.get("llm") or {}))
+        )
+    
+    @staticmethod
+    async def _encrypt_settings_async(settings: CustomerSettings) -> dict:
+        """_encrypt_settings on a worker thread, keeping Fernet off the event loop."""
+        return await asyncio.to_thread(CustomerService._encrypt_settings, settings)
+    
+    @staticmethod
+    async def _decrypt_settings_async(settings_dict: dict) -> CustomerSettings:
+        """_decrypt_settings on a worker thread, keeping Fernet off the event loop."""
+        return await asyncio.to_thread(CustomerService._decrypt_settings, settings_dict)
+    
+    @staticmethod
+    def _decrypt_many(settings_dicts: List[dict]) -> List[CustomerSettings]:
+        """Decrypt a batch of settings in one pass (run off the event loop)."""
+        return [CustomerService._decrypt_settings(s) for s in settings_dicts]
     
     @staticmethod
     async def create(data: CustomerCreate) -> CustomerResponse:
@@ -73,10 +204,10 @@ class CustomerService:
         customers = get_customers_collection()
         
         customer_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         
         settings = data.settings or CustomerSettings()
-        encrypted_settings = CustomerService._encrypt_settings(settings)
+        encrypted_settings = await CustomerService._encrypt_settings_async(settings)
         
         doc = {
             "customerId": customer_id,
@@ -106,16 +237,8 @@ class CustomerService:
         )
     
     @staticmethod
-    async def get(customer_id: str) -> Optional[CustomerResponse]:
-        """Get a customer by ID."""
-        customers = get_customers_collection()
-        
-        doc = await customers.find_one({"customerId": customer_id})
-        if not doc:
-            return None
-        
-        settings = CustomerService._decrypt_settings(doc.get("settings", {}))
-        
+    def _to_response(doc: dict, settings: CustomerSettings) -> CustomerResponse:
+        """Build the API response for a stored customer document."""
         return CustomerResponse(
             customerId=doc["customerId"],
             customerName=doc["customerName"],
@@ -126,41 +249,78 @@ class CustomerService:
         )
     
     @staticmethod
-    async def list_all() -> CustomerListResponse:
-        """List all customers."""
+    def _active_customers_cursor():
+        """Cursor over active customers by name, fetched LIST_BATCH_SIZE at a time."""
         customers = get_customers_collection()
         
-        cursor = customers.find({"isActive": True}).sort("customerName", 1)
+        # Served by the (isActive, customerName) index created at startup
+        # (app.database.connect_to_mongodb), so Mongo never sorts in memory
+        return customers.find(
+            {"isActive": True},
+            projection=CustomerService._CUSTOMER_PROJECTION
+        ).sort("customerName", 1).batch_size(CustomerService.LIST_BATCH_SIZE)
+    
+    @staticmethod
+    async def get(customer_id: str) -> Optional[CustomerResponse]:
+        """Get a customer by ID."""
+        customers = get_customers_collection()
         
-        customer_list = []
-        async for doc in cursor:
-            settings = CustomerService._decrypt_settings(doc.get("settings", {}))
-            customer_list.append(CustomerResponse(
-                customerId=doc["customerId"],
-                customerName=doc["customerName"],
-                createdAt=doc["createdAt"],
-                updatedAt=doc["updatedAt"],
-                settings=settings,
-                isActive=doc.get("isActive", True)
-            ))
+        doc = await customers.find_one(
+            {"customerId": customer_id},
+            projection=CustomerService._CUSTOMER_PROJECTION
+        )
+        if not doc:
+            return None
+        
+        settings = await CustomerService._decrypt_settings_async(doc.get("settings", {}))
+        
+        return CustomerService._to_response(doc, settings)
+    
+    @staticmethod
+    async def list_all() -> CustomerListResponse:
+        """List all customers."""
+        docs = await CustomerService._active_customers_cursor().to_list(length=None)
+        
+        # Decrypt in one slice per CPU on worker threads (Fernet releases
+        # the GIL), instead of blocking the event loop once per customer
+        settings_dicts = [doc.get("settings", {}) for doc in docs]
+        step = -(-len(settings_dicts) // (os.cpu_count() or 1)) or 1
+        decrypted = await asyncio.gather(*(
+            asyncio.to_thread(CustomerService._decrypt_many, settings_dicts[i:i + step])
+            for i in range(0, len(settings_dicts), step)
+        ))
+        all_settings = [settings for chunk in decrypted for settings in chunk]
+        
+        customer_list = [
+            CustomerService._to_response(doc, settings)
+            for doc, settings in zip(docs, all_settings)
+        ]
         
         return CustomerListResponse(
             customers=customer_list,
             total=len(customer_list)
         )
     
+    @staticmethod
+    async def iter_all() -> AsyncIterator[CustomerResponse]:
+        """Yield active customers one at a time (for streaming callers such
+        as exports), never holding the full list in memory."""
+        async for doc in CustomerService._active_customers_cursor():
+            settings = await CustomerService._decrypt_settings_async(doc.get("settings", {}))
+            yield CustomerService._to_response(doc, settings)
+    
     @staticmethod
     async def update(customer_id: str, data: CustomerUpdate) -> Optional[CustomerResponse]:
         """Update a customer."""
         customers = get_customers_collection()
         
-        update_doc = {"updatedAt": datetime.utcnow()}
+        update_doc = {"updatedAt": datetime.now(timezone.utc)}
         
         if data.customerName is not None:
             update_doc["customerName"] = data.customerName
         
         if data.settings is not None:
-            update_doc["settings"] = CustomerService._encrypt_settings(data.settings)
+            update_doc["settings"] = await CustomerService._encrypt_settings_async(data.settings)
         
         result = await customers.update_one(
             {"customerId": customer_id},
@@ -186,7 +346,7 @@ class CustomerService:
         
         result = await customers.update_one(
             {"customerId": customer_id},
-            {"$set": {"isActive": False, "updatedAt": datetime.utcnow()}}
+            {"$set": {"isActive": False, "updatedAt": datetime.now(timezone.utc)}}
         )
         
         if result.matched_count > 0:
@@ -200,6 +360,23 @@ class CustomerService:
         
         return False
     
+    @staticmethod
+    async def test_all_connections(customer_id: str) -> dict:
+        """Test Boomi and LLM connections for a customer concurrently."""
+        customer = await CustomerService.get(customer_id)
+        if not customer:
+            not_found = ConnectionTestResult(
+                success=False,
+                message="Customer not found"
+            )
+            return {"boomi": not_found, "llm": not_found}
+        
+        boomi_result, llm_result = await asyncio.gather(
+            CustomerService._test_boomi_with(customer),
+            CustomerService._test_llm_with(customer)
+        )
+        return {"boomi": boomi_result, "llm": llm_result}
+    
     @staticmethod
     async def test_boomi_connection(customer_id: str) -> ConnectionTestResult:
         """Test Boomi API connection for a customer."""
@@ -210,6 +387,11 @@ class CustomerService:
                 message="Customer not found"
             )
         
+        return await CustomerService._test_boomi_with(customer)
+    
+    @staticmethod
+    async def _test_boomi_with(customer: CustomerResponse) -> ConnectionTestResult:
+        """Test Boomi API connection for an already-loaded customer."""
         boomi = customer.settings.boomi
         if not boomi.accountId or not boomi.username or not boomi.apiToken:
             return ConnectionTestResult(
@@ -217,32 +399,40 @@ class CustomerService:
                 message="Boomi credentials not configured"
             )
         
+        key = (
+            "boomi",
+            customer.customerId,
+            hash((boomi.baseUrl, boomi.accountId, boomi.username, boomi.apiToken))
+        )
+        cached = _cached_test_result(key)
+        if cached is not None:
+            return cached
+        return _store_test_result(key, await CustomerService._probe_boomi(boomi))
+    
+    @staticmethod
+    async def _probe_boomi(boomi: BoomiSettings) -> ConnectionTestResult:
+        """Call the Boomi Account API with the given credentials."""
         try:
-            import base64
-            auth_string = f"BOOMI_TOKEN.{boomi.username}:{boomi.apiToken}"
-            auth_header = base64.b64encode(auth_string.encode()).decode()
+            response = await _get_client().get(
+                f"{boomi.baseUrl}/{boomi.accountId}/Account/{boomi.accountId}",
+                headers={
+                    "Authorization": _auth_header_cached(boomi.username, boomi.apiToken),
+                    "Accept": "application/json"
+                }
+            )
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{boomi.baseUrl}/{boomi.accountId}/Account/{boomi.accountId}",
-                    headers={
-                        "Authorization": f"Basic {auth_header}",
-                        "Accept": "application/json"
-                    }
+            if response.status_code == 200:
+                return ConnectionTestResult(
+                    success=True,
+                    message="Successfully connected to Boomi API",
+                    details={"accountId": boomi.accountId}
+                )
+            else:
+                return ConnectionTestResult(
+                    success=False,
+                    message=f"Boomi API returned status {response.status_code}",
+                    details={"response": response.text[:200]}
                 )
-                
-                if response.status_code == 200:
-                    return ConnectionTestResult(
-                        success=True,
-                        message="Successfully connected to Boomi API",
-                        details={"accountId": boomi.accountId}
-                    )
-                else:
-                    return ConnectionTestResult(
-                        success=False,
-                        message=f"Boomi API returned status {response.status_code}",
-                        details={"response": response.text[:200]}
-                    )
         
         except httpx.TimeoutException:
             return ConnectionTestResult(
@@ -265,6 +455,11 @@ class CustomerService:
                 message="Customer not found"
             )
         
+        return await CustomerService._test_llm_with(customer)
+    
+    @staticmethod
+    async def _test_llm_with(customer: CustomerResponse) -> ConnectionTestResult:
+        """Test LLM API connection for an already-loaded customer."""
         llm = customer.settings.llm
         if not llm.apiKey and llm.provider != "ollama":
             return ConnectionTestResult(
@@ -272,33 +467,69 @@ class CustomerService:
                 message="LLM API key not configured"
             )
         
+        key = (
+            "llm",
+            customer.customerId,
+            hash((llm.provider, llm.apiKey, llm.baseUrl, llm.model))
+        )
+        cached = _cached_test_result(key)
+        if cached is not None:
+            return cached
+        return _store_test_result(key, await CustomerService._probe_llm(llm))
+    
+    @staticmethod
+    async def _probe_llm(llm: LLMSettings) -> ConnectionTestResult:
+        """Call the configured LLM provider with the given settings."""
         try:
             if llm.provider == "openai":
-                import openai
-                client = openai.AsyncOpenAI(api_key=llm.apiKey)
+                if openai is None:
+                    return ConnectionTestResult(
+                        success=False,
+                        message="openai SDK not installed"
+                    )
+                client = _openai_client(llm.apiKey)
                 models = await client.models.list()
                 return ConnectionTestResult(
                     success=True,
                     message="Successfully connected to OpenAI API",
-                    details={"models_count": len(list(models))}
+                    details={"models_count": len(models.data)}
                 )
             
             elif llm.provider == "anthropic":
-                import anthropic
-                client = anthropic.AsyncAnthropic(api_key=llm.apiKey)
-                # Test with a minimal request
-                response = await client.messages.create(
-                    model=llm.model or "claude-3-sonnet-20240229",
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "Hi"}]
-                )
-                return ConnectionTestResult(
-                    success=True,
-                    message="Successfully connected to Anthropic API"
+                # Retrieving the configured model checks the key and the
+                # model name in one request
+                model = llm.model or "claude-3-sonnet-20240229"
+                response = await _get_client().get(
+                    f"{_ANTHROPIC_MODELS_URL}/{quote(model, safe='')}",
+                    headers={
+                        "x-api-key": llm.apiKey,
+                        "anthropic-version": _ANTHROPIC_VERSION
+                    }
                 )
+                if response.status_code == 200:
+                    return ConnectionTestResult(
+                        success=True,
+                        message="Successfully connected to Anthropic API",
+                        details={"model": model}
+                    )
+                elif response.status_code == 404:
+                    return ConnectionTestResult(
+                        success=False,
+                        message=f"Anthropic model '{model}' not found for this API key"
+                    )
+                else:
+                    return ConnectionTestResult(
+                        success=False,
+                        message=f"Anthropic API returned status {response.status_code}",
+                        details={"response": response.text[:200]}
+                    )
             
             elif llm.provider == "gemini":
-                import google.generativeai as genai
+                if genai is None:
+                    return ConnectionTestResult(
+                        success=False,
+                        message="google-generativeai SDK not installed"
+                    )
                 genai.configure(api_key=llm.apiKey)
                 models = genai.list_models()
                 return ConnectionTestResult(
@@ -307,20 +538,19 @@ class CustomerService:
                 )
             
             elif llm.provider == "ollama":
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    base_url = llm.baseUrl or "http://localhost:11434"
-                    response = await client.get(f"{base_url}/api/tags")
-                    if response.status_code == 200:
-                        return ConnectionTestResult(
-                            success=True,
-                            message="Successfully connected to Ollama",
-                            details=response.json()
-                        )
-                    else:
-                        return ConnectionTestResult(
-                            success=False,
-                            message=f"Ollama returned status {response.status_code}"
-                        )
+                base_url = llm.baseUrl or "http://localhost:11434"
+                response = await _get_client().get(f"{base_url}/api/tags")
+                if response.status_code == 200:
+                    return ConnectionTestResult(
+                        success=True,
+                        message="Successfully connected to Ollama",
+                        details=response.json()
+                    )
+                else:
+                    return ConnectionTestResult(
+                        success=False,
+                        message=f"Ollama returned status {response.status_code}"
+                    )
             
             else:
                 return ConnectionTestResult(
@@ -7,6 +7,10 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 import uuid
+from xml.sax.saxutils import escape
+
+# Quotes are escaped too, on top of escape()'s &, < and >
+_QUOTE_ENTITIES = {'"': '&quot;', "'": '&apos;'}
 
 class EDIStandard(Enum):
     X12 = "X12"
@@ -182,7 +186,7 @@ class EDIProfileConverter:
         
         profile_id = str(uuid.uuid4())
         
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
+        header = f'''<?xml version="1.0" encoding="UTF-8"?>
 <bns:EdiProfile xmlns:bns="http://api.platform.boomi.com/"
                 xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
     <bns:profileId>{profile_id}</bns:profileId>
@@ -195,102 +199,92 @@ class EDIProfileConverter:
     <bns:structure>
 '''
         
-        # Add loops and segments
+        # Loops, segments and elements append to one list, joined once here
+        out = [header]
         for loop in loops:
-            xml += self._generate_loop_xml(loop, indent=2)
+            self._generate_loop_xml(loop, 2, out)
         
-        xml += '''    </bns:structure>
-</bns:EdiProfile>'''
+        out.append('''    </bns:structure>
+</bns:EdiProfile>''')
         
-        return xml
+        return ''.join(out)
     
-    def _generate_loop_xml(self, loop: EDILoop, indent: int = 2) -> str:
-        """Generate XML for a loop"""
+    def _generate_loop_xml(self, loop: EDILoop, indent: int, out: List[str]):
+        """Append XML for a loop to out"""
         
         ind = '    ' * indent
         
-        xml = f'''{ind}<bns:loop>
+        out.append(f'''{ind}<bns:loop>
 {ind}    <bns:loopId>{loop.id}</bns:loopId>
 {ind}    <bns:name>{self._escape_xml(loop.name)}</bns:name>
 {ind}    <bns:required>{str(loop.required).lower()}</bns:required>
 {ind}    <bns:maxOccurs>{loop.max_occurs}</bns:maxOccurs>
 {ind}    <bns:segments>
-'''
+''')
         
         # Add segments
         for segment in loop.segments:
-            xml += self._generate_segment_xml(segment, indent + 2)
+            self._generate_segment_xml(segment, indent + 2, out)
         
-        xml += f'''{ind}    </bns:segments>
-'''
+        out.append(f'''{ind}    </bns:segments>
+''')
         
         # Add child loops if any
         if loop.child_loops:
-            xml += f'{ind}    <bns:childLoops>\n'
+            out.append(f'{ind}    <bns:childLoops>\n')
             for child_loop in loop.child_loops:
-                xml += self._generate_loop_xml(child_loop, indent + 2)
-            xml += f'{ind}    </bns:childLoops>\n'
+                self._generate_loop_xml(child_loop, indent + 2, out)
+            out.append(f'{ind}    </bns:childLoops>\n')
         
-        xml += f'{ind}</bns:loop>\n'
-        
-        return xml
+        out.append(f'{ind}</bns:loop>\n')
     
-    def _generate_segment_xml(self, segment: EDISegment, indent: int = 2) -> str:
-        """Generate XML for a segment"""
+    def _generate_segment_xml(self, segment: EDISegment, indent: int, out: List[str]):
+        """Append XML for a segment to out"""
         
         ind = '    ' * indent
         
-        xml = f'''{ind}<bns:segment>
+        out.append(f'''{ind}<bns:segment>
 {ind}    <bns:segmentId>{segment.id}</bns:segmentId>
 {ind}    <bns:name>{self._escape_xml(segment.name)}</bns:name>
 {ind}    <bns:required>{str(segment.required).lower()}</bns:required>
 {ind}    <bns:maxOccurs>{segment.max_occurs}</bns:maxOccurs>
 {ind}    <bns:elements>
-'''
+''')
         
         # Add elements
         for element in segment.elements:
-            xml += self._generate_element_xml(element, indent + 2)
+            self._generate_element_xml(element, indent + 2, out)
         
-        xml += f'''{ind}    </bns:elements>
+        out.append(f'''{ind}    </bns:elements>
 {ind}</bns:segment>
-'''
-        
-        return xml
+''')
     
-    def _generate_element_xml(self, element: Dict, indent: int = 2) -> str:
-        """Generate XML for an element"""
+    def _generate_element_xml(self, element: Dict, indent: int, out: List[str]):
+        """Append XML for an element to out"""
         
         ind = '    ' * indent
         
-        xml = f'''{ind}<bns:element>
+        out.append(f'''{ind}<bns:element>
 {ind}    <bns:elementId>{element['id']}</bns:elementId>
 {ind}    <bns:name>{self._escape_xml(element['name'])}</bns:name>
 {ind}    <bns:dataType>{element['dataType']}</bns:dataType>
 {ind}    <bns:minLength>{element['minLength']}</bns:minLength>
 {ind}    <bns:maxLength>{element['maxLength']}</bns:maxLength>
 {ind}    <bns:required>{str(element['required']).lower()}</bns:required>
-'''
+''')
         
         # Add code list if present
         if element.get('codeList'):
-            xml += f'{ind}    <bns:codeList>\n'
+            out.append(f'{ind}    <bns:codeList>\n')
             for code in element['codeList']:
-                xml += f'{ind}        <bns:code>{self._escape_xml(code)}</bns:code>\n'
-            xml += f'{ind}    </bns:codeList>\n'
-        
-        xml += f'{ind}</bns:element>\n'
+                out.append(f'{ind}        <bns:code>{self._escape_xml(code)}</bns:code>\n')
+            out.append(f'{ind}    </bns:codeList>\n')
         
-        return xml
+        out.append(f'{ind}</bns:element>\n')
     
     def _escape_xml(self, text: str) -> str:
         """Escape XML special characters"""
-        return (str(text)
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&apos;'))
+        return escape(str(text), _QUOTE_ENTITIES)
 
 
 class X12ProfileGenerator:
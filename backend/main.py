@@ -3,6 +3,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.database import connect_to_mongodb, disconnect_from_mongodb, check_database_health
+from app.services.boomi_service import aclose as close_boomi_client
+from app.services.customer_service import aclose as close_customer_client
 from app.routers import (
     customers_router,
     projects_router,
@@ -16,6 +18,8 @@ from app.routers import (
 async def lifespan(app: FastAPI):
     await connect_to_mongodb()
     yield
+    await close_boomi_client()
+    await close_customer_client()
     await disconnect_from_mongodb()
 
 app = FastAPI(